@@ -0,0 +1,74 @@
+'''
+Benchmarks of checking and fixing files with the default configuration.
+'''
+
+import argparse
+
+import generate
+
+from vsg import config
+from vsg import rule_list
+from vsg import vhdlFile
+
+oConfig = None
+oRuleRegistry = None
+
+
+def get_configuration():
+    '''
+    Returns the configuration and rule registry used when vsg is run without a configuration.
+    Both are created once so loading the rules is not part of any benchmark.
+    '''
+    global oConfig
+    global oRuleRegistry
+    if oConfig is None:
+        oArguments = argparse.Namespace()
+        oArguments.style = None
+        oArguments.configuration = None
+        oArguments.junit = None
+        oArguments.filename = []
+        oArguments.local_rules = None
+        oArguments.fix_only = None
+        oArguments.debug = False
+        oConfig = config.New(oArguments)
+        oRuleRegistry = rule_list.rule_registry(oConfig)
+    return oConfig, oRuleRegistry
+
+
+def create_rule_list(sCorpus):
+    oMyConfig, oMyRuleRegistry = get_configuration()
+    oFile = vhdlFile.vhdlFile(generate.create(sCorpus, generate.get_scale()))
+    oFile.set_indent_map(oMyConfig.dIndent)
+    oRules = rule_list.rule_list(oFile, oMyConfig.severity_list, oRuleRegistry=oMyRuleRegistry)
+    oRules.configure(oMyConfig)
+    return oRules
+
+
+class check_rules():
+    '''
+    Analyzes every phase, as with the --all_phases option.
+    '''
+    params = generate.lCorpora
+    param_names = ['corpus']
+    number = 1
+
+    def setup(self, sCorpus):
+        self.oRules = create_rule_list(sCorpus)
+
+    def time_check_rules(self, sCorpus):
+        self.oRules.check_rules(bAllPhases=True)
+
+
+class fix():
+    '''
+    Fixes every phase, as with the --fix option.
+    '''
+    params = generate.lCorpora
+    param_names = ['corpus']
+    number = 1
+
+    def setup(self, sCorpus):
+        self.oRules = create_rule_list(sCorpus)
+
+    def time_fix(self, sCorpus):
+        self.oRules.fix()
@@ -0,0 +1,39 @@
+'''
+Benchmarks of building a vhdlFile and setting the indent of its tokens.
+'''
+
+import generate
+
+from vsg import config
+from vsg import vhdlFile
+
+
+class parse():
+    '''
+    Classifies the tokens of a file and builds its token map.
+    '''
+    params = generate.lCorpora
+    param_names = ['corpus']
+    number = 1
+
+    def setup(self, sCorpus):
+        self.lLines = generate.create(sCorpus, generate.get_scale())
+
+    def time_parse(self, sCorpus):
+        vhdlFile.vhdlFile(self.lLines)
+
+
+class set_token_indent():
+    '''
+    Sets the indent of every token using the default indent configuration.
+    '''
+    params = generate.lCorpora
+    param_names = ['corpus']
+    number = 1
+
+    def setup(self, sCorpus):
+        self.oFile = vhdlFile.vhdlFile(generate.create(sCorpus, generate.get_scale()))
+        self.oFile.set_indent_map(config.read_indent_configuration({}))
+
+    def time_set_token_indent(self, sCorpus):
+        self.oFile.set_token_indent()
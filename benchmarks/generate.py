@@ -0,0 +1,256 @@
+#!/usr/bin/env python
+'''
+Generates synthetic VHDL files of any size for the benchmarks.
+
+Every corpus stresses a different construct and is written without
+indentation and with upper case keywords in places, so fixing it has work
+to do.  The size of each corpus is multiplied by the scale.
+'''
+
+import argparse
+import os
+
+# Sizes at a scale of 1, a scale of 50 creates an entity with 10000 ports
+dSizes = {}
+dSizes['wide_entity'] = 200
+dSizes['long_port_map'] = 200
+dSizes['large_case'] = 200
+dSizes['many_processes'] = 50
+dSizes['deep_hierarchy'] = 20
+
+lCorpora = sorted(dSizes)
+
+
+def get_scale():
+    '''
+    Returns the scale set by the VSG_BENCHMARK_SCALE environment variable, which defaults to 1.
+    '''
+    return int(os.environ.get('VSG_BENCHMARK_SCALE', '1'))
+
+
+def get_size(sCorpus, iScale=1):
+    return dSizes[sCorpus] * iScale
+
+
+def create(sCorpus, iScale=1):
+    '''
+    Returns the lines of a corpus.
+
+    Parameters:
+
+      sCorpus : (string) one of lCorpora
+
+      iScale : (integer)
+
+    Returns: (list of strings)
+    '''
+    fCreate = globals()['create_' + sCorpus]
+    return [sLine + '\n' for sLine in fCreate(get_size(sCorpus, iScale))]
+
+
+def create_header():
+    lReturn = []
+    lReturn.append('-- Generated by benchmarks/generate.py')
+    lReturn.append('')
+    lReturn.append('library ieee;')
+    lReturn.append('use ieee.std_logic_1164.all;')
+    lReturn.append('use ieee.numeric_std.all;')
+    lReturn.append('')
+    return lReturn
+
+
+def create_wide_entity(iPorts):
+    '''
+    An entity with iPorts ports and an architecture which drives the outputs.
+    '''
+    lReturn = create_header()
+    lReturn.append('ENTITY wide_entity IS')
+    lReturn.append('generic (')
+    lReturn.append('g_width : integer := 8')
+    lReturn.append(');')
+    lReturn.append('port (')
+    lReturn.append('clk_i : in std_logic;')
+    for iPort in range(0, iPorts):
+        if iPort % 2 == 0:
+            lReturn.append(f'data_{iPort:06d}_i : in std_logic_vector(g_width - 1 downto 0);')
+        else:
+            lReturn.append(f'data_{iPort:06d}_o : OUT std_logic_vector(g_width - 1 downto 0);')
+    lReturn.append('last_o : out std_logic')
+    lReturn.append(');')
+    lReturn.append('END ENTITY wide_entity;')
+    lReturn.append('')
+    lReturn.append('architecture rtl of wide_entity is')
+    lReturn.append('begin')
+    for iPort in range(1, iPorts, 2):
+        lReturn.append(f'data_{iPort:06d}_o <= data_{iPort - 1:06d}_i;')
+    lReturn.append("last_o <= '0';")
+    lReturn.append('end architecture rtl;')
+    return lReturn
+
+
+def create_long_port_map(iPorts):
+    '''
+    An instantiation with a port map of iPorts associations.
+    '''
+    lReturn = create_header()
+    lReturn.append('entity long_port_map is')
+    lReturn.append('end entity long_port_map;')
+    lReturn.append('')
+    lReturn.append('architecture rtl of long_port_map is')
+    for iPort in range(0, iPorts):
+        lReturn.append(f'SIGNAL s_{iPort:06d} : std_logic;')
+    lReturn.append('begin')
+    lReturn.append('u_child : entity work.child')
+    lReturn.append('generic map (')
+    lReturn.append('g_width => 8')
+    lReturn.append(')')
+    lReturn.append('port map (')
+    for iPort in range(0, iPorts - 1):
+        lReturn.append(f'port_{iPort:06d} => s_{iPort:06d},')
+    lReturn.append(f'port_{iPorts - 1:06d} => s_{iPorts - 1:06d}')
+    lReturn.append(');')
+    lReturn.append('end architecture rtl;')
+    return lReturn
+
+
+def create_large_case(iChoices):
+    '''
+    A process holding a case statement with iChoices alternatives.
+    '''
+    lReturn = create_header()
+    lReturn.append('entity large_case is')
+    lReturn.append('port (')
+    lReturn.append('clk_i : in std_logic;')
+    lReturn.append('sel_i : in integer;')
+    lReturn.append('data_o : out std_logic_vector(31 downto 0)')
+    lReturn.append(');')
+    lReturn.append('end entity large_case;')
+    lReturn.append('')
+    lReturn.append('architecture rtl of large_case is')
+    lReturn.append('begin')
+    lReturn.append('proc_decode : process (clk_i) is')
+    lReturn.append('begin')
+    lReturn.append('if rising_edge(clk_i) then')
+    lReturn.append('CASE sel_i IS')
+    for iChoice in range(0, iChoices):
+        lReturn.append(f'when {iChoice} =>')
+        lReturn.append(f'data_o <= std_logic_vector(to_unsigned({iChoice}, 32));')
+    lReturn.append('when others =>')
+    lReturn.append("data_o <= (others => '0');")
+    lReturn.append('END CASE;')
+    lReturn.append('end if;')
+    lReturn.append('end process proc_decode;')
+    lReturn.append('end architecture rtl;')
+    return lReturn
+
+
+def create_many_processes(iProcesses):
+    '''
+    An architecture with iProcesses clocked processes.
+    '''
+    lReturn = create_header()
+    lReturn.append('entity many_processes is')
+    lReturn.append('port (')
+    lReturn.append('clk_i : in std_logic;')
+    lReturn.append('rst_i : in std_logic')
+    lReturn.append(');')
+    lReturn.append('end entity many_processes;')
+    lReturn.append('')
+    lReturn.append('architecture rtl of many_processes is')
+    for iProcess in range(0, iProcesses):
+        lReturn.append(f'signal count_{iProcess:06d} : unsigned(7 downto 0);')
+    lReturn.append('begin')
+    for iProcess in range(0, iProcesses):
+        lReturn.append('')
+        lReturn.append(f'proc_{iProcess:06d} : PROCESS (clk_i, rst_i) is')
+        lReturn.append('variable v_next : unsigned(7 downto 0);')
+        lReturn.append('begin')
+        lReturn.append("if rst_i = '1' then")
+        lReturn.append(f"count_{iProcess:06d} <= (others => '0');")
+        lReturn.append('elsif rising_edge(clk_i) then')
+        lReturn.append(f'v_next := count_{iProcess:06d} + 1;')
+        lReturn.append(f'if v_next > {iProcess % 256} then')
+        lReturn.append(f'count_{iProcess:06d} <= (others => \'0\');')
+        lReturn.append('else')
+        lReturn.append(f'count_{iProcess:06d} <= v_next;')
+        lReturn.append('end if;')
+        lReturn.append('end if;')
+        lReturn.append(f'end process proc_{iProcess:06d};')
+    lReturn.append('end architecture rtl;')
+    return lReturn
+
+
+def create_deep_hierarchy(iDepth):
+    '''
+    Generate statements and blocks nested iDepth levels deep, with a process of nested if statements at the bottom.
+    '''
+    lReturn = create_header()
+    lReturn.append('entity deep_hierarchy is')
+    lReturn.append('generic (')
+    lReturn.append('g_depth : integer := 1')
+    lReturn.append(');')
+    lReturn.append('port (')
+    lReturn.append('clk_i : in std_logic;')
+    lReturn.append('data_i : in std_logic_vector(7 downto 0);')
+    lReturn.append('data_o : out std_logic_vector(7 downto 0)')
+    lReturn.append(');')
+    lReturn.append('end entity deep_hierarchy;')
+    lReturn.append('')
+    lReturn.append('architecture rtl of deep_hierarchy is')
+    lReturn.append('begin')
+    for iLevel in range(0, iDepth):
+        if iLevel % 2 == 0:
+            lReturn.append(f'gen_{iLevel:06d} : IF g_depth > {iLevel} GENERATE')
+            lReturn.append(f'signal s_{iLevel:06d} : std_logic_vector(7 downto 0);')
+            lReturn.append('begin')
+            lReturn.append(f's_{iLevel:06d} <= data_i;')
+        else:
+            lReturn.append(f'blk_{iLevel:06d} : block is')
+            lReturn.append('begin')
+    lReturn.append('proc_deep : process (clk_i) is')
+    lReturn.append('begin')
+    lReturn.append('if rising_edge(clk_i) then')
+    for iLevel in range(0, iDepth):
+        lReturn.append(f"if data_i({iLevel % 8}) = '1' then")
+        lReturn.append(f'data_o <= std_logic_vector(to_unsigned({iLevel % 256}, 8));')
+    for iLevel in range(0, iDepth):
+        lReturn.append('end if;')
+    lReturn.append('end if;')
+    lReturn.append('end process proc_deep;')
+    for iLevel in range(iDepth - 1, -1, -1):
+        if iLevel % 2 == 0:
+            lReturn.append(f'end generate gen_{iLevel:06d};')
+        else:
+            lReturn.append(f'end block blk_{iLevel:06d};')
+    lReturn.append('end architecture rtl;')
+    return lReturn
+
+
+def write(sDirectory, iScale=1):
+    '''
+    Writes every corpus to sDirectory as <corpus>.vhd.
+
+    Returns: (list of strings) file names written
+    '''
+    if not os.path.isdir(sDirectory):
+        os.makedirs(sDirectory)
+    lReturn = []
+    for sCorpus in lCorpora:
+        sFileName = os.path.join(sDirectory, sCorpus + '.vhd')
+        with open(sFileName, 'w') as oFile:
+            oFile.writelines(create(sCorpus, iScale))
+        lReturn.append(sFileName)
+    return lReturn
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Writes the synthetic VHDL files used by the benchmarks.')
+    parser.add_argument('directory', help='Directory to write the files to')
+    parser.add_argument('-s', '--scale', type=int, default=1, help='Multiplies the size of every file')
+    args = parser.parse_args()
+    for sFileName in write(args.directory, args.scale):
+        print(sFileName)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,243 @@
+#!/usr/bin/env python
+'''
+Measures how the time of every rule grows with the size of its input.
+
+The test input of each rule, vsg/tests/<name>/rule_<identifier>_test_input.vhd,
+is repeated to form a small and a large file.  The analyze and fix methods of
+the rule are timed in isolation on both, and the scaling exponent
+
+    log(time of large file / time of small file) / log(factor)
+
+is reported.  An exponent of 1 is linear, rules with an exponent above the
+limit are flagged as super-linear.
+'''
+
+import argparse
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+sBenchmarkPath = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, os.path.join(sBenchmarkPath, '..'))
+sys.path.insert(0, sBenchmarkPath)
+
+import run
+
+from vsg import config
+from vsg import rule_index
+from vsg import version
+from vsg import vhdlFile
+
+sTestPath = os.path.join(sBenchmarkPath, '..', 'vsg', 'tests')
+
+# Times below this are too short to compute a meaningful exponent
+fMinimumTime = 0.001
+
+
+def get_test_input(oRule):
+    '''
+    Returns the lines of the test input of a rule, or None if the rule does not have one.
+    '''
+    sFileName = os.path.join(sTestPath, oRule.name, 'rule_' + oRule.identifier + '_test_input.vhd')
+    if not os.path.isfile(sFileName):
+        return None
+    lLines, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+    if not lLines[-1].endswith('\n'):
+        lLines[-1] += '\n'
+    return lLines
+
+
+class corpus():
+    '''
+    Creates vhdlFile objects of the test input repeated a number of times.
+    Files are stored in a parse cache, so only the first file of each size is classified.
+
+    Parameters:
+
+      lLines : (list of strings)
+
+      sCacheDirectory : (string)
+    '''
+    def __init__(self, lLines, sCacheDirectory):
+        self.lLines = lLines
+        self.sCacheDirectory = sCacheDirectory
+        self.dIndent = config.read_indent_configuration({})
+
+    def create(self, iCopies):
+        oFile = vhdlFile.vhdlFile(self.lLines * iCopies, sCacheDirectory=self.sCacheDirectory)
+        oFile.set_indent_map(self.dIndent)
+        return oFile
+
+
+def time_analyze(oRule, oCorpus, iCopies, iRepeat):
+    '''
+    A new file is created for every measurement, so extractions are not served from the query cache of an earlier one.
+    '''
+    lTimes = []
+    for iIteration in range(0, iRepeat):
+        oFile = oCorpus.create(iCopies)
+        oRule.clear_violations()
+        fStart = time.perf_counter()
+        oRule.analyze(oFile)
+        lTimes.append(time.perf_counter() - fStart)
+    oRule.clear_violations()
+    return min(lTimes)
+
+
+def time_fix(oRule, oCorpus, iCopies, iRepeat):
+    lTimes = []
+    for iIteration in range(0, iRepeat):
+        oFile = oCorpus.create(iCopies)
+        oRule.clear_violations()
+        fStart = time.perf_counter()
+        oRule.fix(oFile)
+        lTimes.append(time.perf_counter() - fStart)
+    oRule.clear_violations()
+    return min(lTimes)
+
+
+def get_exponent(fSmall, fLarge, iFactor):
+    '''
+    Returns the scaling exponent, or None if the large file was too fast to measure.
+    '''
+    if fLarge < fMinimumTime or fSmall <= 0:
+        return None
+    return math.log(fLarge / fSmall) / math.log(iFactor)
+
+
+def measure_rule(oRule, oCorpus, iCopies, iFactor, iRepeat, bFix):
+    '''
+    Times a rule on the small and large file.
+
+    Returns: (dictionary)
+    '''
+    dReturn = {}
+    dReturn['rule'] = oRule.unique_id
+    oSmall = oCorpus.create(iCopies)
+    oLarge = oCorpus.create(iCopies * iFactor)
+    dReturn['tokens'] = [len(oSmall.lAllObjects), len(oLarge.lAllObjects)]
+    dReturn['analyze'] = [time_analyze(oRule, oCorpus, iCopies, iRepeat), time_analyze(oRule, oCorpus, iCopies * iFactor, iRepeat)]
+    dReturn['analyze_exponent'] = get_exponent(dReturn['analyze'][0], dReturn['analyze'][1], iFactor)
+    if bFix and oRule.fixable:
+        dReturn['fix'] = [time_fix(oRule, oCorpus, iCopies, iRepeat), time_fix(oRule, oCorpus, iCopies * iFactor, iRepeat)]
+        dReturn['fix_exponent'] = get_exponent(dReturn['fix'][0], dReturn['fix'][1], iFactor)
+    else:
+        dReturn['fix'] = None
+        dReturn['fix_exponent'] = None
+    return dReturn
+
+
+def get_maximum_exponent(dRule):
+    lExponents = [fExponent for fExponent in [dRule['analyze_exponent'], dRule['fix_exponent']] if fExponent is not None]
+    if lExponents:
+        return max(lExponents)
+    return None
+
+
+def measure(lRuleNames, iCopies, iFactor, iRepeat, bFix):
+    '''
+    Measures every rule in lRuleNames which has a test input.
+
+    Returns: (dictionary)
+    '''
+    dReturn = {}
+    dReturn['commit'] = run.get_commit()
+    dReturn['version'] = version.sVersion
+    dReturn['copies'] = iCopies
+    dReturn['factor'] = iFactor
+    dReturn['repeat'] = iRepeat
+    dReturn['rules'] = []
+    dReturn['skipped'] = []
+    sCacheDirectory = tempfile.mkdtemp()
+    try:
+        for oRule in rule_index.load_rules(lRuleNames):
+            lLines = get_test_input(oRule)
+            if lLines is None:
+                dReturn['skipped'].append(oRule.unique_id)
+                continue
+            dRule = measure_rule(oRule, corpus(lLines, sCacheDirectory), iCopies, iFactor, iRepeat, bFix)
+            dReturn['rules'].append(dRule)
+            print(format_rule(dRule))
+            sys.stdout.flush()
+    finally:
+        shutil.rmtree(sCacheDirectory)
+    return dReturn
+
+
+def format_time(fTime):
+    if fTime is None:
+        return '-'
+    return f'{fTime:.4f}'
+
+
+def format_exponent(fExponent):
+    if fExponent is None:
+        return '-'
+    return f'{fExponent:.2f}'
+
+
+def format_row(sRule, sTokens, sAnalyzeSmall, sAnalyzeLarge, sAnalyzeExponent, sFixSmall, sFixLarge, sFixExponent):
+    return f'{sRule:<35}{sTokens:>9}{sAnalyzeSmall:>10}{sAnalyzeLarge:>10}{sAnalyzeExponent:>7}{sFixSmall:>10}{sFixLarge:>10}{sFixExponent:>7}'
+
+
+def format_rule(dRule):
+    lFix = dRule['fix'] or [None, None]
+    return format_row(dRule['rule'], dRule['tokens'][1],
+                      format_time(dRule['analyze'][0]), format_time(dRule['analyze'][1]), format_exponent(dRule['analyze_exponent']),
+                      format_time(lFix[0]), format_time(lFix[1]), format_exponent(dRule['fix_exponent']))
+
+
+def get_super_linear_rules(dResults, fLimit):
+    '''
+    Returns the rules with a scaling exponent above fLimit, largest exponent first.
+    '''
+    lReturn = []
+    for dRule in dResults['rules']:
+        fExponent = get_maximum_exponent(dRule)
+        if fExponent is not None and fExponent > fLimit:
+            lReturn.append(dRule)
+    return sorted(lReturn, key=get_maximum_exponent, reverse=True)
+
+
+def parse_command_line_arguments():
+    parser = argparse.ArgumentParser(description='Measures how the time of every rule grows with the size of its input.')
+    parser.add_argument('-r', '--rule', nargs='+', default=None, help='Only measure these rules')
+    parser.add_argument('-n', '--copies', type=int, default=10, help='Number of copies of the test input in the small file')
+    parser.add_argument('-f', '--factor', type=int, default=10, help='The large file is this many times larger than the small file')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of measurements of each rule, the minimum is used')
+    parser.add_argument('--no_fix', default=False, action='store_true', help='Only measure analyze')
+    parser.add_argument('-l', '--limit', type=float, default=1.3, help='Exponents above this limit are reported as super-linear')
+    parser.add_argument('-o', '--output', default=None, help='Write the measurements to this JSON file')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_command_line_arguments()
+
+    print(format_row('Rule', 'Tokens', 'Analyze', f'x{args.factor}', 'Exp', 'Fix', f'x{args.factor}', 'Exp'))
+    dResults = measure(args.rule, args.copies, args.factor, args.repeat, not args.no_fix)
+
+    if args.output:
+        with open(args.output, 'w') as oFile:
+            oFile.write(json.dumps(dResults, indent=2))
+
+    if dResults['skipped']:
+        print(str(len(dResults['skipped'])) + ' rule(s) without a test input were skipped')
+
+    lRules = get_super_linear_rules(dResults, args.limit)
+    if lRules:
+        print('')
+        print('Rules scaling worse than an exponent of ' + str(args.limit) + ':')
+        for dRule in lRules:
+            print(format_rule(dRule))
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python
+'''
+Runs the benchmarks, stores the results as JSON and compares them with earlier results.
+
+The benchmarks follow the conventions of airspeed velocity (asv):
+classes in bench_*.py modules with time_* methods, a setup method and params.
+This runner only needs the standard library.
+'''
+
+import argparse
+import datetime
+import glob
+import importlib
+import inspect
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sBenchmarkPath = os.path.dirname(os.path.abspath(__file__))
+
+sys.path.insert(0, os.path.join(sBenchmarkPath, '..'))
+sys.path.insert(0, sBenchmarkPath)
+
+import generate
+
+from vsg import version
+
+
+def get_benchmarks(sFilter=None):
+    '''
+    Returns every benchmark as a (sName, oClass, sMethod, param) tuple.
+    Names have the form module.class.method(param).
+    '''
+    lReturn = []
+    for sFileName in sorted(glob.glob(os.path.join(sBenchmarkPath, 'bench_*.py'))):
+        sModule = os.path.splitext(os.path.basename(sFileName))[0]
+        oModule = importlib.import_module(sModule)
+        for sClass, oClass in inspect.getmembers(oModule, inspect.isclass):
+            if oClass.__module__ != sModule:
+                continue
+            for sMethod in sorted(dir(oClass)):
+                if not sMethod.startswith('time_'):
+                    continue
+                for param in getattr(oClass, 'params', [None]):
+                    sName = sModule + '.' + sClass + '.' + sMethod
+                    if param is not None:
+                        sName += '(' + str(param) + ')'
+                    if sFilter is None or sFilter in sName:
+                        lReturn.append((sName, oClass, sMethod, param))
+    return lReturn
+
+
+def run_benchmark(oClass, sMethod, param, iRepeat):
+    '''
+    Times a benchmark iRepeat times.
+    A new instance is set up before every measurement, so benchmarks which modify their input are measured on fresh input.
+
+    Returns: (list of floats) seconds
+    '''
+    lArguments = []
+    if param is not None:
+        lArguments.append(param)
+    lReturn = []
+    for iIteration in range(0, iRepeat):
+        oBenchmark = oClass()
+        if hasattr(oBenchmark, 'setup'):
+            oBenchmark.setup(*lArguments)
+        fMethod = getattr(oBenchmark, sMethod)
+        fStart = time.perf_counter()
+        fMethod(*lArguments)
+        lReturn.append(time.perf_counter() - fStart)
+        if hasattr(oBenchmark, 'teardown'):
+            oBenchmark.teardown(*lArguments)
+    return lReturn
+
+
+def get_commit():
+    try:
+        sCommit = subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=sBenchmarkPath, stderr=subprocess.DEVNULL)
+        sStatus = subprocess.check_output(['git', 'status', '--porcelain', '--untracked-files=no'], cwd=sBenchmarkPath, stderr=subprocess.DEVNULL)
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    sReturn = sCommit.decode('utf-8').strip()
+    if sStatus.strip():
+        sReturn += '-dirty'
+    return sReturn
+
+
+def run(iScale, iRepeat, sFilter=None):
+    '''
+    Runs the benchmarks and returns the results.
+
+    Returns: (dictionary)
+    '''
+    os.environ['VSG_BENCHMARK_SCALE'] = str(iScale)
+    dReturn = {}
+    dReturn['commit'] = get_commit()
+    dReturn['version'] = version.sVersion
+    dReturn['date'] = datetime.datetime.now().isoformat(timespec='seconds')
+    dReturn['python'] = platform.python_version()
+    dReturn['machine'] = platform.machine()
+    dReturn['scale'] = iScale
+    dReturn['repeat'] = iRepeat
+    dReturn['benchmarks'] = {}
+    print(f'{"Benchmark":<72}{"Min (s)":>12}{"Median (s)":>12}')
+    for sName, oClass, sMethod, param in get_benchmarks(sFilter):
+        lTimes = run_benchmark(oClass, sMethod, param, iRepeat)
+        dBenchmark = {}
+        dBenchmark['min'] = min(lTimes)
+        dBenchmark['median'] = statistics.median(lTimes)
+        dBenchmark['times'] = lTimes
+        dReturn['benchmarks'][sName] = dBenchmark
+        print(f'{sName:<72}{dBenchmark["min"]:>12.4f}{dBenchmark["median"]:>12.4f}')
+        sys.stdout.flush()
+    return dReturn
+
+
+def compare(dBaseline, dResults, fThreshold):
+    '''
+    Compares the minimum times of two sets of results.
+
+    Returns: (list of strings) names of benchmarks which are slower than the baseline by more than fThreshold
+    '''
+    if dBaseline.get('scale') != dResults.get('scale'):
+        print('WARNING: results were measured at scale ' + str(dBaseline.get('scale')) + ' and ' + str(dResults.get('scale')))
+    print(f'{"Benchmark":<72}{"Baseline":>12}{"Current":>12}{"Ratio":>8}')
+    lReturn = []
+    for sName in sorted(set(dBaseline['benchmarks']) | set(dResults['benchmarks'])):
+        if sName not in dBaseline['benchmarks'] or sName not in dResults['benchmarks']:
+            print(f'{sName:<72}  only in one set of results')
+            continue
+        fBaseline = dBaseline['benchmarks'][sName]['min']
+        fCurrent = dResults['benchmarks'][sName]['min']
+        fRatio = fCurrent / fBaseline if fBaseline > 0 else 1.0
+        sFlag = ''
+        if fRatio > 1 + fThreshold:
+            sFlag = '  slower'
+            lReturn.append(sName)
+        elif fRatio < 1 - fThreshold:
+            sFlag = '  faster'
+        print(f'{sName:<72}{fBaseline:>12.4f}{fCurrent:>12.4f}{fRatio:>8.2f}{sFlag}')
+    return lReturn
+
+
+def read_results(sFileName):
+    with open(sFileName) as oFile:
+        return json.load(oFile)
+
+
+def parse_command_line_arguments():
+    parser = argparse.ArgumentParser(description='Runs the VSG benchmarks.')
+    parser.add_argument('-s', '--scale', type=int, default=1, help='Multiplies the size of every generated file')
+    parser.add_argument('-r', '--repeat', type=int, default=3, help='Number of times every benchmark is measured')
+    parser.add_argument('-b', '--bench', default=None, help='Only run benchmarks whose name contains this string')
+    parser.add_argument('-o', '--output', default=None, help='Write the results to this JSON file')
+    parser.add_argument('-c', '--compare', default=None, metavar='BASELINE', help='Compare the results with a JSON file of earlier results')
+    parser.add_argument('-i', '--input', default=None, help='Read the results from this JSON file instead of running the benchmarks')
+    parser.add_argument('-t', '--threshold', type=float, default=0.1,
+                        help='Fraction a benchmark may be slower than the baseline before it is reported as a regression')
+    parser.add_argument('-l', '--list', default=False, action='store_true', help='List the benchmarks')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_command_line_arguments()
+
+    if args.list:
+        for tBenchmark in get_benchmarks(args.bench):
+            print(tBenchmark[0])
+        return 0
+
+    if args.input:
+        dResults = read_results(args.input)
+    else:
+        dResults = run(args.scale, args.repeat, args.bench)
+
+    if args.output:
+        with open(args.output, 'w') as oFile:
+            oFile.write(json.dumps(dResults, indent=2))
+
+    if args.compare:
+        lRegressions = compare(read_results(args.compare), dResults, args.threshold)
+        if lRegressions:
+            print('ERROR: ' + str(len(lRegressions)) + ' benchmark(s) slower than the baseline')
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
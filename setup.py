@@ -58,7 +58,8 @@ setup(
   python_requires='>=3.5',
   entry_points={
     'console_scripts': [
-      'vsg = vsg.__main__:main'
+      'vsg = vsg.__main__:main',
+      'vsg-lsp = vsg.lsp:main'
     ]
   }
 )
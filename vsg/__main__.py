@@ -15,6 +15,7 @@ from . import utils
 
 from . import junit
 from . import rule_list
+from . import server
 from . import severity
 from . import version
 from . import vhdlFile
@@ -73,7 +74,9 @@ def display_rule_configuration(commandLineArguments, oConfig):
         fExitStatus = 0
         # Create empty file so it can be used to create the rule list
         oVhdlFile = vhdlFile.vhdlFile([''])
-        oRules = rule_list.rule_list(oVhdlFile, oConfig.severity_list, commandLineArguments.local_rules)
+        # Only the requested rule is loaded, local rules are always loaded
+        lRuleNames = [commandLineArguments.rule_configuration]
+        oRules = rule_list.rule_list(oVhdlFile, oConfig.severity_list, commandLineArguments.local_rules, lRuleNames=lRuleNames)
         oRules.configure(oConfig)
         dOutputConfiguration = {}
         if commandLineArguments.local_rules:
@@ -105,6 +108,10 @@ def main():
 
     version.print_version(commandLineArguments)
 
+    if commandLineArguments.server:
+        server.run(commandLineArguments)
+        sys.exit(0)
+
     oConfig = config.New(commandLineArguments)
 
     # Add local rule path to system path so the rules can be loaded
@@ -138,14 +145,26 @@ def main():
                 break
 
     else:
-        with multiprocessing.Pool(commandLineArguments.jobs) as pool:
-            for tResult in pool.imap(f, enumerate(commandLineArguments.filename)):
-                fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr, bKeepProcessingFiles = tResult
-                lReturn.append((fStatus, testCase, dJsonEntry))
-                if sOutputStd:
-                    print(sOutputStd)
-                if sOutputErr:
-                    print(sOutputErr, file=sys.stderr)
+        # Largest files are scheduled first, results are reported in command line order
+        lChunks = apply_rules.schedule_files(commandLineArguments.filename, commandLineArguments.jobs)
+        dResults = {}
+        iNextIndex = 0
+        bKeepProcessingFiles = False
+        with multiprocessing.Pool(commandLineArguments.jobs, apply_rules.initialize_worker, (commandLineArguments, oConfig)) as pool:
+            for lResults, oChunkProfile in pool.imap_unordered(apply_rules.apply_rules_in_worker, lChunks):
+                dResults.update(lResults)
+                if oChunkProfile is not None:
+                    apply_rules.get_rule_profile().merge(oChunkProfile)
+                while iNextIndex in dResults:
+                    fStatus, testCase, dJsonEntry, sOutputStd, sOutputErr, bKeepProcessingFiles = dResults.pop(iNextIndex)
+                    iNextIndex += 1
+                    lReturn.append((fStatus, testCase, dJsonEntry))
+                    if sOutputStd:
+                        print(sOutputStd)
+                    if sOutputErr:
+                        print(sOutputErr, file=sys.stderr)
+                    if bKeepProcessingFiles:
+                        break
                 if bKeepProcessingFiles:
                     break
 
@@ -170,6 +189,12 @@ def main():
     if commandLineArguments.quality_report:
         quality_report.write(commandLineArguments, dJson)
 
+    if commandLineArguments.profile_rules is not None:
+        oRuleProfile = apply_rules.get_rule_profile()
+        if commandLineArguments.profile_rules:
+            oRuleProfile.write_json(commandLineArguments.profile_rules)
+        print('\n'.join(oRuleProfile.get_table()))
+
     sys.exit(fExitStatus)
 
 
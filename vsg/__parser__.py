@@ -18,6 +18,8 @@ def parse_command_line_arguments():
 
     parser.add_argument('-f', '--filename', help='File to print parser output')
     parser.add_argument('-w', '--whitespace', default=False, action='store_true', help='Include whitespace objects')
+    parser.add_argument('-p', '--profile', default=None, action='store', nargs='?', const='time', choices=['time', 'memory'],
+                        help='Display the time and number of tokens of each parse stage, with memory also the peak memory')
 
     if len(sys.argv) == 1:
         parser.print_help()
@@ -37,11 +39,17 @@ def main():
 
     lLines = vhdlFile.utils.read_vhdlfile(sFileName)
 
-    oVhdlFile = vhdlFile.vhdlFile(lLines[0])
-    oVhdlFile.filename = sFileName
+    oVhdlFile = vhdlFile.vhdlFile(
+        lLines[0], sFileName,
+        bProfile=commandLineArguments.profile is not None,
+        bProfileMemory=commandLineArguments.profile == 'memory'
+    )
 
     utils.print_objects(oVhdlFile, not commandLineArguments.whitespace)
 
+    if oVhdlFile.oParseProfile is not None:
+        print('\n'.join(oVhdlFile.oParseProfile.get_table()))
+
     sys.exit(fExitStatus)
 
 
@@ -1,9 +1,13 @@
 
+import os
 import shutil
+import sys
 
 from . import config
 from . import junit
+from . import result_cache
 from . import rule_list
+from . import rule_profile
 from . import utils
 from . import vhdlFile
 
@@ -11,6 +15,108 @@ from .exceptions import ClassifyError
 from .exceptions import ConfigurationError
 
 
+oRuleRegistry = None
+
+
+def get_rule_registry(oConfig, sLocalRulesDirectory):
+    '''
+    Returns the rule registry of this process.
+    A new registry is created if the configuration or local rules directory changed.
+    '''
+    global oRuleRegistry
+    if oRuleRegistry is None or not oRuleRegistry.is_for(oConfig, sLocalRulesDirectory):
+        oRuleRegistry = rule_list.rule_registry(oConfig, sLocalRulesDirectory)
+    return oRuleRegistry
+
+
+oWorkerArguments = None
+oWorkerConfig = None
+
+
+def initialize_worker(commandLineArguments, oConfig):
+    '''
+    Pool initializer which receives the command line arguments and configuration once per worker.
+    The configuration carries the severity list and is used to build the rule registry of the worker.
+    '''
+    global oWorkerArguments
+    global oWorkerConfig
+    oWorkerArguments = commandLineArguments
+    oWorkerConfig = oConfig
+    if commandLineArguments.local_rules:
+        sLocalRulesPath = os.path.abspath(commandLineArguments.local_rules)
+        if sLocalRulesPath not in sys.path:
+            sys.path.append(sLocalRulesPath)
+    try:
+        get_rule_registry(oConfig, commandLineArguments.local_rules)
+    except OSError:
+        # The error is reported by apply_rules for the first file
+        pass
+
+
+oRuleProfile = None
+
+
+def get_rule_profile():
+    '''
+    Returns the rule profile of this process, creating it on first use.
+    '''
+    global oRuleProfile
+    if oRuleProfile is None:
+        oRuleProfile = rule_profile.rule_profile()
+    return oRuleProfile
+
+
+def apply_rules_in_worker(lIndexFileNames):
+    '''
+    Applies rules to a chunk of files using the arguments and configuration stored by initialize_worker.
+    Tasks only carry the index and name of each file.
+
+    Returns a list of (iIndex, tResult) tuples and the rule profile of the chunk, which is None unless rules are profiled.
+    '''
+    global oRuleProfile
+    oRuleProfile = None
+    lReturn = []
+    for tIndexFileName in lIndexFileNames:
+        lReturn.append((tIndexFileName[0], apply_rules(oWorkerArguments, oWorkerConfig, tIndexFileName)))
+    return lReturn, oRuleProfile
+
+
+def get_chunk_size(iNumberFiles, iJobs):
+    '''
+    Returns the number of files sent to a worker in each task.
+    Each worker receives about four chunks so the load stays balanced.
+    '''
+    iChunkSize, iRemainder = divmod(iNumberFiles, iJobs * 4)
+    if iRemainder:
+        iChunkSize += 1
+    return max(1, iChunkSize)
+
+
+def get_file_size(sFileName):
+    try:
+        return os.path.getsize(sFileName)
+    except OSError:
+        return 0
+
+
+def schedule_files(lFileNames, iJobs):
+    '''
+    Splits the files into chunks for the pool, largest files first.
+    Files are dealt out to the chunks in order of decreasing size, so every
+    chunk holds a mix of large and small files and the first chunks hold the largest.
+
+    Returns a list of chunks, each a list of (iIndex, sFileName) tuples.
+    '''
+    lIndexFileNames = list(enumerate(lFileNames))
+    lIndexFileNames.sort(key=lambda x: get_file_size(x[1]), reverse=True)
+    iChunkSize = get_chunk_size(len(lIndexFileNames), iJobs)
+    iNumberChunks = -(-len(lIndexFileNames) // iChunkSize)
+    lChunks = []
+    for iChunk in range(0, iNumberChunks):
+        lChunks.append(lIndexFileNames[iChunk::iNumberChunks])
+    return lChunks
+
+
 def create_backup_file(sFileName):
     '''Copies existing file and adds .bak to the end.'''
     shutil.copy2(sFileName, sFileName + '.bak')
@@ -55,6 +161,34 @@ bKeepProcessingFiles = False
 # This function is in a separate module from __main__ as a workaround for https://bugs.python.org/issue25053
 # see also https://stackoverflow.com/questions/41385708/multiprocessing-example-giving-attributeerror/42383397#42383397
 def apply_rules(commandLineArguments, oConfig, tIndexFileName):
+    '''
+    Applies rules to a single file.
+    If a cache directory is given the results are served from, or stored to, the result cache.
+    The cache is not used when fixing files or profiling.
+    '''
+    sCacheDirectory = commandLineArguments.cache_directory
+    if not sCacheDirectory or commandLineArguments.fix or is_profiling(commandLineArguments):
+        return apply_rules_to_file(commandLineArguments, oConfig, tIndexFileName)
+
+    sKey = result_cache.get_key(commandLineArguments, oConfig, tIndexFileName[1])
+    if sKey is None:
+        return apply_rules_to_file(commandLineArguments, oConfig, tIndexFileName)
+
+    tResults = result_cache.read(sCacheDirectory, sKey)
+    if tResults is not None:
+        return tResults
+
+    tResults = apply_rules_to_file(commandLineArguments, oConfig, tIndexFileName)
+    if tResults[5] == bKeepProcessingFiles:
+        result_cache.write(sCacheDirectory, sKey, tResults)
+    return tResults
+
+
+def is_profiling(commandLineArguments):
+    return commandLineArguments.profile_rules is not None or commandLineArguments.profile_parse is not None
+
+
+def apply_rules_to_file(commandLineArguments, oConfig, tIndexFileName):
     configuration = oConfig.dConfig
 
     dIndent = oConfig.dIndent
@@ -64,7 +198,11 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
     dJsonEntry = {}
     lFileContent, eError = vhdlFile.utils.read_vhdlfile(sFileName)
     try:
-        oVhdlFile = vhdlFile.vhdlFile(lFileContent, sFileName, eError)
+        oVhdlFile = vhdlFile.vhdlFile(
+            lFileContent, sFileName, eError, commandLineArguments.cache_directory,
+            bProfile=commandLineArguments.profile_parse is not None,
+            bProfileMemory=commandLineArguments.profile_parse == 'memory'
+        )
     except ClassifyError as e:
         fExitStatus = True
         testCase = create_junit_testcase(sFileName, e)
@@ -75,9 +213,14 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
         return fExitStatus, testCase, dJsonEntry, sOutputStd, sOutputErr, bKeepProcessingFiles
 
     oVhdlFile.set_indent_map(dIndent)
+    if commandLineArguments.profile_rules is None:
+        oProfile = None
+    else:
+        oProfile = get_rule_profile()
     try:
         oRules = rule_list.rule_list(
-            oVhdlFile, oConfig.severity_list, commandLineArguments.local_rules
+            oVhdlFile, oConfig.severity_list, commandLineArguments.local_rules,
+            oRuleRegistry=get_rule_registry(oConfig, commandLineArguments.local_rules)
         )
     except OSError as e:
         sOutputStd = (
@@ -103,7 +246,7 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
         if commandLineArguments.backup:
             create_backup_file(sFileName)
         oRules.fix(
-            commandLineArguments.fix_phase, commandLineArguments.skip_phase, fix_only
+            commandLineArguments.fix_phase, commandLineArguments.skip_phase, fix_only, oProfile
         )
         write_vhdl_file(oVhdlFile)
 
@@ -111,10 +254,16 @@ def apply_rules(commandLineArguments, oConfig, tIndexFileName):
     oRules.check_rules(
         bAllPhases=commandLineArguments.all_phases,
         lSkipPhase=commandLineArguments.skip_phase,
+        oRuleProfile=oProfile,
     )
     sOutputStd, sOutputErr = oRules.report_violations(
         commandLineArguments.output_format
     )
+    if oVhdlFile.oParseProfile is not None:
+        lOutput = oVhdlFile.oParseProfile.get_table()
+        if sOutputStd:
+            lOutput.insert(0, sOutputStd)
+        sOutputStd = '\n'.join(lOutput)
     fExitStatus = oRules.violations
 
     if commandLineArguments.junit:
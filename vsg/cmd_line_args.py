@@ -42,6 +42,29 @@ def __is_valid_file(value: str) -> str:
 def parse_command_line_arguments():
     """Parses the command line arguments and returns them."""
 
+    parser = create_argument_parser()
+
+    args_ = parser.parse_args()
+
+    validate_backup_argument(args_)
+    validate_ap_argument(args_)
+    fix_filename_argument(args_)
+    fix_configuration_argument(args_)
+
+    if sys.platform == "win32":
+        # Work around https://bugs.python.org/issue26903
+        args_.jobs = min(args_.jobs, 60)
+
+    if len(sys.argv) == 1:
+        parser.print_help()
+        sys.exit(1)
+    else:
+        return args_
+
+
+def create_argument_parser():
+    """Returns the parser of the command line arguments."""
+
     parser = CustomArgumentParser(
         prog='VHDL Style Guide (VSG)',
         description='''Analyzes VHDL files for style guide violations.
@@ -80,23 +103,16 @@ def parse_command_line_arguments():
         help="number of parallel jobs to use, default is the number of cpu cores",
     )
     parser.add_argument('--debug', default=False, action='store_true', help='Displays verbose debug information')
-
-    args_ = parser.parse_args()
-
-    validate_backup_argument(args_)
-    validate_ap_argument(args_)
-    fix_filename_argument(args_)
-    fix_configuration_argument(args_)
-
-    if sys.platform == "win32":
-        # Work around https://bugs.python.org/issue26903
-        args_.jobs = min(args_.jobs, 60)
-
-    if len(sys.argv) == 1:
-        parser.print_help()
-        sys.exit(1)
-    else:
-        return args_
+    parser.add_argument('--cache_directory', default=None, action='store',
+                        help='Directory used to store and reuse results of unchanged files.')
+    parser.add_argument('--server', default=False, action='store_true',
+                        help='Serve check and fix requests as JSON-RPC over stdin and stdout.')
+    parser.add_argument('--profile_rules', default=None, action='store', nargs='?', const='', metavar='JSON_FILE',
+                        help='Display the time spent in each rule, optionally writing the measurements to a JSON file.')
+    parser.add_argument('--profile_parse', default=None, action='store', nargs='?', const='time', choices=['time', 'memory'],
+                        help='Display the time and number of tokens of each parse stage of every file, with memory also the peak memory.')
+
+    return parser
 
 
 def get_predefined_styles():
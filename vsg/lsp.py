@@ -0,0 +1,271 @@
+
+import argparse
+import contextlib
+import json
+import sys
+import urllib.parse
+import urllib.request
+
+from . import cmd_line_args
+from . import server
+from . import version
+
+from .exceptions import ClassifyError
+from .exceptions import ConfigurationError
+
+iMethodNotFound = -32601
+iRequestFailed = -32803
+
+iFullDocumentSync = 1
+
+dSeverities = {}
+dSeverities['Error'] = 1
+dSeverities['Warning'] = 2
+
+
+class language_server():
+    '''
+    Language Server Protocol front end which publishes diagnostics and formats documents.
+    Documents are checked with the configuration and rules kept by a server object, so only the changed document is processed.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oInput: (binary file object) (optional)
+
+      oOutput: (binary file object) (optional)
+    '''
+    def __init__(self, commandLineArguments, oInput=None, oOutput=None):
+        self.oServer = server.server(commandLineArguments)
+        self.oInput = oInput or sys.stdin.buffer
+        self.oOutput = oOutput or sys.stdout.buffer
+        self.dDocuments = {}
+        self.bRunning = True
+        self.bShutdown = False
+        self.dRequests = {}
+        self.dRequests['initialize'] = self.initialize
+        self.dRequests['shutdown'] = self.shutdown
+        self.dRequests['textDocument/formatting'] = self.formatting
+        self.dNotifications = {}
+        self.dNotifications['exit'] = self.exit
+        self.dNotifications['textDocument/didOpen'] = self.did_open
+        self.dNotifications['textDocument/didChange'] = self.did_change
+        self.dNotifications['textDocument/didSave'] = self.did_save
+        self.dNotifications['textDocument/didClose'] = self.did_close
+
+    def run(self):
+        '''
+        Handles messages until an exit notification is received or the input is closed.
+
+        Returns: (integer) exit code
+        '''
+        while self.bRunning:
+            dMessage = read_message(self.oInput)
+            if dMessage is None:
+                break
+            with contextlib.redirect_stdout(sys.stderr):
+                self.handle(dMessage)
+        if self.bShutdown:
+            return 0
+        return 1
+
+    def handle(self, dMessage):
+        '''
+        Dispatches a request or notification.
+        Failures are reported to the client for requests and written to stderr for notifications.
+        '''
+        sMethod = dMessage.get('method')
+        if 'id' in dMessage:
+            try:
+                fRequest = self.dRequests[sMethod]
+            except KeyError:
+                self.send_error(dMessage['id'], iMethodNotFound, 'Method not found: ' + str(sMethod))
+                return
+            try:
+                result = fRequest(dMessage.get('params', {}))
+            except (ClassifyError, ConfigurationError) as e:
+                self.send_error(dMessage['id'], iRequestFailed, e.message)
+                return
+            except (Exception, SystemExit) as e:
+                self.send_error(dMessage['id'], iRequestFailed, e.__class__.__name__ + ': ' + str(e))
+                return
+            self.send({'jsonrpc': '2.0', 'id': dMessage['id'], 'result': result})
+        elif sMethod in self.dNotifications:
+            try:
+                self.dNotifications[sMethod](dMessage.get('params', {}))
+            except (Exception, SystemExit) as e:
+                print('ERROR: ' + str(sMethod) + ' failed with ' + e.__class__.__name__ + ': ' + str(e), file=sys.stderr)
+
+    def initialize(self, dParams):
+        dCapabilities = {}
+        dCapabilities['textDocumentSync'] = {'openClose': True, 'change': iFullDocumentSync, 'save': {'includeText': False}}
+        dCapabilities['documentFormattingProvider'] = True
+        return {'capabilities': dCapabilities, 'serverInfo': {'name': 'vsg', 'version': version.sVersion}}
+
+    def shutdown(self, dParams):
+        self.bShutdown = True
+        return None
+
+    def exit(self, dParams):
+        self.bRunning = False
+
+    def did_open(self, dParams):
+        dDocument = dParams['textDocument']
+        self.dDocuments[dDocument['uri']] = dDocument['text']
+        self.publish_diagnostics(dDocument['uri'])
+
+    def did_change(self, dParams):
+        sUri = dParams['textDocument']['uri']
+        lChanges = dParams['contentChanges']
+        if lChanges:
+            self.dDocuments[sUri] = lChanges[-1]['text']
+        self.publish_diagnostics(sUri)
+
+    def did_save(self, dParams):
+        self.publish_diagnostics(dParams['textDocument']['uri'])
+
+    def did_close(self, dParams):
+        sUri = dParams['textDocument']['uri']
+        self.dDocuments.pop(sUri, None)
+        self.send_notification('textDocument/publishDiagnostics', {'uri': sUri, 'diagnostics': []})
+
+    def formatting(self, dParams):
+        '''
+        Returns a single edit replacing the document with its fixed text, or no edits if nothing changed.
+        '''
+        sUri = dParams['textDocument']['uri']
+        sText = self.dDocuments.get(sUri)
+        if sText is None:
+            return []
+        dResults = self.oServer.process({'filename': uri_to_path(sUri), 'text': sText}, True)
+        if dResults['text'] == sText:
+            return []
+        lLines = sText.split('\n')
+        dRange = {'start': {'line': 0, 'character': 0}, 'end': {'line': len(lLines) - 1, 'character': get_character_count(lLines[-1])}}
+        return [{'range': dRange, 'newText': dResults['text']}]
+
+    def publish_diagnostics(self, sUri):
+        sText = self.dDocuments.get(sUri)
+        if sText is None:
+            return
+        try:
+            dResults = self.oServer.process({'filename': uri_to_path(sUri), 'text': sText, 'all_phases': True}, False)
+            lDiagnostics = create_diagnostics(dResults['violations'], server.split_lines(sText))
+        except (ClassifyError, ConfigurationError) as e:
+            lDiagnostics = [create_diagnostic(0, 0, 1, e.message, None)]
+        self.send_notification('textDocument/publishDiagnostics', {'uri': sUri, 'diagnostics': lDiagnostics})
+
+    def send_notification(self, sMethod, dParams):
+        self.send({'jsonrpc': '2.0', 'method': sMethod, 'params': dParams})
+
+    def send_error(self, requestId, iCode, sMessage):
+        self.send({'jsonrpc': '2.0', 'id': requestId, 'error': {'code': iCode, 'message': sMessage}})
+
+    def send(self, dMessage):
+        write_message(self.oOutput, dMessage)
+
+
+def create_diagnostics(lViolations, lLines):
+    '''
+    Converts violations into diagnostics covering the line each violation was reported on.
+    '''
+    lReturn = []
+    for dViolation in lViolations:
+        iLine = max(0, int(dViolation['linenumber']) - 1)
+        try:
+            iEnd = get_character_count(lLines[iLine])
+        except IndexError:
+            iEnd = 0
+        iSeverity = dSeverities.get(dViolation['severity'], dSeverities['Warning'])
+        lReturn.append(create_diagnostic(iLine, iEnd, iSeverity, dViolation['solution'], dViolation['rule']))
+    return lReturn
+
+
+def create_diagnostic(iLine, iEnd, iSeverity, sMessage, sRule):
+    dReturn = {}
+    dReturn['range'] = {'start': {'line': iLine, 'character': 0}, 'end': {'line': iLine, 'character': iEnd}}
+    dReturn['severity'] = iSeverity
+    dReturn['source'] = 'vsg'
+    dReturn['message'] = sMessage
+    if sRule is not None:
+        dReturn['code'] = sRule
+    return dReturn
+
+
+def get_character_count(sLine):
+    '''
+    Returns the length of a line in UTF-16 code units, which LSP positions count.
+    Characters outside the basic multilingual plane count as two.
+
+    Returns: (integer)
+    '''
+    return len(sLine.encode('utf-16-le', 'surrogatepass')) // 2
+
+
+def uri_to_path(sUri):
+    oUri = urllib.parse.urlparse(sUri)
+    if oUri.scheme != 'file':
+        return sUri
+    return urllib.request.url2pathname(oUri.path)
+
+
+def read_message(oInput):
+    '''
+    Reads one message framed with a Content-Length header.
+
+    Returns: (dictionary) or None if the input is closed
+    '''
+    iLength = None
+    while True:
+        bLine = oInput.readline()
+        if not bLine:
+            return None
+        sLine = bLine.decode('ascii').strip()
+        if not sLine:
+            if iLength is not None:
+                break
+            continue
+        sName, sSeparator, sValue = sLine.partition(':')
+        if sName.strip().lower() == 'content-length':
+            iLength = int(sValue.strip())
+    bBody = oInput.read(iLength)
+    if len(bBody) < iLength:
+        return None
+    return json.loads(bBody.decode('utf-8'))
+
+
+def write_message(oOutput, dMessage):
+    bBody = json.dumps(dMessage).encode('utf-8')
+    oOutput.write(b'Content-Length: ' + str(len(bBody)).encode('ascii') + b'\r\n\r\n' + bBody)
+    oOutput.flush()
+
+
+def parse_command_line_arguments():
+    parser = argparse.ArgumentParser(
+        prog='vsg-lsp',
+        description='Language server for the VHDL Style Guide (VSG).')
+    parser.add_argument('-c', '--configuration', nargs='+', help='JSON or YAML configuration file(s)')
+    parser.add_argument('--style', action='store', default=None, help='Use predefined style')
+    parser.add_argument('-lr', '--local_rules', help='Path to local rules')
+    parser.add_argument('--cache_directory', default=None, action='store',
+                        help='Directory used to store and reuse classified tokens.')
+    parser.add_argument('--stdio', default=False, action='store_true', help='Communicate over stdin and stdout (default)')
+    return parser.parse_args(namespace=get_default_arguments())
+
+
+def get_default_arguments():
+    '''
+    Returns the defaults of the vsg command line, which config.New and apply_rules read, with all phases checked.
+    The options vsg-lsp takes itself are parsed into this namespace.
+
+    Returns: (argparse object)
+    '''
+    oReturn = cmd_line_args.create_argument_parser().parse_args([])
+    oReturn.all_phases = True
+    return oReturn
+
+
+def main():
+    '''Runs the language server on stdin and stdout.'''
+    sys.exit(language_server(parse_command_line_arguments()).run())
@@ -4,29 +4,56 @@
 ###############################################################################
 
 
-class item():
+def extract_unique_id_from_docstring(sDoc):
+    '''
+    Returns the base and sub token names from the unique_id line of a class docstring.
+    '''
+    try:
+        lDoc = sDoc.split()
+        for iDoc, sWord in enumerate(lDoc):
+            if sWord == 'unique_id':
+                return lDoc[iDoc + 2], lDoc[iDoc + 4]
+        return None, None
+    except AttributeError:
+        return None, None
+
+
+no_code_tags = frozenset()
+all_code_tags = frozenset(['all'])
+
+
+class slotted_token(type):
+    '''
+    Metaclass which gives every token class an empty __slots__ unless it declares its own.
+    This keeps token objects free of a per instance __dict__ without requiring each token module to declare slots.
+    '''
+
+    def __new__(mcs, sName, tBases, dNamespace):
+        dNamespace.setdefault('__slots__', ())
+        return super().__new__(mcs, sName, tBases, dNamespace)
+
+
+class item(metaclass=slotted_token):
     '''
     unique_id = parser : item
     '''
 
+    __slots__ = ('value', 'indent', 'hierarchy', 'context', 'code_tags', 'filename', 'iId', 'has_tab', 'is_block_comment', 'block_comment_indent')
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.base_token, cls.sub_token = extract_unique_id_from_docstring(cls.__doc__)
+
     def __init__(self, sString):
         self.value = sString
         self.indent = None
         self.hierarchy = None
-        self.context = []
-        self.code_tags = []
-        self.base_token, self.sub_token = self.update_token_types()
+        self.context = ()
+        self.code_tags = no_code_tags
         self.filename = None
 
     def update_token_types(self):
-        try:
-            lDoc = self.__doc__.split()
-            for iDoc, sDoc in enumerate(lDoc):
-                if sDoc == 'unique_id':
-                    return lDoc[iDoc + 2], lDoc[iDoc + 4]
-            return None, None
-        except AttributeError:
-            return None, None
+        return self.base_token, self.sub_token
 
     def get_value(self):
         return self.value
@@ -50,29 +77,31 @@ class item():
         return self.hierarchy
 
     def add_context(self, sContext):
+        self.context = list(self.context)
         self.context.extend(sContext)
 
     def pop_context(self):
+        self.context = list(self.context)
         return self.context.pop()
 
     def get_context(self):
         return self.context
 
     def set_code_tags(self, lCodeTags):
-        self.code_tags = lCodeTags.copy()
+        self.code_tags = frozenset(lCodeTags)
 
     def has_code_tag(self, sCodeTag):
-        if self.code_tags == ['all']:
+        if self.code_tags == all_code_tags:
             return True
         if sCodeTag in self.code_tags:
             return True
         return False
 
     def clear_code_tags(self):
-        self.code_tags = []
+        self.code_tags = no_code_tags
 
     def set_all_code_tags(self):
-        self.code_tags = ['all']
+        self.code_tags = all_code_tags
 
     def get_unique_id(self, sJoin=None):
         if sJoin is None:
@@ -92,6 +121,9 @@ class item():
         return self.filename
 
 
+item.base_token, item.sub_token = extract_unique_id_from_docstring(item.__doc__)
+
+
 class todo(item):
     '''
     unique_id = parser : todo
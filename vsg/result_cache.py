@@ -0,0 +1,190 @@
+
+import hashlib
+import json
+import os
+import tempfile
+
+from . import junit
+from . import version
+
+dLocalRulesHashes = {}
+
+
+def get_key(commandLineArguments, oConfig, sFileName):
+    '''
+    Returns the key used to store the results of a file.
+    The key covers the content of the file, the version of vsg, the effective configuration of the file,
+    the local rules and the command line options which change the results.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oConfig: (config object)
+
+      sFileName: (string)
+
+    Returns: (string) or None if the file could not be read
+    '''
+    try:
+        with open(sFileName, 'rb') as oFile:
+            sContentHash = hashlib.sha256(oFile.read()).hexdigest()
+    except OSError:
+        return None
+
+    dKey = {}
+    dKey['file_name'] = sFileName
+    dKey['content'] = sContentHash
+    dKey['version'] = version.sVersion
+    dKey['configuration'] = get_effective_configuration(oConfig, sFileName)
+    dKey['local_rules'] = hash_local_rules(commandLineArguments.local_rules)
+    dKey['output_format'] = commandLineArguments.output_format
+    dKey['all_phases'] = commandLineArguments.all_phases
+    dKey['skip_phase'] = commandLineArguments.skip_phase
+    dKey['junit'] = bool(commandLineArguments.junit)
+    dKey['json'] = bool(commandLineArguments.json or commandLineArguments.quality_report)
+    sKey = json.dumps(dKey, sort_keys=True, default=str)
+    return hashlib.sha256(sKey.encode('utf-8')).hexdigest()
+
+
+def get_effective_configuration(oConfig, sFileName):
+    '''
+    Returns the configuration which applies to a single file.
+    Entries in the file_list for other files are not included.
+    '''
+    dReturn = {}
+    for sKey in oConfig.dConfig:
+        if sKey != 'file_list':
+            dReturn[sKey] = oConfig.dConfig[sKey]
+    dReturn['file_list'] = get_file_configuration(oConfig.dConfig, sFileName)
+    dReturn['indent'] = oConfig.dIndent
+    dReturn['fix_only'] = oConfig.dFixOnly
+    return dReturn
+
+
+def get_file_configuration(dConfig, sFileName):
+    try:
+        for dFile in dConfig['file_list']:
+            if isinstance(dFile, dict) and sFileName in dFile:
+                return dFile[sFileName]
+    except (KeyError, TypeError):
+        pass
+    return None
+
+
+def hash_local_rules(sDirectory):
+    '''
+    Returns a hash over the names and contents of the python files in the local rules directory.
+    The hash is kept until the name, modification time or size of one of the files changes.
+    '''
+    if not sDirectory:
+        return None
+    lFiles = get_local_rules_files(sDirectory)
+    try:
+        lCachedFiles, sHash = dLocalRulesHashes[sDirectory]
+        if lCachedFiles == lFiles:
+            return sHash
+    except KeyError:
+        pass
+    oHash = hashlib.sha256()
+    for sFileName, iModificationTime, iSize in lFiles:
+        oHash.update(sFileName.encode('utf-8'))
+        with open(os.path.join(sDirectory, sFileName), 'rb') as oFile:
+            oHash.update(oFile.read())
+    dLocalRulesHashes[sDirectory] = lFiles, oHash.hexdigest()
+    return dLocalRulesHashes[sDirectory][1]
+
+
+def get_local_rules_files(sDirectory):
+    '''
+    Returns the name, modification time and size of the python files in the local rules directory.
+
+    Returns: (list of tuples)
+    '''
+    try:
+        lFileNames = sorted(os.listdir(sDirectory))
+    except OSError:
+        lFileNames = []
+    lReturn = []
+    for sFileName in lFileNames:
+        if not sFileName.endswith('.py'):
+            continue
+        oStat = os.stat(os.path.join(sDirectory, sFileName))
+        lReturn.append((sFileName, oStat.st_mtime_ns, oStat.st_size))
+    return lReturn
+
+
+def get_path(sDirectory, sKey):
+    return os.path.join(sDirectory, sKey[0:2], sKey + '.json')
+
+
+def encode(tResults):
+    '''
+    Converts the results of a file to a dictionary which can be stored as JSON.
+    JSON is used so reading an entry placed in a shared cache can not run code.
+    '''
+    fExitStatus, oTestCase, dJsonEntry, sOutputStd, sOutputErr, bStopProcessing = tResults
+    dReturn = {}
+    dReturn['exit_status'] = fExitStatus
+    dReturn['testcase'] = encode_testcase(oTestCase)
+    dReturn['json'] = dJsonEntry
+    dReturn['stdout'] = sOutputStd
+    dReturn['stderr'] = sOutputErr
+    dReturn['stop_processing'] = bStopProcessing
+    return dReturn
+
+
+def decode(dResults):
+    return dResults['exit_status'], decode_testcase(dResults['testcase']), dResults['json'], dResults['stdout'], dResults['stderr'], dResults['stop_processing']
+
+
+def encode_testcase(oTestCase):
+    if oTestCase is None:
+        return None
+    dReturn = {}
+    dReturn['name'] = oTestCase.name
+    dReturn['time'] = oTestCase.time
+    dReturn['classname'] = oTestCase.classname
+    dReturn['failures'] = None
+    if oTestCase.failures is not None:
+        dReturn['failures'] = [{'type': oFailure.type, 'text': oFailure.text} for oFailure in oTestCase.failures]
+    return dReturn
+
+
+def decode_testcase(dTestCase):
+    if dTestCase is None:
+        return None
+    oReturn = junit.testcase(dTestCase['name'], dTestCase['time'], dTestCase['classname'])
+    if dTestCase['failures'] is not None:
+        for dFailure in dTestCase['failures']:
+            oFailure = junit.failure(dFailure['type'])
+            oFailure.text = dFailure['text']
+            oReturn.add_failure(oFailure)
+    return oReturn
+
+
+def read(sDirectory, sKey):
+    '''
+    Returns the results stored under the key or None if there are none.
+    '''
+    try:
+        with open(get_path(sDirectory, sKey), encoding='utf-8') as oFile:
+            return decode(json.load(oFile))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def write(sDirectory, sKey, tResults):
+    '''
+    Stores the results under the key.
+    The results are written to a temporary file and moved into place so a partially written entry is never read.
+    '''
+    sPath = get_path(sDirectory, sKey)
+    try:
+        os.makedirs(os.path.dirname(sPath), exist_ok=True)
+        iHandle, sTemporaryPath = tempfile.mkstemp(dir=os.path.dirname(sPath))
+        with os.fdopen(iHandle, 'w', encoding='utf-8') as oFile:
+            json.dump(encode(tResults), oFile)
+        os.replace(sTemporaryPath, sPath)
+    except OSError:
+        pass
@@ -142,6 +142,15 @@ class Rule():
         lToi = self._get_tokens_of_interest(oFile)
         self._analyze(lToi)
 
+    def get_required_tokens(self):
+        '''
+        Returns the token types the rule searches for.
+        If none of them exist in a file the rule can not find a violation and does not need to be analyzed.
+
+        Returns: (list of token types) or None if the rule must always be analyzed
+        '''
+        return None
+
     def get_configuration(self):
         '''
         Returns a dictionary of every configurable attribute of the rule.
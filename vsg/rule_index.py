@@ -0,0 +1,153 @@
+
+import importlib
+import inspect
+import json
+import os
+
+sIndexFileName = os.path.join(os.path.dirname(__file__), 'rules', 'rule_index.json')
+
+lIndex = None
+
+
+def build():
+    '''
+    Creates the rule index by importing and instantiating every rule.
+    Each entry describes one rule in the order the rules are loaded.
+
+    Parameters:  None
+
+    Returns:  (list of dictionaries)
+    '''
+    from vsg import rules
+    lReturn = []
+    for sPackage in sorted(rules.lPackages):
+        oPackage = importlib.import_module('vsg.rules.' + sPackage)
+        for sName, oClass in inspect.getmembers(oPackage):
+            if inspect.isclass(oClass) and sName.startswith('rule_'):
+                oRule = oClass()
+                dRule = {}
+                dRule['unique_id'] = oRule.unique_id
+                dRule['module'] = oClass.__module__
+                dRule['class'] = sName
+                dRule['phase'] = oRule.phase
+                dRule['subphase'] = oRule.subphase
+                dRule['groups'] = oRule.groups
+                dRule['disable'] = oRule.disable
+                dRule['deprecated'] = oRule.deprecated
+                lReturn.append(dRule)
+    return lReturn
+
+
+def write(sFileName=sIndexFileName):
+    '''
+    Writes the rule index with one rule per line.
+    '''
+    lLines = [json.dumps(dRule) for dRule in build()]
+    with open(sFileName, 'w') as oFile:
+        oFile.write('[\n' + ',\n'.join(lLines) + '\n]\n')
+
+
+def read():
+    '''
+    Returns the rule index, reading it on first use.
+    If the index can not be read, it is built from the rules.
+
+    Parameters:  None
+
+    Returns:  (list of dictionaries)
+    '''
+    global lIndex
+    if lIndex is None:
+        try:
+            with open(sIndexFileName) as oFile:
+                lIndex = json.load(oFile)
+        except (OSError, ValueError):
+            lIndex = build()
+    return lIndex
+
+
+def get_rule_names():
+    return [dRule['unique_id'] for dRule in read()]
+
+
+def load_rules(lRuleNames=None):
+    '''
+    Imports and instantiates rules listed in the index.
+
+    Parameters:
+
+      lRuleNames (list of strings) (optional): unique ids of the rules to load, all rules are loaded if omitted
+
+    Returns:  (rule object list)
+    '''
+    if lRuleNames is not None:
+        lRuleNames = set(lRuleNames)
+    lReturn = []
+    for dRule in read():
+        if lRuleNames is None or dRule['unique_id'] in lRuleNames:
+            oModule = importlib.import_module(dRule['module'])
+            lReturn.append(getattr(oModule, dRule['class'])())
+    return lReturn
+
+
+def get_rules_to_load(dConfig):
+    '''
+    Returns the unique ids of the rules which could be enabled by a configuration.
+    Rules which are disabled by default are left out unless the configuration, or the configuration of a file in the file_list,
+    refers to them directly, through a group or through the global disable option.
+
+    Parameters:
+
+      dConfig (dictionary)
+
+    Returns:  (list of strings)
+    '''
+    lRuleConfigurations = get_rule_configurations(dConfig)
+    setNames = set()
+    setGroups = set()
+    for dRules in lRuleConfigurations:
+        setNames.update(dRules)
+        if 'disable' in get_dictionary(dRules, 'global'):
+            return get_rule_names()
+        dGroups = get_dictionary(dRules, 'group')
+        for sGroup in dGroups:
+            if 'disable' in get_dictionary(dGroups, sGroup):
+                setGroups.add(sGroup)
+
+    lReturn = []
+    for dRule in read():
+        if not dRule['disable'] or dRule['unique_id'] in setNames or setGroups.intersection(dRule['groups']):
+            lReturn.append(dRule['unique_id'])
+    return lReturn
+
+
+def get_rule_configurations(dConfig):
+    '''
+    Returns the rule dictionaries of a configuration and of every file in its file_list.
+    '''
+    lReturn = []
+    if not isinstance(dConfig, dict):
+        return lReturn
+    lReturn.append(get_dictionary(dConfig, 'rule'))
+    lFileList = dConfig.get('file_list')
+    if isinstance(lFileList, list):
+        for dFile in lFileList:
+            if isinstance(dFile, dict):
+                for dFileConfig in dFile.values():
+                    lReturn.append(get_dictionary(dFileConfig, 'rule'))
+    return lReturn
+
+
+def get_dictionary(dParent, sKey):
+    try:
+        dReturn = dParent[sKey]
+    except (KeyError, TypeError):
+        return {}
+    if isinstance(dReturn, dict):
+        return dReturn
+    return {}
+
+
+def main():
+    '''Regenerates the rule index after rules are added or changed.'''
+    write()
@@ -8,6 +8,7 @@ from vsg import exceptions
 from . import deprecated_rule
 from . import junit
 from . import report
+from . import rule_index
 from . import utils
 from . import severity
 
@@ -66,22 +67,18 @@ def load_local_rules(sDirectoryName):
     return lRules
 
 
-def load_rules():
+def load_rules(lRuleNames=None):
     '''
     Loads rules from the vsg/rules directory.
+    Only the rule packages containing requested rules are imported.
 
-    Parameters:  None
+    Parameters:
+
+      lRuleNames (list of strings) (optional): unique ids of the rules to load, all rules are loaded if omitted
 
     Returns:  (rule object list)
     '''
-    lRules = []
-    for name, oPackage in inspect.getmembers(importlib.import_module('vsg.rules')):
-        if inspect.ismodule(oPackage):
-            for name, oRule in inspect.getmembers(oPackage):
-                if inspect.isclass(oRule) and name.startswith('rule_'):
-                    lRules.append(oRule())
-
-    return lRules
+    return rule_index.load_rules(lRuleNames)
 
 
 def maximum_phase(lRules):
@@ -100,11 +97,91 @@ def maximum_phase(lRules):
     return maximumPhaseNumber
 
 
+def copy_value(value):
+    '''
+    Returns a copy of the lists, dictionaries and sets in value.
+    Other objects, such as options, severities and token types, are shared with the original.
+
+    Parameters:
+
+      value : (any)
+
+    Returns: (any)
+    '''
+    if isinstance(value, list):
+        return [copy_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: copy_value(item) for key, item in value.items()}
+    if isinstance(value, set):
+        return set(value)
+    return value
+
+
+class rule_registry():
+    '''
+    Holds rule objects which are loaded and configured once per process and shared by every file.
+    Per file configurations from the file_list are undone by reset before the next file is processed.
+    Rules which are disabled by default are only loaded if the configuration could enable them.
+
+    Parameters:
+
+      oConfig: (config object)
+
+      sLocalRulesDirectory: (string) (optional)
+    '''
+    def __init__(self, oConfig, sLocalRulesDirectory=None):
+        self.dConfig = oConfig.dConfig
+        self.sLocalRulesDirectory = sLocalRulesDirectory
+        self.rules = load_rules(rule_index.get_rules_to_load(self.dConfig))
+        if sLocalRulesDirectory:
+            self.rules.extend(load_local_rules(sLocalRulesDirectory))
+        self.bConfigured = False
+        self.lSavedConfiguration = None
+
+    def is_for(self, oConfig, sLocalRulesDirectory):
+        '''
+        Returns True if the registry was created with the same configuration and local rules directory.
+        '''
+        if sLocalRulesDirectory != self.sLocalRulesDirectory:
+            return False
+        return oConfig.dConfig is self.dConfig or oConfig.dConfig == self.dConfig
+
+    def is_configured_with(self, oConfig):
+        return self.bConfigured and self.is_for(oConfig, self.sLocalRulesDirectory)
+
+    def save_configuration(self):
+        '''
+        Stores the attributes and option values of every rule so they can be restored by reset.
+        Lists, dictionaries and sets are copied, so changing them in place does not alter the stored values.
+        '''
+        if self.lSavedConfiguration is not None:
+            return
+        self.lSavedConfiguration = []
+        for oRule in self.rules:
+            lOptionValues = [(oOption, copy_value(oOption.value)) for oOption in oRule.options]
+            self.lSavedConfiguration.append((oRule, copy_value(oRule.__dict__), lOptionValues))
+
+    def reset(self):
+        '''
+        Restores any saved configuration and clears violations from every rule.
+        '''
+        if self.lSavedConfiguration is not None:
+            for oRule, dAttributes, lOptionValues in self.lSavedConfiguration:
+                oRule.__dict__.clear()
+                oRule.__dict__.update(dAttributes)
+                for oOption, value in lOptionValues:
+                    oOption.value = value
+            self.lSavedConfiguration = None
+        for oRule in self.rules:
+            oRule.clear_violations()
+
+
 class rule_list():
     '''
     Contains a list of all rules to be checked.
     It loads all base rules.
     Localized rules are loaded if specified.
+    If a rule registry is given, its rules are reset and used instead.
 
     Parameters:
 
@@ -113,11 +190,20 @@ class rule_list():
       oSeverityList: (severity list object)
 
       sLocalRulesDirectory: (string) (optional)
+
+      oRuleRegistry: (rule_registry object) (optional)
+
+      lRuleNames: (list of strings) (optional)
     '''
-    def __init__(self, oVhdlFile, oSeverityList, sLocalRulesDirectory=None):
-        self.rules = load_rules()
-        if sLocalRulesDirectory:
-            self.rules.extend(load_local_rules(sLocalRulesDirectory))
+    def __init__(self, oVhdlFile, oSeverityList, sLocalRulesDirectory=None, oRuleRegistry=None, lRuleNames=None):
+        if oRuleRegistry is None:
+            self.rules = load_rules(lRuleNames)
+            if sLocalRulesDirectory:
+                self.rules.extend(load_local_rules(sLocalRulesDirectory))
+        else:
+            oRuleRegistry.reset()
+            self.rules = oRuleRegistry.rules
+        self.oRuleRegistry = oRuleRegistry
         self.iNumberRulesRan = 0
         self.lastPhaseRan = 0
         self.oVhdlFile = oVhdlFile
@@ -125,7 +211,7 @@ class rule_list():
         self.violations = False
         self.oSeverityList = oSeverityList
 
-    def fix(self, iFixPhase=7, lSkipPhase=None, dFixOnly=None):
+    def fix(self, iFixPhase=7, lSkipPhase=None, dFixOnly=None, oRuleProfile=None):
         '''
         Applies fixes to all violations found.
 
@@ -136,6 +222,8 @@ class rule_list():
           lSkipPhases : (list of integers)
 
           dFixOnly : (fix list dictionary)
+
+          oRuleProfile : (rule_profile object) (optional)
         '''
         if lSkipPhase is None:
             lSkipPhase = []
@@ -157,10 +245,15 @@ class rule_list():
                 lRules = enforce_prerequisites(lRules)
                 for oRule in lRules:
                     #print(oRule.unique_id)
-                    if oRule.severity.type == severity.error_type:
-                        oRule.fix(self.oVhdlFile, dFixOnly)
-                    else:
-                        oRule.analyze(self.oVhdlFile)
+                    if oRuleProfile is not None:
+                        oRuleProfile.start(self.oVhdlFile)
+                    if has_required_tokens(oRule, self.oVhdlFile):
+                        if oRule.severity.type == severity.error_type:
+                            oRule.fix(self.oVhdlFile, dFixOnly)
+                        else:
+                            oRule.analyze(self.oVhdlFile)
+                    if oRuleProfile is not None:
+                        oRuleProfile.stop(oRule, 'fix', self.oVhdlFile)
 
             if phase == 1:
                 self.oVhdlFile.fix_blank_lines()
@@ -201,7 +294,7 @@ class rule_list():
                 lReturn.append(oRule)
         return lReturn
 
-    def check_rules(self, bAllPhases=False, lSkipPhase=None):
+    def check_rules(self, bAllPhases=False, lSkipPhase=None, oRuleProfile=None):
         '''
         Analyzes all rules in increasing phase order.
         If there is a violation in a phase, analysis is halted.
@@ -210,6 +303,7 @@ class rule_list():
 
             bAllPhases : (boolean)
             lSkipPhase : (list of integers)
+            oRuleProfile : (rule_profile object) (optional)
         '''
         if lSkipPhase is None:
             lSkipPhase = []
@@ -226,7 +320,12 @@ class rule_list():
                 lRules = filter_out_disabled_rules(lRules)
 
                 for oRule in lRules:
-                    oRule.analyze(self.oVhdlFile)
+                    if oRuleProfile is not None:
+                        oRuleProfile.start(self.oVhdlFile)
+                    if has_required_tokens(oRule, self.oVhdlFile):
+                        oRule.analyze(self.oVhdlFile)
+                    if oRuleProfile is not None:
+                        oRuleProfile.stop(oRule, 'check', self.oVhdlFile)
                     if oRule.severity.type == severity.error_type:
                         iFailures += len(oRule.violations)
                     self.iNumberRulesRan += 1
@@ -283,6 +382,20 @@ class rule_list():
 
           configurationFile: (dictionary)
         '''
+        bRegistryConfiguration = False
+        if self.oRuleRegistry is not None:
+            if self.oRuleRegistry.is_configured_with(oConfig):
+                return
+            bRegistryConfiguration = self.oRuleRegistry.is_for(oConfig, self.oRuleRegistry.sLocalRulesDirectory)
+            if not bRegistryConfiguration:
+                self.oRuleRegistry.save_configuration()
+
+        self._configure(oConfig)
+
+        if bRegistryConfiguration:
+            self.oRuleRegistry.bConfigured = True
+
+    def _configure(self, oConfig):
         lDeprecatedMessages = []
         configurationFile = oConfig.dConfig
         if configurationFile and 'rule' in configurationFile:
@@ -325,9 +438,19 @@ class rule_list():
                 raise exceptions.ConfigurationError(sErrorMessage)
 
     def get_list_of_rule_names(self):
-        lReturn = []
+        '''
+        Returns the names of every rule in the rule index and of the loaded rules, which includes local rules.
+        Each name is listed once.
+
+        Returns: (list of strings)
+        '''
+        lReturn = rule_index.get_rule_names()
+        sRuleNames = set(lReturn)
         for oRule in self.rules:
-            lReturn.append(oRule.get_unique_id())
+            sRuleName = oRule.get_unique_id()
+            if sRuleName not in sRuleNames:
+                lReturn.append(sRuleName)
+                sRuleNames.add(sRuleName)
         return lReturn
 
     def extract_junit_testcase(self, sVhdlFileName):
@@ -397,6 +520,25 @@ class rule_list():
         return self.iNumberRulesRan
 
 
+def has_required_tokens(oRule, oFile):
+    '''
+    Checks if any of the token types a rule searches for exist in a file.
+    Rules which do not declare their token types are always analyzed.
+
+    Parameters:
+
+      oRule : (rule object)
+
+      oFile : (vhdlFile object)
+
+    Returns: (boolean)
+    '''
+    lTokens = oRule.get_required_tokens()
+    if lTokens is None:
+        return True
+    return oFile.oTokenMap.has_any_token(lTokens)
+
+
 def filter_out_disabled_rules(lRules):
     '''
     Removes rules which are disabled from a list of rule objects.
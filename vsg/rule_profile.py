@@ -0,0 +1,153 @@
+
+import json
+import time
+
+lStages = ['check', 'fix']
+
+lFields = ['calls', 'time', 'extractions', 'token_map_updates', 'violations']
+
+
+class rule_profile():
+    '''
+    Accumulates measurements of every rule run by rule_list.check_rules and rule_list.fix.
+    Measurements are kept per rule and stage, where the stage is either check or fix.
+    Profiles of several files or processes are combined with the merge method.
+
+    The following is recorded for each rule:
+
+      calls : number of times the rule was run
+
+      time : wall time in seconds
+
+      extractions : number of token extraction calls made on the vhdlFile
+
+      token_map_updates : number of times the token map was updated
+
+      violations : number of violations found, or fixed in the fix stage
+    '''
+    def __init__(self):
+        self.dRules = {}
+        self.tStart = None
+
+    def start(self, oFile):
+        '''
+        Stores the state of the file and the time before a rule is run.
+        '''
+        self.tStart = (time.perf_counter(), oFile.iExtractions, oFile.iTokenMapUpdates, oFile.iFixes)
+
+    def stop(self, oRule, sStage, oFile):
+        '''
+        Records the measurements of a rule run since the last call to start.
+        '''
+        fStart, iExtractions, iTokenMapUpdates, iFixes = self.tStart
+        dRule = self.get_rule(oRule.unique_id, sStage, oRule.phase, oRule.subphase)
+        dRule['calls'] += 1
+        dRule['time'] += time.perf_counter() - fStart
+        dRule['extractions'] += oFile.iExtractions - iExtractions
+        dRule['token_map_updates'] += oFile.iTokenMapUpdates - iTokenMapUpdates
+        dRule['violations'] += oFile.iFixes - iFixes + len(oRule.violations)
+
+    def get_rule(self, sRule, sStage, iPhase, iSubphase):
+        tKey = (sRule, sStage)
+        try:
+            return self.dRules[tKey]
+        except KeyError:
+            dRule = {}
+            dRule['rule'] = sRule
+            dRule['stage'] = sStage
+            dRule['phase'] = iPhase
+            dRule['subphase'] = iSubphase
+            for sField in lFields:
+                dRule[sField] = 0
+            self.dRules[tKey] = dRule
+            return dRule
+
+    def merge(self, oProfile):
+        '''
+        Adds the measurements of another profile to this one.
+        '''
+        for dOther in oProfile.dRules.values():
+            dRule = self.get_rule(dOther['rule'], dOther['stage'], dOther['phase'], dOther['subphase'])
+            for sField in lFields:
+                dRule[sField] += dOther[sField]
+
+    def get_rules(self):
+        '''
+        Returns the measurements of every rule sorted by decreasing time.
+
+        Returns: (list of dictionaries)
+        '''
+        return sorted(self.dRules.values(), key=lambda x: (-x['time'], x['rule'], lStages.index(x['stage'])))
+
+    def get_phases(self):
+        '''
+        Returns the measurements summed over the rules of each stage, phase and subphase.
+
+        Returns: (list of dictionaries)
+        '''
+        dPhases = {}
+        for dRule in self.dRules.values():
+            tKey = (lStages.index(dRule['stage']), dRule['phase'], dRule['subphase'])
+            if tKey not in dPhases:
+                dPhases[tKey] = {'stage': dRule['stage'], 'phase': dRule['phase'], 'subphase': dRule['subphase'], 'rules': 0}
+                for sField in lFields:
+                    dPhases[tKey][sField] = 0
+            dPhases[tKey]['rules'] += 1
+            for sField in lFields:
+                dPhases[tKey][sField] += dRule[sField]
+        return [dPhases[tKey] for tKey in sorted(dPhases)]
+
+    def get_dictionary(self):
+        dReturn = {}
+        dReturn['rules'] = self.get_rules()
+        dReturn['phases'] = self.get_phases()
+        return dReturn
+
+    def write_json(self, sFileName):
+        with open(sFileName, 'w') as oFile:
+            oFile.write(json.dumps(self.get_dictionary(), indent=2))
+
+    def get_table(self):
+        '''
+        Returns the measurements as lines of text.
+        Rules are listed by decreasing time followed by the totals of each phase and subphase.
+
+        Returns: (list of strings)
+        '''
+        lRules = self.get_rules()
+        fTotal = sum([dRule['time'] for dRule in lRules])
+        lReturn = []
+        lReturn.append('=' * 100)
+        lReturn.append('Rule profile')
+        lReturn.append('=' * 100)
+        lReturn.append(format_row('Rule', 'Stage', 'Phase', 'Calls', 'Time (s)', '%', 'Extractions', 'Map updates', 'Violations'))
+        lReturn.append('-' * 100)
+        for dRule in lRules:
+            lReturn.append(format_measurement(dRule['rule'], dRule, fTotal))
+        lReturn.append('-' * 100)
+        lReturn.append(format_row('Phase', 'Stage', 'Rules', 'Calls', 'Time (s)', '%', 'Extractions', 'Map updates', 'Violations'))
+        lReturn.append('-' * 100)
+        for dPhase in self.get_phases():
+            dRow = dPhase.copy()
+            dRow['phase'] = dPhase['rules']
+            lReturn.append(format_measurement(str(dPhase['phase']) + '.' + str(dPhase['subphase']), dRow, fTotal))
+        lReturn.append('=' * 100)
+        lReturn.append('Total time (s) : ' + format_time(fTotal))
+        return lReturn
+
+
+def format_measurement(sName, dMeasurement, fTotal):
+    if fTotal > 0:
+        sPercent = f'{100 * dMeasurement["time"] / fTotal:.1f}'
+    else:
+        sPercent = '0.0'
+    return format_row(sName, dMeasurement['stage'], dMeasurement['phase'], dMeasurement['calls'], format_time(dMeasurement['time']),
+                      sPercent, dMeasurement['extractions'], dMeasurement['token_map_updates'], dMeasurement['violations'])
+
+
+def format_row(sName, sStage, sPhase, sCalls, sTime, sPercent, sExtractions, sUpdates, sViolations):
+    return f'{sName:<35}{sStage:<7}{sPhase:>6}{sCalls:>7}{sTime:>10}{sPercent:>7}{sExtractions:>12}{sUpdates:>12}{sViolations:>11}'
+
+
+def format_time(fTime):
+    return f'{fTime:.4f}'
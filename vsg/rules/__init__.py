@@ -1,3 +1,6 @@
+import importlib
+import sys
+
 
 from .token_indent import token_indent
 from .token_indent_between_tokens import token_indent_between_tokens
@@ -78,70 +81,85 @@ from .token_does_not_exist_before_token import Rule as token_does_not_exist_befo
 
 from .experiment import Rule as experiment
 
-from vsg.rules import alias_declaration
-from vsg.rules import after
-from vsg.rules import architecture
-from vsg.rules import assert_statement
-from vsg.rules import attribute
-from vsg.rules import attribute_declaration
-from vsg.rules import attribute_specification
-from vsg.rules import block
-from vsg.rules import block_comment
-from vsg.rules import case
-from vsg.rules import case_generate_alternative
-from vsg.rules import case_generate_statement
-from vsg.rules import comment
-from vsg.rules import component
-from vsg.rules import concurrent
-from vsg.rules import conditional_expressions
-from vsg.rules import conditional_waveforms
-from vsg.rules import constant
-from vsg.rules import context
-from vsg.rules import context_ref
-from vsg.rules import declarative_part
-from vsg.rules import element_association
-from vsg.rules import entity
-from vsg.rules import entity_specification
-from vsg.rules import exit_statement
-from vsg.rules import exponent
-from vsg.rules import file_statement
-from vsg.rules import for_loop
-from vsg.rules import for_generate_statement
-from vsg.rules import function
-from vsg.rules import generate
-from vsg.rules import generic
-from vsg.rules import generic_map
-from vsg.rules import ieee
-from vsg.rules import if_statement
-from vsg.rules import if_generate_statement
-from vsg.rules import instantiation
-from vsg.rules import iteration_scheme
-from vsg.rules import length
-from vsg.rules import library
-from vsg.rules import logical_operator
-from vsg.rules import loop_statement
-from vsg.rules import package
-from vsg.rules import package_body
-from vsg.rules import port
-from vsg.rules import port_map
-from vsg.rules import procedure
-from vsg.rules import procedure_call
-from vsg.rules import process
-from vsg.rules import ranges
-from vsg.rules import record_type_definition
-from vsg.rules import report_statement
-from vsg.rules import selected_assignment
-from vsg.rules import sequential
-from vsg.rules import signal
-from vsg.rules import source_file
-from vsg.rules import subprogram_body
-from vsg.rules import subtype
-from vsg.rules import type_definition
-from vsg.rules import use_clause
-from vsg.rules import variable
-from vsg.rules import variable_assignment
-from vsg.rules import wait
-from vsg.rules import when
-from vsg.rules import while_loop
-from vsg.rules import whitespace
-from vsg.rules import with_statement
+# Rule packages are imported the first time they are used.
+# The rules in each package are listed in the rule index, see vsg.rule_index.
+# Python versions before 3.7 do not support a module __getattr__, so every package is imported.
+lPackages = []
+lPackages.append('alias_declaration')
+lPackages.append('after')
+lPackages.append('architecture')
+lPackages.append('assert_statement')
+lPackages.append('attribute')
+lPackages.append('attribute_declaration')
+lPackages.append('attribute_specification')
+lPackages.append('block')
+lPackages.append('block_comment')
+lPackages.append('case')
+lPackages.append('case_generate_alternative')
+lPackages.append('case_generate_statement')
+lPackages.append('comment')
+lPackages.append('component')
+lPackages.append('concurrent')
+lPackages.append('conditional_expressions')
+lPackages.append('conditional_waveforms')
+lPackages.append('constant')
+lPackages.append('context')
+lPackages.append('context_ref')
+lPackages.append('declarative_part')
+lPackages.append('element_association')
+lPackages.append('entity')
+lPackages.append('entity_specification')
+lPackages.append('exit_statement')
+lPackages.append('exponent')
+lPackages.append('file_statement')
+lPackages.append('for_loop')
+lPackages.append('for_generate_statement')
+lPackages.append('function')
+lPackages.append('generate')
+lPackages.append('generic')
+lPackages.append('generic_map')
+lPackages.append('ieee')
+lPackages.append('if_statement')
+lPackages.append('if_generate_statement')
+lPackages.append('instantiation')
+lPackages.append('iteration_scheme')
+lPackages.append('length')
+lPackages.append('library')
+lPackages.append('logical_operator')
+lPackages.append('loop_statement')
+lPackages.append('package')
+lPackages.append('package_body')
+lPackages.append('port')
+lPackages.append('port_map')
+lPackages.append('procedure')
+lPackages.append('procedure_call')
+lPackages.append('process')
+lPackages.append('ranges')
+lPackages.append('record_type_definition')
+lPackages.append('report_statement')
+lPackages.append('selected_assignment')
+lPackages.append('sequential')
+lPackages.append('signal')
+lPackages.append('source_file')
+lPackages.append('subprogram_body')
+lPackages.append('subtype')
+lPackages.append('type_definition')
+lPackages.append('use_clause')
+lPackages.append('variable')
+lPackages.append('variable_assignment')
+lPackages.append('wait')
+lPackages.append('when')
+lPackages.append('while_loop')
+lPackages.append('whitespace')
+lPackages.append('with_statement')
+
+
+def __getattr__(sName):
+    if sName in lPackages:
+        return importlib.import_module('vsg.rules.' + sName)
+    raise AttributeError('module ' + repr(__name__) + ' has no attribute ' + repr(sName))
+
+
+if sys.version_info < (3, 7):
+    for sPackage in lPackages:
+        importlib.import_module('vsg.rules.' + sPackage)
@@ -54,6 +54,9 @@ class align_tokens_in_region_between_tokens(alignment.Rule):
         self.bIncludeTillBeginningOfLine = False
         self.configuration_documentation_link = 'configuring_keyword_alignment_rules_link'
 
+    def get_required_tokens(self):
+        return [self.left_token]
+
     def analyze(self, oFile):
         lToi = oFile.get_tokens_bounded_by(self.left_token, self.right_token, bIncludeTillBeginningOfLine=self.bIncludeTillBeginningOfLine)
         for oToi in lToi:
@@ -55,6 +55,9 @@ class align_tokens_in_region_between_tokens_skipping_lines_starting_with_tokens(
         self.include_lines_without_comments = False
         self.configuration.append('include_lines_without_comments')
 
+    def get_required_tokens(self):
+        return [self.left_token]
+
     def analyze(self, oFile):
         lToi = oFile.get_tokens_bounded_by(self.left_token, self.right_token)
         for oToi in lToi:
@@ -59,6 +59,9 @@ class align_tokens_in_region_between_tokens_unless_between_tokens(alignment.Rule
         self.loop_control_statements_ends_group = False
         self.configuration.append('loop_control_statements_ends_group')
 
+    def get_required_tokens(self):
+        return [self.left_token]
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_tokens_bounded_by_unless_between(self.left_token, self.right_token, self.lUnless)
 
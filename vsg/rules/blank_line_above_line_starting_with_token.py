@@ -32,6 +32,9 @@ class blank_line_above_line_starting_with_token(blank_line.Rule):
         self.configuration.append('style')
         self.configuration_documentation_link = 'configuring_blank_lines_link'
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         if self.style == 'require_blank_line':
             return oFile.get_line_above_line_starting_with_token(self.lTokens, bIncludeComments=False)
@@ -34,6 +34,9 @@ class blank_line_below_line_ending_with_token(blank_line.Rule):
         self.style = 'require_blank_line'
         self.configuration.append('style')
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         if self.style == 'require_blank_line':
             if self.lHierarchyLimits is None:
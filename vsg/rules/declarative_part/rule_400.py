@@ -50,5 +50,8 @@ class rule_400(Rule):
         self.configuration.remove('case_control_statements_ends_group')
         self.configuration.remove('loop_control_statements_ends_group')
 
+    def get_required_tokens(self):
+        return None
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_tokens_in_declarative_parts()
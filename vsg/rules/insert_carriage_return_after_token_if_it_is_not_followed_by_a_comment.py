@@ -30,6 +30,9 @@ class insert_carriage_return_after_token_if_it_is_not_followed_by_a_comment(stru
         self.lTokens = lTokens
         self.configuration_documentation_link = None
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_n_tokens_after_token(2, self.lTokens)
 
@@ -35,6 +35,9 @@ class move_token_next_to_another_token(structure.Rule):
         self.token_to_move = token_to_move
         self.configuration_documentation_link = None
 
+    def get_required_tokens(self):
+        return [self.anchor_token]
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_tokens_bounded_by(self.anchor_token, self.token_to_move, bIncludeTillEndOfLine=True)
 
@@ -41,6 +41,9 @@ class multiline_alignment_between_tokens(alignment.Rule):
         self.override = False
         self.configuration_documentation_link = 'configuring_multiline_indent_rules_link'
 
+    def get_required_tokens(self):
+        return [lTokenPair[0] for lTokenPair in self.lTokenPairs]
+
     def _get_tokens_of_interest(self, oFile):
         lToi = []
         for lTokenPair in self.lTokenPairs:
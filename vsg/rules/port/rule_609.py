@@ -39,6 +39,9 @@ class rule_609(Rule):
         Rule.__init__(self, 'port', '609', lTokens)
         self.suffixes = ['_l']
 
+    def get_required_tokens(self):
+        return [token.port_clause.open_parenthesis]
+
     def _get_tokens_of_interest(self, oFile):
         lReturn = []
         lToi = oFile.get_interface_elements_between_tokens(token.port_clause.open_parenthesis, token.port_clause.close_parenthesis)
@@ -39,6 +39,9 @@ class remove_excessive_blank_lines_above_line_starting_with_token(blank_line.Rul
         else:
             self.lOverrides = lOverrides
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def analyze(self, oFile):
         lToi = oFile.get_blank_lines_above_line_starting_with_token(self.lTokens)
         for oToi in lToi:
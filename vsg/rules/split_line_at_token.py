@@ -28,6 +28,9 @@ class split_line_at_token(structure.Rule):
         self.lTokens = lTokens
         self.configuration_documentation_link = None
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_token_and_n_tokens_before_it(self.lTokens, 2)
 
@@ -32,6 +32,9 @@ class token_case(case.Rule):
         self.suffix_exceptions = []
         self.case_exceptions = []
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         self.case_exceptions_lower = utils.lowercase_list(self.case_exceptions)
         return oFile.get_tokens_matching(self.lTokens)
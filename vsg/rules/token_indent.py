@@ -27,6 +27,9 @@ class token_indent(indent.Rule):
         indent.Rule.__init__(self, name=name, identifier=identifier)
         self.lTokens = lTokens
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_tokens_at_beginning_of_line_matching(self.lTokens)
 
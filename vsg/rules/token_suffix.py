@@ -32,6 +32,9 @@ class token_suffix(naming.Rule):
         self.fixable = False
         self.disable = True
 
+    def get_required_tokens(self):
+        return self.lTokens
+
     def _get_tokens_of_interest(self, oFile):
         return oFile.get_tokens_matching(self.lTokens)
 
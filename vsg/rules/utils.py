@@ -80,14 +80,14 @@ def insert_whitespace(lTokens, index, num=1, sString=' '):
         insert_token(lTokens, index, parser.whitespace(' '*num))
     else:
         oToken = parser.whitespace('\t'*num)
-        oToken.has_tabs = True
+        oToken.has_tab = True
         insert_token(lTokens, index, oToken)
 
 
 def insert_new_whitespace(lTokens, index, sWhitespace):
     oToken = parser.whitespace(sWhitespace)
     if '\t' in sWhitespace:
-        oToken.has_tabs = True
+        oToken.has_tab = True
     insert_token(lTokens, index, oToken)
 
 
@@ -0,0 +1,263 @@
+
+import contextlib
+import copy
+import json
+import os
+import sys
+
+from . import apply_rules
+from . import config
+from . import rule_list
+from . import vhdlFile
+
+from .exceptions import ClassifyError
+from .exceptions import ConfigurationError
+
+iParseError = -32700
+iInvalidRequest = -32600
+iMethodNotFound = -32601
+iInvalidParams = -32602
+iInternalError = -32603
+iVsgError = -32000
+
+# Reported name of a buffer sent without a filename
+sBufferFileName = '<stdin>'
+
+
+class server():
+    '''
+    Serves check and fix requests using JSON-RPC 2.0.
+    Each request and response is a single line of JSON.
+    Configurations and their configured rules are kept between requests.
+
+    Parameters:
+
+      commandLineArguments: (argparse object)
+
+      oInput: (file object) (optional)
+
+      oOutput: (file object) (optional)
+    '''
+    def __init__(self, commandLineArguments, oInput=None, oOutput=None):
+        self.commandLineArguments = commandLineArguments
+        self.oInput = oInput or sys.stdin
+        self.oOutput = oOutput or sys.stdout
+        self.dConfigurations = {}
+        self.bRunning = True
+        self.dMethods = {}
+        self.dMethods['check'] = self.check
+        self.dMethods['fix'] = self.fix
+        self.dMethods['shutdown'] = self.shutdown
+
+    def run(self):
+        '''
+        Reads requests until the input is closed or a shutdown request is received.
+        The default configuration is loaded before the first request is read.
+        '''
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                self.get_configuration({})
+            except (ConfigurationError, OSError, SystemExit):
+                pass
+        for sLine in self.oInput:
+            if not sLine.strip():
+                continue
+            dResponse = self.handle(sLine)
+            if dResponse is not None:
+                self.oOutput.write(json.dumps(dResponse) + '\n')
+                self.oOutput.flush()
+            if not self.bRunning:
+                break
+
+    def handle(self, sLine):
+        '''
+        Returns the response to a single request or None for notifications.
+        Notifications are requests without an id, they never get a response, not even for errors.
+        Anything printed while handling the request is sent to stderr so it does not corrupt the responses.
+        '''
+        try:
+            dRequest = json.loads(sLine)
+        except ValueError as e:
+            return create_error(None, iParseError, str(e))
+
+        if not isinstance(dRequest, dict) or not isinstance(dRequest.get('method'), str):
+            return create_error(None, iInvalidRequest, 'Invalid request')
+
+        bNotification = 'id' not in dRequest
+        dResponse = self.dispatch(dRequest)
+        if bNotification:
+            return None
+        return dResponse
+
+    def dispatch(self, dRequest):
+        '''
+        Calls the method named by a request and returns its result or error response.
+        '''
+        requestId = dRequest.get('id')
+        try:
+            fMethod = self.dMethods[dRequest['method']]
+        except KeyError:
+            return create_error(requestId, iMethodNotFound, 'Method not found: ' + dRequest['method'])
+
+        dParams = dRequest.get('params', {})
+        if not isinstance(dParams, dict):
+            return create_error(requestId, iInvalidParams, 'params must be an object')
+
+        with contextlib.redirect_stdout(sys.stderr):
+            try:
+                result = fMethod(dParams)
+            except ServerError as e:
+                return create_error(requestId, e.code, e.message)
+            except (ClassifyError, ConfigurationError) as e:
+                return create_error(requestId, iVsgError, e.message)
+            except OSError as e:
+                return create_error(requestId, iVsgError, str(e))
+            except SystemExit:
+                return create_error(requestId, iVsgError, 'Invalid configuration')
+            except Exception as e:
+                return create_error(requestId, iInternalError, e.__class__.__name__ + ': ' + str(e))
+
+        return {'jsonrpc': '2.0', 'id': requestId, 'result': result}
+
+    def check(self, dParams):
+        '''
+        Checks a file or buffer and returns the violations found.
+
+        Parameters:
+
+          filename: (string) path of the file, also used in reports
+
+          text: (string) (optional) contents to check instead of the file, reported as <stdin> if filename is not given
+
+          configuration: (list of strings) (optional)
+
+          style: (string) (optional)
+
+          all_phases: (boolean) (optional)
+        '''
+        return self.process(dParams, False)
+
+    def fix(self, dParams):
+        '''
+        Fixes a file or buffer and returns the remaining violations.
+        The fixed text is returned for buffers and written back for files.
+        '''
+        return self.process(dParams, True)
+
+    def shutdown(self, dParams):
+        self.bRunning = False
+        return None
+
+    def process(self, dParams, bFix):
+        sFileName = dParams.get('filename')
+        sText = dParams.get('text')
+        if sFileName is None and sText is None:
+            raise ServerError(iInvalidParams, 'filename or text is required')
+        if sFileName is None:
+            sFileName = sBufferFileName
+
+        oArguments, oConfig, oRuleRegistry = self.get_configuration(dParams)
+
+        if sText is None:
+            lFileContent, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+            if eError is not None:
+                raise ServerError(iInvalidParams, 'Could not read file ' + sFileName)
+        else:
+            lFileContent = split_lines(sText)
+
+        oVhdlFile = vhdlFile.vhdlFile(lFileContent, sFileName, None, oArguments.cache_directory)
+        oVhdlFile.set_indent_map(oConfig.dIndent)
+        oRules = rule_list.rule_list(oVhdlFile, oConfig.severity_list, oArguments.local_rules, oRuleRegistry=oRuleRegistry)
+        apply_rules.configure_rules(oConfig, oRules, oConfig.dConfig, 0, sFileName)
+
+        dReturn = {}
+        dReturn['filename'] = sFileName
+        if bFix:
+            oRules.fix(oArguments.fix_phase, oArguments.skip_phase, oConfig.dFixOnly)
+            if sText is None:
+                apply_rules.write_vhdl_file(oVhdlFile)
+            else:
+                dReturn['text'] = '\n'.join(oVhdlFile.get_lines()[1:])
+                if sText.endswith('\n'):
+                    dReturn['text'] += '\n'
+
+        oRules.clear_violations()
+        oRules.check_rules(
+            bAllPhases=dParams.get('all_phases', self.commandLineArguments.all_phases),
+            lSkipPhase=oArguments.skip_phase,
+        )
+        dReturn['violations'] = oRules.extract_violation_dictionary()['violations']
+        dReturn['status'] = bool(oRules.violations)
+        return dReturn
+
+    def get_configuration(self, dParams):
+        '''
+        Returns the arguments, configuration and rule registry for the configuration files and style of a request.
+        They are reused until one of the configuration files changes, which replaces them.
+        '''
+        lConfiguration = dParams.get('configuration', self.commandLineArguments.configuration) or []
+        if isinstance(lConfiguration, str):
+            lConfiguration = [lConfiguration]
+        sStyle = dParams.get('style', self.commandLineArguments.style)
+        tKey = (sStyle, tuple(lConfiguration))
+        tModificationTimes = tuple([get_modification_time(sFileName) for sFileName in lConfiguration])
+        try:
+            tCachedModificationTimes, tConfiguration = self.dConfigurations[tKey]
+            if tCachedModificationTimes == tModificationTimes:
+                return tConfiguration
+        except KeyError:
+            pass
+
+        oArguments = copy.copy(self.commandLineArguments)
+        oArguments.filename = []
+        oArguments.configuration = list(lConfiguration) or None
+        oArguments.style = sStyle
+        oConfig = config.New(oArguments)
+        if oArguments.local_rules:
+            sLocalRulesPath = os.path.abspath(oArguments.local_rules)
+            if sLocalRulesPath not in sys.path:
+                sys.path.append(sLocalRulesPath)
+        oRuleRegistry = rule_list.rule_registry(oConfig, oArguments.local_rules)
+
+        tConfiguration = oArguments, oConfig, oRuleRegistry
+        self.dConfigurations[tKey] = tModificationTimes, tConfiguration
+        return tConfiguration
+
+
+class ServerError(Exception):
+
+    def __init__(self, code, message):
+        Exception.__init__(self, message)
+        self.code = code
+        self.message = message
+
+
+def create_error(requestId, iCode, sMessage):
+    return {'jsonrpc': '2.0', 'id': requestId, 'error': {'code': iCode, 'message': sMessage}}
+
+
+def split_lines(sText):
+    '''
+    Splits the text of a buffer into lines.
+    Only new lines end a line, as when a file is read, and a final new line does not start another line.
+
+    Returns: (list of strings)
+    '''
+    lReturn = sText.split('\n')
+    if lReturn[-1] == '':
+        lReturn.pop()
+    return lReturn
+
+
+def get_modification_time(sFileName):
+    try:
+        return os.path.getmtime(sFileName)
+    except OSError:
+        return None
+
+
+def run(commandLineArguments):
+    '''
+    Runs the server on stdin and stdout.
+    '''
+    server(commandLineArguments).run()
@@ -0,0 +1,31 @@
+import os
+
+import unittest
+
+from vsg import parser
+from vsg import vhdlFile
+
+
+lFile, eError = vhdlFile.utils.read_vhdlfile(os.path.join(os.path.dirname(__file__), 'code_tag_test_input.vhd'))
+oFile = vhdlFile.vhdlFile(lFile)
+
+
+class testCodeTagSharing(unittest.TestCase):
+
+    def setUp(self):
+        self.assertIsNone(eError)
+
+    def test_tokens_in_same_region_share_tags(self):
+        lTokens = oFile.get_tokens_from_line(2).get_tokens()
+        for oToken in lTokens[1:]:
+            self.assertIs(lTokens[0].code_tags, oToken.code_tags)
+        self.assertEqual(frozenset(['library_008', 'process_012']), lTokens[0].code_tags)
+
+    def test_tokens_without_tags_share_empty_tags(self):
+        lTokens = oFile.get_tokens_from_line(6).get_tokens()
+        for oToken in lTokens:
+            self.assertIs(parser.no_code_tags, oToken.code_tags)
+
+    def test_all_code_tags(self):
+        lTokens = oFile.get_tokens_from_line(10).get_tokens()
+        self.assertTrue(lTokens[0].has_code_tag('entity_001'))
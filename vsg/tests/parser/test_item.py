@@ -0,0 +1,48 @@
+import copy
+import unittest
+
+from vsg import parser
+
+from vsg.token import process_statement
+
+
+class test_item(unittest.TestCase):
+
+    def test_token_objects_do_not_have_a_dict(self):
+        self.assertFalse(hasattr(parser.item('a'), '__dict__'))
+        self.assertFalse(hasattr(parser.whitespace(' '), '__dict__'))
+        self.assertFalse(hasattr(process_statement.process_keyword('process'), '__dict__'))
+
+    def test_defaults_are_shared(self):
+        oToken1 = parser.item('a')
+        oToken2 = parser.item('b')
+        self.assertIs(oToken1.get_context(), oToken2.get_context())
+        self.assertIs(oToken1.code_tags, oToken2.code_tags)
+
+    def test_add_context_does_not_modify_other_tokens(self):
+        oToken1 = parser.item('a')
+        oToken2 = parser.item('b')
+        oToken1.add_context(['x', 'y'])
+        self.assertEqual(['x', 'y'], oToken1.get_context())
+        self.assertEqual((), oToken2.get_context())
+        self.assertEqual('y', oToken1.pop_context())
+        self.assertEqual(['x'], oToken1.get_context())
+
+    def test_optional_attributes(self):
+        oToken = parser.whitespace('\t')
+        self.assertFalse(oToken.has_tab)
+        oToken.has_tab = True
+        self.assertTrue(oToken.has_tab)
+        oToken = parser.open_parenthesis()
+        oToken.iId = 3
+        self.assertEqual(3, oToken.iId)
+        with self.assertRaises(AttributeError):
+            parser.item('a').has_tab
+
+    def test_deepcopy(self):
+        oToken = parser.comment('-- comment')
+        oToken.set_indent(2)
+        oCopy = copy.deepcopy(oToken)
+        self.assertEqual('-- comment', oCopy.get_value())
+        self.assertEqual(2, oCopy.get_indent())
+        self.assertEqual(('parser', 'comment'), oCopy.get_unique_id())
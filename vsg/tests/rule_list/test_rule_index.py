@@ -0,0 +1,45 @@
+import os
+import subprocess
+import sys
+import unittest
+
+from vsg import rule_index
+from vsg import rules
+
+
+class test_rule_index(unittest.TestCase):
+
+    def test_index_is_up_to_date(self):
+        self.assertEqual(rule_index.build(), rule_index.read(), 'Run bin/vsg_rule_index_gen to update vsg/rules/rule_index.json')
+
+    def test_load_rules(self):
+        lRules = rule_index.load_rules(['entity_008', 'after_001'])
+        self.assertEqual(['after_001', 'entity_008'], [oRule.unique_id for oRule in lRules])
+        self.assertEqual(len(rule_index.get_rule_names()), len(rule_index.load_rules()))
+
+    def test_disabled_rules_are_not_loaded_by_default(self):
+        lRuleNames = rule_index.get_rules_to_load({})
+        self.assertIn('entity_008', lRuleNames)
+        self.assertNotIn('after_001', lRuleNames)
+        self.assertNotIn('after_002', lRuleNames)
+
+    def test_disabled_rules_referenced_by_configuration(self):
+        lRuleNames = rule_index.get_rules_to_load({'rule': {'after_001': {'disable': False}}})
+        self.assertIn('after_001', lRuleNames)
+        self.assertNotIn('after_002', lRuleNames)
+
+        lRuleNames = rule_index.get_rules_to_load({'rule': {'group': {'alignment': {'disable': False}}}})
+        self.assertIn('after_002', lRuleNames)
+        self.assertNotIn('after_001', lRuleNames)
+
+        dConfig = {'file_list': [{'a.vhd': {'rule': {'after_003': {'disable': False}}}}, 'b.vhd']}
+        self.assertIn('after_003', rule_index.get_rules_to_load(dConfig))
+
+        lRuleNames = rule_index.get_rules_to_load({'rule': {'global': {'disable': False}}})
+        self.assertEqual(rule_index.get_rule_names(), lRuleNames)
+
+    def test_packages_are_imported_without_module_getattr(self):
+        sProgram = 'import sys\nsys.version_info = (3, 6, 0)\nimport vsg.rules\nprint(len([sPackage for sPackage in vsg.rules.lPackages if "vsg.rules." + sPackage in sys.modules]))\n'
+        sDirectory = os.path.join(os.path.dirname(__file__), '..', '..', '..')
+        sOutput = subprocess.check_output([sys.executable, '-c', sProgram], cwd=sDirectory, universal_newlines=True)
+        self.assertEqual(len(rules.lPackages), int(sOutput))
@@ -4,6 +4,7 @@ import json
 from vsg import vhdlFile
 from vsg import rule_list
 from vsg import severity
+from vsg import config
 
 from vsg.tests import utils
 
@@ -37,3 +38,131 @@ class testVsg(unittest.TestCase):
         with open('vsg/tests/rule_list/extract_violation_dictionary_w_all_phases_enabled.json') as jsonFile:
             dExpected = json.load(jsonFile)
         self.assertEqual(dExpected, oRules.extract_violation_dictionary())
+
+    def test_get_list_of_rule_names(self):
+        lFile = []
+        utils.read_file('vsg/tests/styles/code_examples/spi_master.vhd', lFile)
+        oFile = vhdlFile.vhdlFile(lFile)
+        oRules = rule_list.rule_list(oFile, oSeverityList)
+        lRuleNames = oRules.get_list_of_rule_names()
+        self.assertEqual(sorted(set(lRuleNames)), sorted(lRuleNames))
+        self.assertIn('after_001', lRuleNames)
+        self.assertIn('entity_008', lRuleNames)
+
+
+class test_rule_registry(unittest.TestCase):
+
+    def setUp(self):
+        lFile = []
+        utils.read_file('vsg/tests/styles/code_examples/spi_master.vhd', lFile)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+        self.oFile.set_indent_map(dIndentMap)
+        self.oConfig = config.config()
+        self.oConfig.dConfig = {'rule': {'entity_008': {'case': 'upper'}}}
+        self.oRegistry = rule_list.rule_registry(self.oConfig)
+
+    def get_rule(self, oRules, sName):
+        for oRule in oRules.rules:
+            if oRule.unique_id == sName:
+                return oRule
+
+    def test_rules_are_shared_and_configured_once(self):
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=self.oRegistry)
+        oRules.configure(self.oConfig)
+        self.assertTrue(self.oRegistry.is_configured_with(self.oConfig))
+        oRule = self.get_rule(oRules, 'entity_008')
+        self.assertEqual('upper', oRule.case)
+
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=self.oRegistry)
+        self.assertIs(oRule, self.get_rule(oRules, 'entity_008'))
+
+    def test_reset_restores_file_configuration_and_clears_violations(self):
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=self.oRegistry)
+        oRules.configure(self.oConfig)
+        oFileConfig = config.config()
+        oFileConfig.dConfig = {'rule': {'entity_008': {'case': 'lower'}, 'architecture_004': {'disable': True}}}
+        oRules.configure(oFileConfig)
+        self.assertEqual('lower', self.get_rule(oRules, 'entity_008').case)
+        self.assertTrue(self.get_rule(oRules, 'architecture_004').disable)
+        oRules.check_rules()
+        self.assertTrue(oRules.violations)
+
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=self.oRegistry)
+        self.assertEqual('upper', self.get_rule(oRules, 'entity_008').case)
+        self.assertFalse(self.get_rule(oRules, 'architecture_004').disable)
+        for oRule in oRules.rules:
+            self.assertEqual([], oRule.violations)
+
+    def test_reset_restores_lists_changed_in_place(self):
+        oConfig = config.config()
+        oConfig.dConfig = {'rule': {'signal_008': {'disable': False}}}
+        oRegistry = rule_list.rule_registry(oConfig)
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=oRegistry)
+        oRules.configure(oConfig)
+        oFileConfig = config.config()
+        oFileConfig.dConfig = {'rule': {'signal_008': {'prefixes': ['sig_']}}}
+        oRules.configure(oFileConfig)
+        oRule = self.get_rule(oRules, 'signal_008')
+        oRule.prefixes.append('x_')
+        oRule.configuration.append('new_option')
+        self.assertEqual(['sig_', 'x_'], oRule.prefixes)
+
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=oRegistry)
+        oRule = self.get_rule(oRules, 'signal_008')
+        self.assertEqual(['s_'], oRule.prefixes)
+        self.assertNotIn('new_option', oRule.configuration)
+
+        oRules.configure(oFileConfig)
+        oRule.prefixes.append('y_')
+        oRules = rule_list.rule_list(self.oFile, oSeverityList, oRuleRegistry=oRegistry)
+        self.assertEqual(['s_'], self.get_rule(oRules, 'signal_008').prefixes)
+
+    def test_copy_value(self):
+        oObject = object()
+        lValue = [['a'], {'b': [oObject]}, set(['c'])]
+        lCopy = rule_list.copy_value(lValue)
+        self.assertEqual(lValue, lCopy)
+        self.assertIsNot(lValue[0], lCopy[0])
+        self.assertIsNot(lValue[1]['b'], lCopy[1]['b'])
+        self.assertIsNot(lValue[2], lCopy[2])
+        self.assertIs(oObject, lCopy[1]['b'][0])
+
+    def test_is_for(self):
+        oConfig = config.config()
+        oConfig.dConfig = {'rule': {'entity_008': {'case': 'upper'}}}
+        self.assertTrue(self.oRegistry.is_for(oConfig, None))
+        self.assertFalse(self.oRegistry.is_for(oConfig, 'vsg/tests/rule_list/local_rules'))
+        oConfig.dConfig = {'rule': {'entity_008': {'case': 'lower'}}}
+        self.assertFalse(self.oRegistry.is_for(oConfig, None))
+
+
+class test_has_required_tokens(unittest.TestCase):
+
+    def setUp(self):
+        lFile = []
+        utils.read_file('vsg/tests/package/rule_001_test_input.vhd', lFile)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+        self.oFile.set_indent_map(dIndentMap)
+        self.oRules = rule_list.rule_list(self.oFile, oSeverityList)
+
+    def get_rule(self, sName):
+        for oRule in self.oRules.rules:
+            if oRule.unique_id == sName:
+                return oRule
+
+    def test_rule_with_tokens_in_file(self):
+        self.assertTrue(rule_list.has_required_tokens(self.get_rule('package_004'), self.oFile))
+
+    def test_rule_without_tokens_in_file(self):
+        self.assertFalse(rule_list.has_required_tokens(self.get_rule('process_004'), self.oFile))
+        self.assertFalse(rule_list.has_required_tokens(self.get_rule('port_600'), self.oFile))
+
+    def test_rule_without_required_tokens(self):
+        oRule = self.get_rule('length_001')
+        self.assertIsNone(oRule.get_required_tokens())
+        self.assertTrue(rule_list.has_required_tokens(oRule, self.oFile))
+
+    def test_skipped_rules_are_counted(self):
+        self.oRules.check_rules(bAllPhases=True)
+        iEnabled = len(rule_list.filter_out_disabled_rules(self.oRules.rules))
+        self.assertEqual(iEnabled, self.oRules.get_number_of_rules_ran())
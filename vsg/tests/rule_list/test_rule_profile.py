@@ -0,0 +1,72 @@
+import unittest
+
+from vsg import rule_list
+from vsg import rule_profile
+from vsg import severity
+from vsg import vhdlFile
+
+from vsg.tests import utils
+
+dIndentMap = utils.read_indent_file()
+
+oSeverityList = severity.create_list({})
+
+
+def create_rule_list():
+    lFile = []
+    utils.read_file('vsg/tests/styles/code_examples/spi_master.vhd', lFile)
+    oFile = vhdlFile.vhdlFile(lFile)
+    oFile.set_indent_map(dIndentMap)
+    return rule_list.rule_list(oFile, oSeverityList)
+
+
+class test_rule_profile(unittest.TestCase):
+
+    def test_check_rules(self):
+        oRules = create_rule_list()
+        oProfile = rule_profile.rule_profile()
+        oRules.check_rules(bAllPhases=True, oRuleProfile=oProfile)
+        lMeasurements = oProfile.get_rules()
+        self.assertEqual(oRules.get_number_of_rules_ran(), len(lMeasurements))
+        for oRule in oRules.rules:
+            try:
+                dMeasurement = oProfile.dRules[(oRule.unique_id, 'check')]
+            except KeyError:
+                continue
+            self.assertEqual(1, dMeasurement['calls'])
+            self.assertEqual(len(oRule.violations), dMeasurement['violations'])
+            self.assertEqual(oRule.phase, dMeasurement['phase'])
+            self.assertEqual(0, dMeasurement['token_map_updates'])
+        lTimes = [dMeasurement['time'] for dMeasurement in lMeasurements]
+        self.assertEqual(sorted(lTimes, reverse=True), lTimes)
+        self.assertEqual(sum([len(oRule.violations) for oRule in oRules.rules]), sum([dPhase['violations'] for dPhase in oProfile.get_phases()]))
+
+    def test_fix(self):
+        oRules = create_rule_list()
+        oProfile = rule_profile.rule_profile()
+        oRules.fix(oRuleProfile=oProfile)
+        dMeasurement = oProfile.dRules[('sequential_001', 'fix')]
+        self.assertEqual(1, dMeasurement['token_map_updates'])
+        self.assertNotEqual(0, dMeasurement['violations'])
+        self.assertTrue(all([dMeasurement['stage'] == 'fix' for dMeasurement in oProfile.get_rules()]))
+
+    def test_merge(self):
+        oRules = create_rule_list()
+        oProfile = rule_profile.rule_profile()
+        oRules.check_rules(oRuleProfile=oProfile)
+        oTotal = rule_profile.rule_profile()
+        oTotal.merge(oProfile)
+        oTotal.merge(oProfile)
+        dMeasurement = oTotal.dRules[('whitespace_001', 'check')]
+        self.assertEqual(2, dMeasurement['calls'])
+        self.assertEqual(2 * oProfile.dRules[('whitespace_001', 'check')]['violations'], dMeasurement['violations'])
+
+    def test_get_table(self):
+        oRules = create_rule_list()
+        oProfile = rule_profile.rule_profile()
+        oRules.check_rules(oRuleProfile=oProfile)
+        lTable = oProfile.get_table()
+        self.assertEqual('Rule profile', lTable[1])
+        self.assertTrue(lTable[3].startswith('Rule'))
+        self.assertTrue(lTable[-1].startswith('Total time (s) : '))
+        self.assertEqual(['rules', 'phases'], list(oProfile.get_dictionary().keys()))
@@ -0,0 +1,193 @@
+import os
+
+import unittest
+
+from vsg import parser
+from vsg import token_map
+from vsg import vhdlFile
+
+from vsg.token import logical_operator
+
+
+sFileName = os.path.join(os.path.dirname(__file__), '..', 'styles', 'code_examples', 'spi_master.vhd')
+
+
+class test_token_map_update(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def splice(self, iStart, iEnd, lTokens):
+        self.oFile.lAllObjects[iStart:iEnd] = lTokens
+        self.oFile.oTokenMap.update(iStart, iEnd, lTokens)
+        oExpected = token_map.process_tokens(self.oFile.lAllObjects)
+        self.assertEqual(oExpected.dMap, self.oFile.oTokenMap.dMap)
+        self.assertEqual(oExpected.aTypeIds, self.oFile.oTokenMap.aTypeIds)
+
+    def test_replace_with_same_number_of_tokens(self):
+        self.splice(10, 12, [parser.whitespace(' '), parser.todo('a')])
+
+    def test_insert_tokens(self):
+        self.splice(20, 20, [parser.whitespace(' '), parser.comma(), parser.carriage_return()])
+
+    def test_remove_tokens(self):
+        self.splice(30, 45, [])
+
+    def test_remove_all_tokens_of_a_type(self):
+        lIndexes = self.oFile.oTokenMap.get_token_indexes(parser.carriage_return, bCopy=True)
+        iStart = lIndexes[0]
+        iEnd = lIndexes[-1] + 1
+        self.splice(iStart, iEnd, [parser.todo('a')])
+        self.assertEqual([], self.oFile.oTokenMap.get_token_indexes(parser.carriage_return))
+
+    def test_insert_new_token_type(self):
+        self.splice(5, 6, [logical_operator.and_operator('and')])
+        self.assertIn(5, self.oFile.oTokenMap.get_token_indexes(logical_operator.and_operator))
+        self.assertIn(5, self.oFile.oTokenMap.get_token_indexes(logical_operator.logical_operator))
+
+
+class test_extract_token_keys(unittest.TestCase):
+
+    def test_comma(self):
+        self.assertEqual([('parser', 'comma')], token_map.extract_token_keys(parser.comma()))
+
+    def test_logical_operator(self):
+        lExpected = [('logical_operator', 'and_operator'), ('logical_operator', 'logical_operator')]
+        self.assertEqual(lExpected, token_map.extract_token_keys(logical_operator.and_operator('and')))
+
+
+class test_token_index_set(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def test_is_token_at_index(self):
+        oTokenMap = self.oFile.oTokenMap
+        for iIndex, oToken in enumerate(self.oFile.lAllObjects):
+            bExpected = isinstance(oToken, parser.carriage_return)
+            self.assertEqual(bExpected, oTokenMap.is_token_at_index(parser.carriage_return, iIndex))
+
+    def test_set_is_invalidated_by_update(self):
+        oTokenMap = self.oFile.oTokenMap
+        iIndex = oTokenMap.get_token_indexes(parser.carriage_return)[0]
+        self.assertTrue(oTokenMap.is_token_at_index_whitespace(iIndex))
+        self.oFile.lAllObjects[iIndex:iIndex] = [parser.todo('a')]
+        oTokenMap.update(iIndex, iIndex, [parser.todo('a')])
+        self.assertFalse(oTokenMap.is_token_at_index_whitespace(iIndex))
+        self.assertTrue(oTokenMap.is_token_at_index_whitespace(iIndex + 1))
+
+    def test_unknown_token_type(self):
+        self.assertFalse(self.oFile.oTokenMap.is_token_at_index(parser.todo, 0))
+
+
+class test_has_token(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def test_has_token(self):
+        oTokenMap = self.oFile.oTokenMap
+        self.assertTrue(oTokenMap.has_token(parser.carriage_return))
+        self.assertFalse(oTokenMap.has_token(logical_operator.xnor_operator))
+        self.assertFalse(oTokenMap.has_token(None))
+
+    def test_has_any_token(self):
+        oTokenMap = self.oFile.oTokenMap
+        self.assertTrue(oTokenMap.has_any_token([logical_operator.xnor_operator, parser.carriage_return]))
+        self.assertFalse(oTokenMap.has_any_token([logical_operator.xnor_operator]))
+        self.assertFalse(oTokenMap.has_any_token([]))
+
+    def test_token_type_removed_by_update(self):
+        oTokenMap = self.oFile.oTokenMap
+        lIndexes = oTokenMap.get_token_indexes(parser.carriage_return, bCopy=True)
+        iStart = lIndexes[0]
+        iEnd = lIndexes[-1] + 1
+        self.oFile.lAllObjects[iStart:iEnd] = [logical_operator.xnor_operator('xnor')]
+        oTokenMap.update(iStart, iEnd, [logical_operator.xnor_operator('xnor')])
+        self.assertFalse(oTokenMap.has_token(parser.carriage_return))
+        self.assertTrue(oTokenMap.has_token(logical_operator.xnor_operator))
+
+
+class test_type_id_array(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def test_unique_id_at_index(self):
+        oTokenMap = self.oFile.oTokenMap
+        for iIndex, oToken in enumerate(self.oFile.lAllObjects):
+            self.assertEqual(oToken.get_unique_id(), oTokenMap.get_unique_id_at_index(iIndex))
+        self.assertEqual((None, None), oTokenMap.get_unique_id_at_index(-1))
+        self.assertEqual((None, None), oTokenMap.get_unique_id_at_index(len(self.oFile.lAllObjects)))
+
+    def test_get_index_of_next_non_whitespace_token(self):
+        oTokenMap = self.oFile.oTokenMap
+        lTokens = self.oFile.lAllObjects
+        lWhitespace = (parser.whitespace, parser.carriage_return, parser.blank_line)
+        for iIndex in range(0, len(lTokens)):
+            iExpected = None
+            for iSearch in range(iIndex + 1, min(iIndex + 5, len(lTokens))):
+                if not isinstance(lTokens[iSearch], lWhitespace):
+                    iExpected = iSearch
+                    break
+            self.assertEqual(iExpected, oTokenMap.get_index_of_next_non_whitespace_token(iIndex))
+
+    def test_get_index_of_previous_non_whitespace_token(self):
+        oTokenMap = self.oFile.oTokenMap
+        iIndex = oTokenMap.get_token_indexes(parser.carriage_return)[-2]
+        iExpected = iIndex - 1
+        while isinstance(self.oFile.lAllObjects[iExpected], (parser.whitespace, parser.carriage_return, parser.blank_line, parser.comment)):
+            iExpected -= 1
+        self.assertEqual(iExpected, oTokenMap.get_index_of_previous_non_whitespace_token(iIndex))
+
+
+class test_extract_unique_id(unittest.TestCase):
+
+    def test_class(self):
+        self.assertEqual(('logical_operator', 'and_operator'), token_map.extract_unique_id(logical_operator.and_operator))
+
+    def test_object(self):
+        self.assertEqual(('parser', 'comma'), token_map.extract_unique_id(parser.comma()))
+
+    def test_class_without_docstring(self):
+
+        class no_docstring(parser.item):
+            pass
+
+        self.assertEqual((None, None), token_map.extract_unique_id(no_docstring))
+        self.assertEqual((None, None), no_docstring('a').get_unique_id())
+
+    def test_non_token(self):
+        self.assertEqual((None, None), token_map.extract_unique_id(1))
+
+
+class test_token_pair_indexes(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = vhdlFile.utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def test_extract_start_end_indexes(self):
+        self.assertEqual(([1, 2, 5], [3, 4, 6]), token_map.extract_start_end_indexes([1, 2, 5], [3, 4, 6]))
+        self.assertEqual(([2, 5], [3, 6]), token_map.extract_start_end_indexes([1, 2, 5], [0, 3, 6]))
+        self.assertEqual(([4], [4]), token_map.extract_start_end_indexes([4], [4]))
+        self.assertEqual(([], []), token_map.extract_start_end_indexes([7], [3]))
+
+    def test_pairs_are_memoized_until_update(self):
+        oTokenMap = self.oFile.oTokenMap
+        lStart, lEnd = oTokenMap.get_token_pair_indexes(parser.open_parenthesis, parser.close_parenthesis)
+        lStart.clear()
+        lStart, lEnd = oTokenMap.get_token_pair_indexes(parser.open_parenthesis, parser.close_parenthesis)
+        self.assertNotEqual([], lStart)
+        self.assertEqual(1, len(oTokenMap.dPairs))
+
+        iIndex = lStart[0]
+        self.oFile.lAllObjects[iIndex:iIndex] = [parser.whitespace(' ')]
+        oTokenMap.update(iIndex, iIndex, [parser.whitespace(' ')])
+        self.assertEqual({}, oTokenMap.dPairs)
+        lNewStart, lNewEnd = oTokenMap.get_token_pair_indexes(parser.open_parenthesis, parser.close_parenthesis)
+        self.assertEqual([iStart + 1 for iStart in lStart], lNewStart)
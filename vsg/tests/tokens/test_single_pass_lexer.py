@@ -0,0 +1,32 @@
+import glob
+import os
+import unittest
+
+from vsg import tokens
+from vsg.vhdlFile import utils
+
+
+sTestDir = os.path.join(os.path.dirname(__file__), '..')
+
+
+class testSinglePassLexer(unittest.TestCase):
+
+    def test_matches_multi_pass_on_test_files(self):
+        for sFileName in glob.glob(os.path.join(sTestDir, '**', '*.vhd*'), recursive=True):
+            lLines, eError = utils.read_vhdlfile(sFileName)
+            for iLine, sLine in enumerate(lLines):
+                sLine = sLine.rstrip('\n').rstrip('\r')
+                self.assertEqual(tokens.create_multi_pass(sLine), tokens.create(sLine), sFileName + ':' + str(iLine + 1))
+
+    def test_matches_multi_pass_on_corner_cases(self):
+        lLines = []
+        lLines.append('')
+        lLines.append('   ')
+        lLines.append('a <= "--" & \'"\'; -- "b"')
+        lLines.append("a <= '1''a'b'c';")
+        lLines.append('x := 1.5e3 + 2E-4;')
+        lLines.append('-- comment with trailing whitespace \t ')
+        lLines.append('\\extended identifier\\ <= "a";')
+        lLines.append('a<=>b?/=c/**/d;')
+        for sLine in lLines:
+            self.assertEqual(tokens.create_multi_pass(sLine), tokens.create(sLine), sLine)
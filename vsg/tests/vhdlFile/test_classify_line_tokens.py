@@ -0,0 +1,42 @@
+import glob
+import importlib
+import os
+import unittest
+
+from vsg import tokens
+from vsg.vhdlFile import utils
+
+vhdlFile = importlib.import_module('vsg.vhdlFile.vhdlFile')
+
+
+sTestDir = os.path.join(os.path.dirname(__file__), '..')
+
+
+def describe(lObjects):
+    lReturn = []
+    for oObject in lObjects:
+        lReturn.append((type(oObject), oObject.get_value(), getattr(oObject, 'has_tab', None)))
+    return lReturn
+
+
+class test_classify_line_tokens(unittest.TestCase):
+
+    def test_matches_classify_line_on_test_files(self):
+        lOpenPragmas = ['--vhdl_comp_off']
+        lClosePragmas = ['--vhdl_comp_on']
+        for sFileName in glob.glob(os.path.join(sTestDir, '**', '*.vhd*'), recursive=True):
+            lLines, eError = utils.read_vhdlfile(sFileName)
+            oOptions = vhdlFile.options()
+            dExpectedVars = {'pragma': False}
+            dActualVars = {'pragma': False}
+            for iLine, sLine in enumerate(lLines):
+                lTokens = tokens.create(sLine.rstrip('\n').rstrip('\r'))
+                if vhdlFile.line_requires_classification_passes(lTokens, oOptions):
+                    vhdlFile.classify_line(lTokens, oOptions, lOpenPragmas, lClosePragmas, dExpectedVars)
+                    dActualVars['pragma'] = dExpectedVars['pragma']
+                    continue
+                lExpected = vhdlFile.classify_line(lTokens, oOptions, lOpenPragmas, lClosePragmas, dExpectedVars)
+                lActual = []
+                vhdlFile.classify_line_tokens(lTokens, lActual, lOpenPragmas, lClosePragmas, dActualVars)
+                self.assertEqual(describe(lExpected), describe(lActual), sFileName + ':' + str(iLine + 1))
+                self.assertEqual(dExpectedVars, dActualVars)
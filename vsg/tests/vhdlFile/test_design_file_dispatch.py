@@ -0,0 +1,43 @@
+import glob
+import os
+import unittest
+from unittest import mock
+
+from vsg import vhdlFile
+from vsg.vhdlFile import utils
+from vsg.vhdlFile.classify import design_file
+from vsg.vhdlFile.classify import design_unit
+from vsg.vhdlFile.classify import entity_declaration
+from vsg.vhdlFile.classify import package_body
+from vsg.vhdlFile.classify import package_declaration
+from vsg.vhdlFile.classify import package_instantiation_declaration
+
+
+sTestDir = os.path.dirname(__file__)
+
+
+def tokenize_with_design_unit(lObjects):
+    iReturn = 0
+    for iCurrent in range(0, len(lObjects)):
+        if iCurrent >= iReturn and utils.is_item(lObjects, iCurrent):
+            iReturn = design_unit.detect(iCurrent, lObjects)
+
+
+def describe(oFile):
+    return [(type(oObject), oObject.get_value()) for oObject in oFile.lAllObjects]
+
+
+class test_design_file_dispatch(unittest.TestCase):
+
+    def test_get_detectors(self):
+        self.assertEqual((entity_declaration,), design_file.get_detectors('entity'))
+        self.assertEqual((package_declaration, package_instantiation_declaration, package_body), design_file.get_detectors('package'))
+        self.assertEqual((), design_file.get_detectors('signal'))
+
+    def test_matches_design_unit_detection(self):
+        for sFileName in glob.glob(os.path.join(sTestDir, '*', 'classification_test_input.vhd')):
+            lLines, eError = utils.read_vhdlfile(sFileName)
+            oExpected = vhdlFile.vhdlFile(lLines)
+            with mock.patch.object(design_file, 'tokenize', tokenize_with_design_unit):
+                oActual = vhdlFile.vhdlFile(lLines)
+            self.assertEqual(describe(oExpected), describe(oActual), sFileName)
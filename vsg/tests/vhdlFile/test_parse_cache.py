@@ -0,0 +1,89 @@
+import glob
+import marshal
+import os
+import shutil
+import tempfile
+import unittest
+
+from vsg import vhdlFile
+from vsg.vhdlFile import parse_cache
+from vsg.vhdlFile import utils
+
+
+sFileName = os.path.join(os.path.dirname(__file__), '..', 'styles', 'code_examples', 'spi_master.vhd')
+sCodeExamples = os.path.join(os.path.dirname(__file__), '..', 'styles', 'code_examples', '*.vhd')
+
+
+def get_state(oToken):
+    lReturn = [type(oToken)]
+    for sSlot in parse_cache.get_slots(type(oToken)):
+        value = getattr(oToken, sSlot, 'unset')
+        lReturn.append((sSlot, type(value), value))
+    return lReturn
+
+
+class test_parse_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def test_encode_and_decode(self):
+        for sFile in sorted(glob.glob(sCodeExamples)):
+            lFile, eError = utils.read_vhdlfile(sFile)
+            oFile = vhdlFile.vhdlFile(lFile, sFile)
+            lActual = parse_cache.decode(parse_cache.encode(oFile.lAllObjects), sFile)
+            self.assertEqual([get_state(oToken) for oToken in oFile.lAllObjects], [get_state(oToken) for oToken in lActual])
+
+    def test_vhdlFile_reads_from_cache(self):
+        lFile, eError = utils.read_vhdlfile(sFileName)
+        oExpected = vhdlFile.vhdlFile(lFile, sFileName)
+        oFirst = vhdlFile.vhdlFile(lFile, sFileName, sCacheDirectory=self.sDirectory)
+        self.assertIsNotNone(parse_cache.read(self.sDirectory, parse_cache.get_key(lFile)))
+        oSecond = vhdlFile.vhdlFile(lFile, sFileName, sCacheDirectory=self.sDirectory)
+        self.assertEqual([get_state(oToken) for oToken in oExpected.lAllObjects], [get_state(oToken) for oToken in oFirst.lAllObjects])
+        self.assertEqual([get_state(oToken) for oToken in oExpected.lAllObjects], [get_state(oToken) for oToken in oSecond.lAllObjects])
+        self.assertEqual(oExpected.get_lines(), oSecond.get_lines())
+
+    def test_decode_shares_code_tags(self):
+        lFile = []
+        lFile.append('-- vsg_off entity_001\n')
+        lFile.append('entity FIFO is\n')
+        lFile.append('end entity FIFO;\n')
+        lFile.append('-- vsg_on\n')
+        oFile = vhdlFile.vhdlFile(lFile)
+        lActual = parse_cache.decode(parse_cache.encode(oFile.lAllObjects))
+        lTags = [oToken.code_tags for oToken in lActual if oToken.code_tags]
+        self.assertTrue(lTags)
+        for fTags in lTags:
+            self.assertIs(lTags[0], fTags)
+        lExpected = [oToken.code_tags for oToken in oFile.lAllObjects if oToken.code_tags]
+        self.assertIs(lExpected[0], lTags[0])
+
+    def test_key_depends_on_line_boundaries(self):
+        self.assertNotEqual(parse_cache.get_key(['ab\n', 'c\n']), parse_cache.get_key(['a\n', 'bc\n']))
+
+    def test_tampered_data(self):
+        lFile, eError = utils.read_vhdlfile(sFileName)
+        oFile = vhdlFile.vhdlFile(lFile, sFileName)
+        iFormat, lClasses, lClassIds, lValues, dAttributes = marshal.loads(parse_cache.encode(oFile.lAllObjects))
+        lTampered = []
+        lTampered.append((iFormat, [('os', 'system')] + lClasses[1:], lClassIds, lValues, dAttributes))
+        lTampered.append((iFormat, [('vsg.token.this_module_does_not_exist', 'keyword')] + lClasses[1:], lClassIds, lValues, dAttributes))
+        lTampered.append((iFormat, [('vsg.parser', 'os')] + lClasses[1:], lClassIds, lValues, dAttributes))
+        lTampered.append((iFormat, [('vsg.parser', 'item.__init__')] + lClasses[1:], lClassIds, lValues, dAttributes))
+        lTampered.append((iFormat, [('vsg.parser',)] + lClasses[1:], lClassIds, lValues, dAttributes))
+        lTampered.append((iFormat, lClasses, lClassIds + [len(lClasses)], lValues + ['x'], dAttributes))
+        lTampered.append((iFormat, lClasses, lClassIds, lValues[1:], dAttributes))
+        lTampered.append((iFormat, lClasses, lClassIds, lValues, {len(lValues): {'indent': 1}}))
+        lTampered.append((iFormat, lClasses, lClassIds, lValues, {0: {'undefined_attribute': 1}}))
+        lTampered.append((iFormat, lClasses, lClassIds, lValues, {0: {'__class__': 1}}))
+        lTampered.append((iFormat, lClasses, lClassIds, lValues, []))
+        for tTampered in lTampered:
+            self.assertIsNone(parse_cache.decode(marshal.dumps(tTampered)), tTampered[1][0:1])
+
+    def test_invalid_data(self):
+        self.assertIsNone(parse_cache.decode(b'invalid'))
+        self.assertIsNone(parse_cache.read(self.sDirectory, 'abcd'))
@@ -0,0 +1,61 @@
+import os
+import shutil
+import tempfile
+import tracemalloc
+import unittest
+
+from vsg import vhdlFile
+from vsg.vhdlFile import utils
+
+
+sFileName = os.path.join(os.path.dirname(__file__), '..', 'styles', 'code_examples', 'spi_master.vhd')
+
+lStages = []
+lStages.append('lex')
+lStages.append('classify')
+lStages.append('design_file.tokenize')
+lStages.append('post_token_assignments')
+lStages.append('combine_use_clause_selected_name')
+lStages.append('set_token_hierarchy_value')
+lStages.append('set_aggregate_tokens')
+lStages.append('process_tokens')
+
+
+class test_parse_profile(unittest.TestCase):
+
+    def setUp(self):
+        self.lFile, eError = utils.read_vhdlfile(sFileName)
+
+    def test_not_profiled_by_default(self):
+        oFile = vhdlFile.vhdlFile(self.lFile, sFileName)
+        self.assertIsNone(oFile.oParseProfile)
+
+    def test_stages(self):
+        oFile = vhdlFile.vhdlFile(self.lFile, sFileName, bProfile=True)
+        oProfile = oFile.oParseProfile
+        self.assertEqual(lStages, [dStage['stage'] for dStage in oProfile.lStages])
+        self.assertEqual(len(oFile.lAllObjects), oProfile.lStages[-1]['tokens'])
+        self.assertTrue(oProfile.lStages[0]['tokens'] > 0)
+        self.assertEqual([None] * len(lStages), [dStage['peak_memory'] for dStage in oProfile.lStages])
+        self.assertIsNone(oProfile.get_peak_memory())
+        self.assertEqual(sFileName, oProfile.get_dictionary()['filename'])
+
+    def test_memory(self):
+        oFile = vhdlFile.vhdlFile(self.lFile, sFileName, bProfileMemory=True)
+        oProfile = oFile.oParseProfile
+        self.assertTrue(oProfile.get_peak_memory() > 0)
+        self.assertFalse(tracemalloc.is_tracing())
+        lTable = oProfile.get_table()
+        self.assertEqual('Parse profile: ' + sFileName, lTable[1])
+        self.assertTrue(lTable[-2].startswith('Total'))
+
+    def test_cached_file(self):
+        sDirectory = tempfile.mkdtemp()
+        try:
+            vhdlFile.vhdlFile(self.lFile, sFileName, sCacheDirectory=sDirectory, bProfile=True)
+            oFile = vhdlFile.vhdlFile(self.lFile, sFileName, sCacheDirectory=sDirectory, bProfile=True)
+        finally:
+            shutil.rmtree(sDirectory)
+        lStages = oFile.oParseProfile.lStages
+        self.assertEqual(['parse_cache.read', 'process_tokens'], [dStage['stage'] for dStage in lStages])
+        self.assertEqual(len(oFile.lAllObjects), lStages[0]['tokens'])
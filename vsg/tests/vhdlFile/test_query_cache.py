@@ -0,0 +1,55 @@
+import os
+import unittest
+
+from vsg import parser
+from vsg import vhdlFile
+from vsg import violation
+from vsg.token import process_statement
+from vsg.vhdlFile import utils
+
+
+sFileName = os.path.join(os.path.dirname(__file__), '..', 'styles', 'code_examples', 'spi_master.vhd')
+
+
+class test_query_cache(unittest.TestCase):
+
+    def setUp(self):
+        lFile, eError = utils.read_vhdlfile(sFileName)
+        self.oFile = vhdlFile.vhdlFile(lFile)
+
+    def test_repeated_query_is_a_hit(self):
+        lExpected = self.oFile.get_tokens_bounded_by(process_statement.open_parenthesis, process_statement.close_parenthesis)
+        lActual = self.oFile.get_tokens_bounded_by(process_statement.open_parenthesis, process_statement.close_parenthesis)
+        self.assertEqual({'hits': 1, 'misses': 1, 'entries': 1}, self.oFile.get_query_cache_statistics())
+        self.assertEqual([oToi.get_tokens() for oToi in lExpected], [oToi.get_tokens() for oToi in lActual])
+        self.assertEqual([oToi.get_start_index() for oToi in lExpected], [oToi.get_start_index() for oToi in lActual])
+
+    def test_different_arguments_are_separate_entries(self):
+        self.oFile.get_tokens_matching([parser.comma])
+        self.oFile.get_tokens_matching([parser.open_parenthesis])
+        self.oFile.get_tokens_bounded_by(process_statement.open_parenthesis, process_statement.close_parenthesis, include_trailing_whitespace=True)
+        self.assertEqual({'hits': 0, 'misses': 3, 'entries': 3}, self.oFile.get_query_cache_statistics())
+
+    def test_results_are_copies(self):
+        lToi = self.oFile.get_tokens_matching([parser.comma])
+        iNumTokens = len(lToi[0].get_tokens())
+        lToi[0].get_tokens().append(parser.whitespace(' '))
+        lToi[0].set_meta_data('key', 'value')
+        lToi.pop()
+        lToi = self.oFile.get_tokens_matching([parser.comma])
+        self.assertEqual(iNumTokens, len(lToi[0].get_tokens()))
+        self.assertEqual({}, lToi[0].dMetaData)
+        self.assertEqual(lToi[0].get_tokens()[0], self.oFile.lAllObjects[lToi[0].get_start_index()])
+
+    def test_cache_is_cleared_when_file_changes(self):
+        for sMethod in ['update_token_map', 'fix_blank_lines', 'fix_trailing_whitespace']:
+            self.oFile.get_tokens_matching([parser.comma])
+            self.assertEqual(1, self.oFile.get_query_cache_statistics()['entries'])
+            getattr(self.oFile, sMethod)()
+            self.assertEqual(0, self.oFile.get_query_cache_statistics()['entries'])
+
+    def test_cache_is_cleared_by_update(self):
+        lToi = self.oFile.get_tokens_matching([parser.comma])
+        oViolation = violation.New(lToi[0].get_line_number(), lToi[0])
+        self.oFile.update([oViolation])
+        self.assertEqual(0, self.oFile.get_query_cache_statistics()['entries'])
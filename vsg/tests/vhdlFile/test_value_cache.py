@@ -0,0 +1,81 @@
+import unittest
+from unittest import mock
+
+from vsg import parser
+from vsg.vhdlFile import utils
+from vsg.vhdlFile.classify import design_file
+
+
+def build_objects():
+    lValues = ['Signal', ' ', 'a', ' ', ':', ' ', 'STD_LOGIC', ';', '\n', 'process', ' ', 'is', ';', 'begin', ';', 'end']
+    return [parser.item(sValue) for sValue in lValues]
+
+
+class test_value_cache(unittest.TestCase):
+
+    def tearDown(self):
+        utils.disable_value_cache()
+
+    def test_cache_is_only_used_for_its_list(self):
+        lObjects = build_objects()
+        utils.enable_value_cache(lObjects)
+        self.assertIsNotNone(utils.get_value_cache(lObjects))
+        self.assertIsNone(utils.get_value_cache(build_objects()))
+        self.assertEqual('signal', utils.get_lower_value(lObjects, 0))
+        utils.disable_value_cache()
+        self.assertIsNone(utils.get_value_cache(lObjects))
+
+    def test_helpers_match_uncached_results(self):
+        lObjects = build_objects()
+        lExpected = []
+        lActual = []
+        for lResults in [lExpected, lActual]:
+            if lResults is lActual:
+                utils.enable_value_cache(lObjects)
+            for iToken in range(0, len(lObjects) - 4):
+                lResults.append(utils.get_range(lObjects, iToken, ';'))
+                lResults.append(utils.find_in_range('IS', iToken, ';', lObjects))
+                lResults.append(utils.find_in_index_range('std_logic', iToken, iToken + 3, lObjects))
+                lResults.append(utils.find_earliest_occurance(['begin', ';'], iToken, lObjects))
+                lResults.append(utils.object_value_is(lObjects, iToken, 'Process'))
+                lResults.append(utils.is_next_token_one_of(['signal', 'end'], iToken, lObjects))
+        self.assertEqual(lExpected, lActual)
+
+    def test_insert_and_pop_keep_positions_current(self):
+        lObjects = build_objects()
+        utils.enable_value_cache(lObjects)
+        oCache = utils.get_value_cache(lObjects)
+        oCache.get_positions(';')
+        oCache.get_positions('is')
+        utils.insert_object(lObjects, 3, parser.item(';'))
+        utils.insert_object(lObjects, 0, parser.item('IS'))
+        utils.pop_object(lObjects, 5)
+        self.assertEqual([oObject.get_value().lower() for oObject in lObjects], oCache.get_values())
+        for sValue in [';', 'is']:
+            lExpected = [iIndex for iIndex, oObject in enumerate(lObjects) if oObject.get_value().lower() == sValue]
+            self.assertEqual(lExpected, oCache.get_positions(sValue))
+
+    def test_replace_keeps_values_current(self):
+        lObjects = build_objects()
+        utils.enable_value_cache(lObjects)
+        oCache = utils.get_value_cache(lObjects)
+        oCache.get_positions('a')
+        oCache.get_positions('work')
+        utils.replace_object(lObjects, 2, parser.item('WORK'))
+        utils.replace_object(lObjects, 4, parser.item(':'))
+        self.assertEqual([oObject.get_value().lower() for oObject in lObjects], oCache.get_values())
+        self.assertEqual([], oCache.get_positions('a'))
+        self.assertEqual([2], oCache.get_positions('work'))
+
+    def test_tokenize_disables_cache_on_error(self):
+        lObjects = build_objects()
+        with mock.patch.object(design_file, 'get_detectors', side_effect=ValueError):
+            with self.assertRaises(ValueError):
+                design_file.tokenize(lObjects)
+        self.assertIsNone(utils.oValueCache)
+
+    def test_cache_rebuilds_when_list_length_changes(self):
+        lObjects = build_objects()
+        utils.enable_value_cache(lObjects)
+        lObjects.append(parser.item('Generate'))
+        self.assertEqual('generate', utils.get_lower_value(lObjects, len(lObjects) - 1))
@@ -0,0 +1,44 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from vsg import apply_rules
+
+
+class test_apply_rules(unittest.TestCase):
+
+    def test_get_chunk_size(self):
+        self.assertEqual(1, apply_rules.get_chunk_size(1, 4))
+        self.assertEqual(1, apply_rules.get_chunk_size(16, 4))
+        self.assertEqual(2, apply_rules.get_chunk_size(17, 4))
+        self.assertEqual(25, apply_rules.get_chunk_size(1000, 10))
+
+
+class test_schedule_files(unittest.TestCase):
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp()
+        self.lFileNames = []
+        for iSize in [10, 300, 20, 400, 100, 200, 30]:
+            sFileName = os.path.join(self.sDirectory, 'file_' + str(iSize) + '.vhd')
+            with open(sFileName, 'w') as oFile:
+                oFile.write('-' * iSize)
+            self.lFileNames.append(sFileName)
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def test_largest_files_first(self):
+        lChunks = apply_rules.schedule_files(self.lFileNames, 8)
+        self.assertEqual([[3], [1], [5], [4], [6], [2], [0]], [[tIndex[0] for tIndex in lChunk] for lChunk in lChunks])
+
+    def test_chunks_are_interleaved(self):
+        lChunks = apply_rules.schedule_files(self.lFileNames, 1)
+        self.assertEqual([[3, 6], [1, 2], [5, 0], [4]], [[tIndex[0] for tIndex in lChunk] for lChunk in lChunks])
+
+    def test_every_file_is_scheduled_once(self):
+        lFileNames = self.lFileNames + ['missing_file.vhd']
+        lChunks = apply_rules.schedule_files(lFileNames, 2)
+        lScheduled = sorted([tIndex for lChunk in lChunks for tIndex in lChunk])
+        self.assertEqual(list(enumerate(lFileNames)), lScheduled)
@@ -0,0 +1,133 @@
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+from unittest import mock
+
+from vsg import cmd_line_args
+from vsg import lsp
+
+
+sUri = 'file:///tmp/example%20file.vhd'
+
+
+def create_arguments(lConfiguration=None):
+    oReturn = lsp.get_default_arguments()
+    oReturn.configuration = lConfiguration
+    return oReturn
+
+
+def frame(dMessage):
+    bBody = json.dumps(dMessage).encode('utf-8')
+    return b'Content-Length: ' + str(len(bBody)).encode('ascii') + b'\r\n\r\n' + bBody
+
+
+def run_language_server(lMessages, lConfiguration=None):
+    oInput = io.BytesIO(b''.join([frame(dMessage) for dMessage in lMessages]))
+    oOutput = io.BytesIO()
+    iExitCode = lsp.language_server(create_arguments(lConfiguration), oInput, oOutput).run()
+    oOutput.seek(0)
+    lReturn = []
+    while True:
+        dMessage = lsp.read_message(oOutput)
+        if dMessage is None:
+            break
+        lReturn.append(dMessage)
+    return iExitCode, lReturn
+
+
+def open_document(sText):
+    dDocument = {'uri': sUri, 'languageId': 'vhdl', 'version': 1, 'text': sText}
+    return {'jsonrpc': '2.0', 'method': 'textDocument/didOpen', 'params': {'textDocument': dDocument}}
+
+
+class test_lsp(unittest.TestCase):
+
+    def test_initialize_and_exit(self):
+        lMessages = []
+        lMessages.append({'jsonrpc': '2.0', 'id': 1, 'method': 'initialize', 'params': {}})
+        lMessages.append({'jsonrpc': '2.0', 'id': 2, 'method': 'shutdown'})
+        lMessages.append({'jsonrpc': '2.0', 'method': 'exit'})
+        iExitCode, lResponses = run_language_server(lMessages)
+        self.assertEqual(0, iExitCode)
+        self.assertTrue(lResponses[0]['result']['capabilities']['documentFormattingProvider'])
+        self.assertEqual({'jsonrpc': '2.0', 'id': 2, 'result': None}, lResponses[1])
+
+    def test_exit_without_shutdown(self):
+        iExitCode, lResponses = run_language_server([{'jsonrpc': '2.0', 'method': 'exit'}])
+        self.assertEqual(1, iExitCode)
+
+    def test_diagnostics_on_open_and_change(self):
+        lMessages = []
+        lMessages.append(open_document('ENTITY a IS\nend entity a;\n'))
+        dChange = {'textDocument': {'uri': sUri, 'version': 2}, 'contentChanges': [{'text': 'entity a is\nend entity a;\n'}]}
+        lMessages.append({'jsonrpc': '2.0', 'method': 'textDocument/didChange', 'params': dChange})
+        iExitCode, lResponses = run_language_server(lMessages)
+        self.assertEqual(2, len(lResponses))
+        self.assertEqual('textDocument/publishDiagnostics', lResponses[0]['method'])
+        lDiagnostics = lResponses[0]['params']['diagnostics']
+        self.assertEqual(sorted(['entity_004', 'entity_006']), sorted([dDiagnostic['code'] for dDiagnostic in lDiagnostics]))
+        for dDiagnostic in lDiagnostics:
+            self.assertEqual({'start': {'line': 0, 'character': 0}, 'end': {'line': 0, 'character': 11}}, dDiagnostic['range'])
+            self.assertEqual(1, dDiagnostic['severity'])
+        self.assertEqual([], lResponses[1]['params']['diagnostics'])
+
+    def test_diagnostics_with_configuration(self):
+        sDirectory = tempfile.mkdtemp()
+        try:
+            sConfiguration = os.path.join(sDirectory, 'config.yaml')
+            with open(sConfiguration, 'w') as oFile:
+                oFile.write('rule:\n  entity_004:\n    case: upper\n')
+            iExitCode, lResponses = run_language_server([open_document('ENTITY a IS\nend entity a;\n')], [sConfiguration])
+        finally:
+            shutil.rmtree(sDirectory)
+        lDiagnostics = lResponses[0]['params']['diagnostics']
+        self.assertEqual(['entity_006'], [dDiagnostic['code'] for dDiagnostic in lDiagnostics])
+
+    def test_formatting(self):
+        lMessages = []
+        lMessages.append(open_document('ENTITY a IS\nEND ENTITY;\n'))
+        lMessages.append({'jsonrpc': '2.0', 'id': 3, 'method': 'textDocument/formatting', 'params': {'textDocument': {'uri': sUri}, 'options': {}}})
+        iExitCode, lResponses = run_language_server(lMessages)
+        dEdit = lResponses[1]['result'][0]
+        self.assertEqual('entity a is\nend entity a;\n', dEdit['newText'])
+        self.assertEqual({'start': {'line': 0, 'character': 0}, 'end': {'line': 2, 'character': 0}}, dEdit['range'])
+
+    def test_ranges_count_utf16_code_units(self):
+        iExitCode, lResponses = run_language_server([open_document('ENTITY a IS -- \U0001F600\nend entity a;\n')])
+        lDiagnostics = lResponses[0]['params']['diagnostics']
+        self.assertTrue(lDiagnostics)
+        for dDiagnostic in lDiagnostics:
+            self.assertEqual({'line': 0, 'character': 17}, dDiagnostic['range']['end'])
+
+        lMessages = []
+        lMessages.append(open_document('ENTITY a IS\nEND ENTITY; -- \U0001F600'))
+        lMessages.append({'jsonrpc': '2.0', 'id': 3, 'method': 'textDocument/formatting', 'params': {'textDocument': {'uri': sUri}, 'options': {}}})
+        iExitCode, lResponses = run_language_server(lMessages)
+        self.assertEqual({'line': 1, 'character': 17}, lResponses[1]['result'][0]['range']['end'])
+
+    def test_get_character_count(self):
+        self.assertEqual(3, lsp.get_character_count('abc'))
+        self.assertEqual(1, lsp.get_character_count('\u00e9'))
+        self.assertEqual(2, lsp.get_character_count('\U0001F600'))
+
+    def test_unknown_request(self):
+        iExitCode, lResponses = run_language_server([{'jsonrpc': '2.0', 'id': 4, 'method': 'textDocument/hover', 'params': {}}])
+        self.assertEqual(lsp.iMethodNotFound, lResponses[0]['error']['code'])
+
+    def test_parse_command_line_arguments(self):
+        with mock.patch.object(sys, 'argv', ['vsg-lsp', '-c', 'config.yaml', '--style', 'jcl']):
+            oArguments = lsp.parse_command_line_arguments()
+        self.assertEqual(['config.yaml'], oArguments.configuration)
+        self.assertEqual('jcl', oArguments.style)
+        self.assertTrue(oArguments.all_phases)
+        for sName in vars(cmd_line_args.create_argument_parser().parse_args([])):
+            self.assertTrue(hasattr(oArguments, sName), sName)
+
+    def test_uri_to_path(self):
+        self.assertEqual('/tmp/example file.vhd', lsp.uri_to_path(sUri))
+        self.assertEqual('untitled:1', lsp.uri_to_path('untitled:1'))
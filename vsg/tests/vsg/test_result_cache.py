@@ -0,0 +1,125 @@
+import argparse
+import os
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+
+from vsg import apply_rules
+from vsg import config
+from vsg import junit
+from vsg import result_cache
+from vsg import severity
+
+
+def create_arguments(sCacheDirectory):
+    oReturn = argparse.Namespace()
+    oReturn.cache_directory = sCacheDirectory
+    oReturn.fix = False
+    oReturn.local_rules = None
+    oReturn.output_format = 'vsg'
+    oReturn.all_phases = False
+    oReturn.skip_phase = []
+    oReturn.junit = None
+    oReturn.json = None
+    oReturn.quality_report = None
+    oReturn.profile_rules = None
+    oReturn.profile_parse = None
+    return oReturn
+
+
+def create_config(dConfig):
+    oReturn = config.config()
+    oReturn.dConfig = dConfig
+    oReturn.dIndent = config.read_indent_configuration({})
+    oReturn.dFixOnly = None
+    oReturn.severity_list = severity.create_list(dConfig)
+    return oReturn
+
+
+class test_result_cache(unittest.TestCase):
+
+    def setUp(self):
+        self.sDirectory = tempfile.mkdtemp()
+        self.sCacheDirectory = os.path.join(self.sDirectory, 'cache')
+        self.sFileName = os.path.join(self.sDirectory, 'a.vhd')
+        self.sOtherFileName = os.path.join(self.sDirectory, 'b.vhd')
+        with open(self.sFileName, 'w') as oFile:
+            oFile.write('entity a is\nend entity a;\n')
+        self.oArguments = create_arguments(self.sCacheDirectory)
+        self.oConfig = create_config({'rule': {}, 'file_list': [{self.sFileName: {'rule': {}}}, {self.sOtherFileName: {}}]})
+
+    def tearDown(self):
+        shutil.rmtree(self.sDirectory)
+
+    def test_read_and_write(self):
+        self.assertIsNone(result_cache.read(self.sCacheDirectory, 'abcd'))
+        result_cache.write(self.sCacheDirectory, 'abcd', (True, None, {}, 'output', '', False))
+        self.assertEqual((True, None, {}, 'output', '', False), result_cache.read(self.sCacheDirectory, 'abcd'))
+
+    def test_read_and_write_testcase(self):
+        oTestCase = junit.testcase(self.sFileName, '0', 'failure')
+        oFailure = junit.failure('Failure')
+        oFailure.add_text('entity_001 : line 1')
+        oTestCase.add_failure(oFailure)
+        result_cache.write(self.sCacheDirectory, 'abcd', (1, oTestCase, {'file_path': self.sFileName}, None, '', False))
+        tResults = result_cache.read(self.sCacheDirectory, 'abcd')
+        self.assertEqual(oTestCase.build_junit(), tResults[1].build_junit())
+        self.assertEqual({'file_path': self.sFileName}, tResults[2])
+
+    def test_read_invalid_entry(self):
+        os.makedirs(os.path.join(self.sCacheDirectory, 'ab'))
+        with open(result_cache.get_path(self.sCacheDirectory, 'abcd'), 'wb') as oFile:
+            oFile.write(b'\x80\x04\x95')
+        self.assertIsNone(result_cache.read(self.sCacheDirectory, 'abcd'))
+
+    def test_local_rules_hash_changes_with_rules(self):
+        sLocalRules = os.path.join(self.sDirectory, 'local_rules')
+        os.makedirs(sLocalRules)
+        sRuleFileName = os.path.join(sLocalRules, 'rule_001.py')
+        with open(sRuleFileName, 'w') as oFile:
+            oFile.write('a = 1\n')
+        sHash = result_cache.hash_local_rules(sLocalRules)
+        self.assertEqual(sHash, result_cache.hash_local_rules(sLocalRules))
+        with open(sRuleFileName, 'w') as oFile:
+            oFile.write('a = 2\n')
+        os.utime(sRuleFileName, (0, 0))
+        self.assertNotEqual(sHash, result_cache.hash_local_rules(sLocalRules))
+
+    def test_key_changes_with_content(self):
+        sKey = result_cache.get_key(self.oArguments, self.oConfig, self.sFileName)
+        self.assertEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+        with open(self.sFileName, 'a') as oFile:
+            oFile.write('-- comment\n')
+        self.assertNotEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+
+    def test_key_changes_with_effective_configuration(self):
+        sKey = result_cache.get_key(self.oArguments, self.oConfig, self.sFileName)
+        self.oConfig.dConfig['file_list'][1][self.sOtherFileName] = {'rule': {'entity_008': {'case': 'upper'}}}
+        self.assertEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+        self.oConfig.dConfig['file_list'][0][self.sFileName] = {'rule': {'entity_008': {'case': 'upper'}}}
+        self.assertNotEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+        sKey = result_cache.get_key(self.oArguments, self.oConfig, self.sFileName)
+        self.oConfig.dConfig['rule']['entity_008'] = {'case': 'lower'}
+        self.assertNotEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+
+    def test_key_changes_with_output_options(self):
+        sKey = result_cache.get_key(self.oArguments, self.oConfig, self.sFileName)
+        self.oArguments.output_format = 'summary'
+        self.assertNotEqual(sKey, result_cache.get_key(self.oArguments, self.oConfig, self.sFileName))
+
+    def test_key_of_missing_file(self):
+        self.assertIsNone(result_cache.get_key(self.oArguments, self.oConfig, self.sOtherFileName))
+
+    def test_apply_rules_uses_cache(self):
+        tResults = apply_rules.apply_rules(self.oArguments, self.oConfig, (0, self.sFileName))
+        with mock.patch.object(apply_rules, 'apply_rules_to_file') as oMock:
+            self.assertEqual(tResults, apply_rules.apply_rules(self.oArguments, self.oConfig, (0, self.sFileName)))
+            oMock.assert_not_called()
+            self.oArguments.fix = True
+            apply_rules.apply_rules(self.oArguments, self.oConfig, (0, self.sFileName))
+            oMock.assert_called_once()
+            self.oArguments.fix = False
+            self.oArguments.profile_rules = ''
+            apply_rules.apply_rules(self.oArguments, self.oConfig, (0, self.sFileName))
+            self.assertEqual(2, oMock.call_count)
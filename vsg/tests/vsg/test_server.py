@@ -0,0 +1,121 @@
+import argparse
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+
+from vsg import server
+
+
+sEntityFile = os.path.join(os.path.dirname(__file__), 'entity1.vhd')
+
+
+def create_arguments():
+    oReturn = argparse.Namespace()
+    oReturn.configuration = None
+    oReturn.style = None
+    oReturn.local_rules = None
+    oReturn.fix_only = None
+    oReturn.debug = False
+    oReturn.fix_phase = 7
+    oReturn.all_phases = False
+    oReturn.cache_directory = None
+    oReturn.junit = None
+    return oReturn
+
+
+def run_server(lRequests):
+    oInput = io.StringIO(''.join([json.dumps(dRequest) + '\n' for dRequest in lRequests]))
+    oOutput = io.StringIO()
+    server.server(create_arguments(), oInput, oOutput).run()
+    return [json.loads(sLine) for sLine in oOutput.getvalue().splitlines()]
+
+
+class test_server(unittest.TestCase):
+
+    def test_check_file(self):
+        lResponses = run_server([{'jsonrpc': '2.0', 'id': 1, 'method': 'check', 'params': {'filename': sEntityFile}}])
+        self.assertEqual(1, len(lResponses))
+        self.assertEqual(1, lResponses[0]['id'])
+        self.assertEqual(sEntityFile, lResponses[0]['result']['filename'])
+        self.assertTrue(lResponses[0]['result']['status'])
+        self.assertNotEqual([], lResponses[0]['result']['violations'])
+
+    def test_fix_buffer(self):
+        dRequest = {'jsonrpc': '2.0', 'id': 2, 'method': 'fix', 'params': {'text': 'ENTITY a IS\nEND ENTITY;\n'}}
+        lResponses = run_server([dRequest])
+        self.assertEqual('entity a is\nend entity a;\n', lResponses[0]['result']['text'])
+        self.assertEqual([], lResponses[0]['result']['violations'])
+        self.assertFalse(lResponses[0]['result']['status'])
+
+    def test_fix_file(self):
+        sDirectory = tempfile.mkdtemp()
+        try:
+            sFileName = os.path.join(sDirectory, 'a.vhd')
+            with open(sFileName, 'w') as oFile:
+                oFile.write('ENTITY a IS\nEND ENTITY;\n')
+            lResponses = run_server([{'jsonrpc': '2.0', 'id': 3, 'method': 'fix', 'params': {'filename': sFileName}}])
+            self.assertNotIn('text', lResponses[0]['result'])
+            with open(sFileName) as oFile:
+                self.assertEqual('entity a is\nend entity a;\n', oFile.read())
+        finally:
+            shutil.rmtree(sDirectory)
+
+    def test_configuration_is_reused(self):
+        oServer = server.server(create_arguments(), io.StringIO(), io.StringIO())
+        tFirst = oServer.get_configuration({})
+        self.assertIs(tFirst, oServer.get_configuration({}))
+        self.assertIsNot(tFirst, oServer.get_configuration({'style': 'jcl'}))
+
+    def test_configuration_is_replaced_when_changed(self):
+        sDirectory = tempfile.mkdtemp()
+        try:
+            sConfiguration = os.path.join(sDirectory, 'config.yaml')
+            with open(sConfiguration, 'w') as oFile:
+                oFile.write('rule:\n  entity_004:\n    case: upper\n')
+            oServer = server.server(create_arguments(), io.StringIO(), io.StringIO())
+            tFirst = oServer.get_configuration({'configuration': [sConfiguration]})
+            os.utime(sConfiguration, (0, 0))
+            tSecond = oServer.get_configuration({'configuration': [sConfiguration]})
+            self.assertIsNot(tFirst, tSecond)
+            self.assertEqual(1, len(oServer.dConfigurations))
+        finally:
+            shutil.rmtree(sDirectory)
+
+    def test_split_lines(self):
+        self.assertEqual(['a\x0cb\u2028c', '', 'd'], server.split_lines('a\x0cb\u2028c\n\nd\n'))
+        self.assertEqual(['a', 'b'], server.split_lines('a\nb'))
+        self.assertEqual([], server.split_lines(''))
+
+    def test_notifications_and_shutdown(self):
+        lRequests = []
+        lRequests.append({'jsonrpc': '2.0', 'method': 'check', 'params': {'text': 'entity a is\nend entity a;\n'}})
+        lRequests.append({'jsonrpc': '2.0', 'id': 4, 'method': 'shutdown'})
+        lRequests.append({'jsonrpc': '2.0', 'id': 5, 'method': 'check', 'params': {'filename': sEntityFile}})
+        lResponses = run_server(lRequests)
+        self.assertEqual([{'jsonrpc': '2.0', 'id': 4, 'result': None}], lResponses)
+
+    def test_notification_errors_are_not_answered(self):
+        oServer = server.server(create_arguments(), io.StringIO(), io.StringIO())
+        self.assertIsNone(oServer.handle(json.dumps({'jsonrpc': '2.0', 'method': 'unknown'})))
+        self.assertIsNone(oServer.handle(json.dumps({'jsonrpc': '2.0', 'method': 'check', 'params': []})))
+        self.assertIsNone(oServer.handle(json.dumps({'jsonrpc': '2.0', 'method': 'check', 'params': {}})))
+        self.assertIsNone(oServer.handle(json.dumps({'jsonrpc': '2.0', 'method': 'check', 'params': {'filename': 'does_not_exist.vhd'}})))
+        dResponse = oServer.handle(json.dumps({'jsonrpc': '2.0', 'id': None, 'method': 'unknown'}))
+        self.assertEqual(server.iMethodNotFound, dResponse['error']['code'])
+
+    def test_buffer_without_filename(self):
+        lResponses = run_server([{'jsonrpc': '2.0', 'id': 8, 'method': 'check', 'params': {'text': 'entity a is\nend entity a;\n'}}])
+        self.assertEqual('<stdin>', lResponses[0]['result']['filename'])
+
+    def test_errors(self):
+        oServer = server.server(create_arguments(), io.StringIO(), io.StringIO())
+        self.assertEqual(server.iParseError, oServer.handle('not json')['error']['code'])
+        self.assertEqual(server.iInvalidRequest, oServer.handle('[]')['error']['code'])
+        dResponse = oServer.handle(json.dumps({'jsonrpc': '2.0', 'id': 6, 'method': 'unknown'}))
+        self.assertEqual(6, dResponse['id'])
+        self.assertEqual(server.iMethodNotFound, dResponse['error']['code'])
+        dResponse = oServer.handle(json.dumps({'jsonrpc': '2.0', 'id': 7, 'method': 'check', 'params': {}}))
+        self.assertEqual(server.iInvalidParams, dResponse['error']['code'])
@@ -2,13 +2,23 @@
 import bisect
 import pprint
 
-from vsg import parser
+from array import array
+
+
+lTypeIds = [(None, None), ('parser', 'whitespace'), ('parser', 'carriage_return'), ('parser', 'blank_line'), ('parser', 'comment')]
+dTypeIds = {tKey: iTypeId for iTypeId, tKey in enumerate(lTypeIds)}
+
+sWhitespaceTypeIds = frozenset([1, 2, 3])
+sWhitespaceOrCommentTypeIds = frozenset([1, 2, 3, 4])
 
 
 class New():
 
-    def __init__(self, dMap):
+    def __init__(self, dMap, aTypeIds):
         self.dMap = dMap
+        self.dSets = {}
+        self.dPairs = {}
+        self.aTypeIds = aTypeIds
 
     def get_token_indexes(self, oToken, bCopy=False):
         sBase, sSub = extract_unique_id(oToken)
@@ -20,6 +30,41 @@ class New():
         except KeyError:
             return []
 
+    def get_token_index_set(self, sBase, sSub):
+        '''
+        Returns a set of the indexes stored under (sBase, sSub).
+        The set is built on first use and kept until the map is updated.
+        '''
+        try:
+            return self.dSets[(sBase, sSub)]
+        except KeyError:
+            try:
+                sIndexes = set(self.dMap[sBase][sSub])
+            except KeyError:
+                sIndexes = frozenset()
+            self.dSets[(sBase, sSub)] = sIndexes
+            return sIndexes
+
+    def has_token(self, oToken):
+        '''
+        Returns True if at least one token of the type of oToken exists.
+        Empty entries are removed when the map is updated, so only the keys need to be checked.
+        '''
+        sBase, sSub = extract_unique_id(oToken)
+        try:
+            return sSub in self.dMap[sBase]
+        except KeyError:
+            return False
+
+    def has_any_token(self, lTokens):
+        '''
+        Returns True if a token of any type in lTokens exists.
+        '''
+        for oToken in lTokens:
+            if self.has_token(oToken):
+                return True
+        return False
+
     def get_token_indexes_between_indexes(self, oToken, iStart, iEnd):
         lReturn = []
         lIndexes = self.get_token_indexes(oToken)
@@ -53,76 +98,62 @@ class New():
             return None
 
     def get_token_pair_indexes(self, oStart, oEnd):
-        lStartIndexes = self.get_token_indexes(oStart)
-        lEndIndexes = self.get_token_indexes(oEnd)
-        return extract_start_end_indexes(lStartIndexes, lEndIndexes)
+        '''
+        Returns the start and end indexes of the paired oStart and oEnd tokens.
+        The pairs are computed on first use and kept until the map is updated.
+        '''
+        tKey = (extract_unique_id(oStart), extract_unique_id(oEnd))
+        try:
+            lStartIndexes, lEndIndexes = self.dPairs[tKey]
+        except KeyError:
+            lStartIndexes, lEndIndexes = extract_start_end_indexes(self.get_token_indexes(oStart), self.get_token_indexes(oEnd))
+            self.dPairs[tKey] = (lStartIndexes, lEndIndexes)
+        return lStartIndexes.copy(), lEndIndexes.copy()
 
     def get_index_of_next_non_whitespace_token(self, iIndex, bExcludeComments=False):
-        iStartIndex = iIndex + 1
-        lTokens = [None, None, None, None]
-        lBaseKeys = list(self.dMap.keys())
-        for sBaseKey in lBaseKeys:
-            lSubKeys = list(self.dMap[sBaseKey].keys())
-            if sBaseKey == 'parser':
-                if 'whitespace' in lSubKeys:
-                    lSubKeys.remove('whitespace')
-                if 'carriage_return' in lSubKeys:
-                    lSubKeys.remove('carriage_return')
-                if 'blank_line' in lSubKeys:
-                    lSubKeys.remove('blank_line')
-                if bExcludeComments and 'comment' in lSubKeys:
-                    lSubKeys.remove('comment')
-            for sSubKey in lSubKeys:
-                for iIdx in range(0, 4):
-                    iSearchIdx = iStartIndex + iIdx
-                    if iSearchIdx in self.dMap[sBaseKey][sSubKey]:
-                        lTokens[iIdx] = iSearchIdx
-                        continue
-
-        for iToken in lTokens:
-            if iToken is not None:
-                return iToken
+        if bExcludeComments:
+            sSkipIds = sWhitespaceOrCommentTypeIds
+        else:
+            sSkipIds = sWhitespaceTypeIds
+        for iSearchIdx in range(iIndex + 1, iIndex + 5):
+            iTypeId = self.get_type_id_at_index(iSearchIdx)
+            if iTypeId != 0 and iTypeId not in sSkipIds:
+                return iSearchIdx
+        return None
 
     def get_index_of_previous_non_whitespace_token_before_index(self, iIndex):
         iStartIndex = iIndex - 1
         for i in range(iStartIndex, 0, -1):
-            if not self.is_token_at_index_whitespace(i):
+            if self.get_type_id_at_index(i) not in sWhitespaceTypeIds:
                 return i
 
     def get_index_of_previous_non_whitespace_token(self, iIndex):
         iStartIndex = iIndex - 1
         for i in range(iStartIndex, 0, -1):
-            if not self.is_token_at_index_whitespace_or_comment(i):
+            if self.get_type_id_at_index(i) not in sWhitespaceOrCommentTypeIds:
                 return i
 
+    def get_type_id_at_index(self, iIndex):
+        '''
+        Returns the interned type id of the token at iIndex.
+        Zero is returned for tokens without a unique_id and for indexes outside the file.
+        '''
+        if 0 <= iIndex < len(self.aTypeIds):
+            return self.aTypeIds[iIndex]
+        return 0
+
+    def get_unique_id_at_index(self, iIndex):
+        return lTypeIds[self.get_type_id_at_index(iIndex)]
+
     def is_token_at_index(self, oToken, iIndex):
-        try:
-            sBase, sSub = extract_unique_id(oToken)
-            if iIndex in self.dMap[sBase][sSub]:
-                return True
-            return False
-        except KeyError:
-            return False
+        sBase, sSub = extract_unique_id(oToken)
+        return iIndex in self.get_token_index_set(sBase, sSub)
 
     def is_token_at_index_whitespace(self, iIndex):
-        if self.is_token_at_index(parser.whitespace, iIndex):
-            return True
-        if self.is_token_at_index(parser.carriage_return, iIndex):
-            return True
-        if self.is_token_at_index(parser.blank_line, iIndex):
-            return True
-        return False
+        return self.get_type_id_at_index(iIndex) in sWhitespaceTypeIds
 
     def is_token_at_index_whitespace_or_comment(self, iIndex):
-        if self.is_token_at_index(parser.whitespace, iIndex):
-            return True
-        if self.is_token_at_index(parser.comment, iIndex):
-            return True
-        if self.is_token_at_index(parser.carriage_return, iIndex):
-            return True
-        if self.is_token_at_index(parser.blank_line, iIndex):
-            return True
-        return False
+        return self.get_type_id_at_index(iIndex) in sWhitespaceOrCommentTypeIds
 
     def pretty_print(self):
         pp=pprint.PrettyPrinter(indent=4)
@@ -131,129 +162,151 @@ class New():
     def get_index_of_line(self, iLine):
         return(self.dMap['parser']['carriage_return'][iLine - 2] + 1)
 
+    def update(self, iStart, iEnd, lTokens):
+        '''
+        Updates the map after the tokens in the range [iStart:iEnd] were replaced with lTokens.
+        Indexes downstream of the range are shifted and only the replaced entries are removed and inserted.
+
+        Parameters:
+
+          iStart : (integer)
+
+          iEnd : (integer)
+
+          lTokens : (list of token objects)
+        '''
+        self.dSets = {}
+        self.dPairs = {}
+        iDelta = len(lTokens) - (iEnd - iStart)
+        for sBase in list(self.dMap.keys()):
+            dSubMap = self.dMap[sBase]
+            for sSub in list(dSubMap.keys()):
+                lIndexes = dSubMap[sSub]
+                iLeft = bisect.bisect_left(lIndexes, iStart)
+                iRight = bisect.bisect_left(lIndexes, iEnd, iLeft)
+                del lIndexes[iLeft:iRight]
+                if len(lIndexes) == 0:
+                    del dSubMap[sSub]
+                elif iDelta != 0 and iLeft < len(lIndexes):
+                    lIndexes[iLeft:] = [iIndex + iDelta for iIndex in lIndexes[iLeft:]]
+            if len(dSubMap) == 0:
+                del self.dMap[sBase]
+
+        dNewMap = {}
+        for iToken, oToken in enumerate(lTokens, start=iStart):
+            for sBase, sSub in extract_token_keys(oToken):
+                add_index_to_map(dNewMap, sBase, sSub, iToken)
+
+        for sBase in dNewMap:
+            for sSub in dNewMap[sBase]:
+                lIndexes = self.dMap.setdefault(sBase, {}).setdefault(sSub, [])
+                iLeft = bisect.bisect_left(lIndexes, iStart)
+                lIndexes[iLeft:iLeft] = dNewMap[sBase][sSub]
+
+        self.aTypeIds[iStart:iEnd] = build_type_id_array(lTokens)
+
 
 def extract_unique_id(oToken):
-    lDoc = oToken.__doc__.split()
-    for iDoc, sDoc in enumerate(lDoc):
-        if sDoc == 'unique_id':
-            return lDoc[iDoc + 2], lDoc[iDoc + 4]
-    return None, None
+    '''
+    Returns the (base, sub) unique id of a token class or token object.
+    The id is parsed once from the class docstring when the class is created.
+    '''
+    try:
+        return oToken.base_token, oToken.sub_token
+    except AttributeError:
+        return None, None
 
 
 def process_tokens(lTokens):
     dMap = build_default_map()
     for iToken, oToken in enumerate(lTokens):
-        sBase, sSub = oToken.get_unique_id()
-        if sBase is not None:
-           try:
-               dMap[sBase][sSub].append(iToken)
-           except KeyError:
-               try:
-                   dMap[sBase][sSub] = []
-                   dMap[sBase][sSub].append(iToken)
-               except KeyError:
-                   dMap[sBase] = {}
-                   dMap[sBase][sSub] = []
-                   dMap[sBase][sSub].append(iToken)
-        if sBase == 'logical_operator':
-            try:
-                dMap[sBase][sBase].append(iToken)
-            except KeyError:
-                try:
-                    dMap[sBase][sBase] = []
-                    dMap[sBase][sBase].append(iToken)
-                except KeyError:
-                    dMap[sBase] = {}
-                    dMap[sBase][sBase] = []
-                    dMap[sBase][sBase].append(iToken)
-            continue
-        if sSub == 'comma':
-            try:
-                if iToken not in dMap['parser']['comma']:
-                    dMap['parser']['comma'].append(iToken)
-            except KeyError:
-                try:
-                    dMap['parser']['comma'] = []
-                    dMap['parser']['comma'].append(iToken)
-                except KeyError:
-                    dMap['parser'] = {}
-                    dMap['parser']['comma'] = []
-                    dMap['parser']['comma'].append(iToken)
-            continue
-        if sSub == 'open_parenthesis':
-            try:
-                if iToken not in dMap['parser']['open_parenthesis']:
-                    dMap['parser']['open_parenthesis'].append(iToken)
-            except KeyError:
-                try:
-                    dMap['parser']['open_parenthesis'] = []
-                    dMap['parser']['open_parenthesis'].append(iToken)
-                except KeyError:
-                    dMap['parser'] = {}
-                    dMap['parser']['open_parenthesis'] = []
-                    dMap['parser']['open_parenthesis'].append(iToken)
-            continue
+        for sBase, sSub in extract_token_keys(oToken):
+            add_index_to_map(dMap, sBase, sSub, iToken)
 
-    return New(dMap)
+    return New(dMap, build_type_id_array(lTokens))
 
 
-def build_default_map():
-    dMap = {}
-    return dMap
-
-
-def extract_start_end_indexes(lStartIndexes, lEndIndexes):
-    mylStartIndexes = lStartIndexes.copy()
-    mylEndIndexes = lEndIndexes.copy()
-    lPairs = extract_pairs(mylStartIndexes, mylEndIndexes)
+def get_type_id(sBase, sSub):
+    '''
+    Returns the interned integer id for a (base, sub) token type.
+    Ids are assigned on first use and are only valid within the current process.
+    '''
+    try:
+        return dTypeIds[(sBase, sSub)]
+    except KeyError:
+        iTypeId = len(lTypeIds)
+        dTypeIds[(sBase, sSub)] = iTypeId
+        lTypeIds.append((sBase, sSub))
+        return iTypeId
 
-    return extract_indexes_from_pairs(lPairs)
 
+def build_type_id_array(lTokens):
+    aReturn = array('H')
+    for oToken in lTokens:
+        sBase, sSub = oToken.get_unique_id()
+        aReturn.append(get_type_id(sBase, sSub))
+    return aReturn
+
+
+def extract_token_keys(oToken):
+    '''
+    Returns the list of (base, sub) keys a token is stored under in the map.
+    '''
+    sBase, sSub = oToken.get_unique_id()
+    if sBase is None:
+        return []
+    lReturn = [(sBase, sSub)]
+    if sBase == 'logical_operator':
+        lReturn.append((sBase, sBase))
+    elif sSub == 'comma':
+        lReturn.append(('parser', 'comma'))
+    elif sSub == 'open_parenthesis':
+        lReturn.append(('parser', 'open_parenthesis'))
+    if len(lReturn) == 2 and lReturn[0] == lReturn[1]:
+        lReturn.pop()
+    return lReturn
+
+
+def add_index_to_map(dMap, sBase, sSub, iIndex):
+    try:
+        dMap[sBase][sSub].append(iIndex)
+    except KeyError:
+        try:
+            dMap[sBase][sSub] = [iIndex]
+        except KeyError:
+            dMap[sBase] = {}
+            dMap[sBase][sSub] = [iIndex]
 
-def extract_pairs(lStartIndexes, lEndIndexes):
-    lMyPairs = []
-    while len(lEndIndexes) > 0 and len(lStartIndexes) > 0:
-        iMin = lEndIndexes[-1] + 1
-        lPair = []
-        for iStart in lStartIndexes:
-            lPair = extract_closest_pair(iStart, lEndIndexes, lPair, iMin)
-        lMyPairs.append(lPair)
-
-        if pair_is_empty(lPair):
-            break
-
-        lStartIndexes.remove(lPair[0])
-        lEndIndexes.remove(lPair[1])
 
-    return lMyPairs
+def build_default_map():
+    dMap = {}
+    return dMap
 
 
-def extract_closest_pair(iStart, lEndIndexes, lPair, iMin):
-    for iEnd in lEndIndexes:
-        if iStart > iEnd:
-            continue
-        if iEnd - iStart < iMin:
-            lPair = [iStart, iEnd]
-            iMin = iEnd - iStart
-    return lPair
+def extract_start_end_indexes(lStartIndexes, lEndIndexes):
+    '''
+    Pairs each end index with the nearest unpaired start index at or before it.
 
+    Both lists must be sorted.  The start and end indexes are merged in a
+    single pass using a stack of open starts, which gives the same pairs as
+    repeatedly removing the closest start/end pair.  Unpaired indexes are
+    dropped.
 
-def extract_indexes_from_pairs(lPairs):
+    Returns a tuple of sorted start indexes and sorted end indexes.
+    '''
     lReturnStartIndexes = []
     lReturnEndIndexes = []
-    for pair in lPairs:
-        if pair_is_empty(pair):
-            break
-        lReturnStartIndexes.append(pair[0])
-        lReturnEndIndexes.append(pair[1])
+    lOpenStartIndexes = []
+    iStart = 0
+    iNumStartIndexes = len(lStartIndexes)
+    for iEnd in lEndIndexes:
+        while iStart < iNumStartIndexes and lStartIndexes[iStart] <= iEnd:
+            lOpenStartIndexes.append(lStartIndexes[iStart])
+            iStart += 1
+        if len(lOpenStartIndexes) > 0:
+            lReturnStartIndexes.append(lOpenStartIndexes.pop())
+            lReturnEndIndexes.append(iEnd)
 
     lReturnStartIndexes.sort()
-    lReturnEndIndexes.sort()
 
     return lReturnStartIndexes, lReturnEndIndexes
-
-
-def pair_is_empty(lPair):
-    if len(lPair) == 0:
-        return True
-    return False
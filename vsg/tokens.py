@@ -1,3 +1,5 @@
+import re
+
 
 lSingleCharacterSymbols = [',', ':', '(', ')', '\'', '"', '+', '&', '-', '*', '/', '<', '>', ';', '=', '[', ']', '?']
 lTwoCharacterSymbols = ['=>','**', ':=', '/=', '>=', '<=', '<>', '??', '?=', '?<', '?>', '<<', '>>', '--', '/*', '*/']
@@ -6,10 +8,45 @@ lFourCharacterSymbols = ['\\?=\\']
 
 lStopChars = [' ', '(', ';']
 
+oTokenPattern = re.compile(
+    r'(?P<whitespace>\s+)'
+    r'|(?P<string>"[^"]*")'
+    r'|(?P<comment>--.*?(?=\s*\Z))'
+    r'|(?P<symbol>=>|\*\*|:=|/=|>=|<=|<>|\?\?|\?=|\?<|\?>|<<|>>|/\*|\*/)'
+    r'|(?P<character>[,:()\'"+&\-*/<>;=\[\]?])'
+    r'|(?P<word>[^\s,:()\'"+&\-*/<>;=\[\]?\\]+)',
+    re.DOTALL
+)
+
 
 def create(sString):
     '''
     This function takes a string and returns a list of tokens.
+
+    The line is scanned once with a compiled regular expression.
+    Lines containing backslashes are passed to create_multi_pass as extended identifiers can absorb other symbols.
+    '''
+    if '\\' in sString:
+        return create_multi_pass(sString)
+
+    lReturn = []
+    for oMatch in oTokenPattern.finditer(sString):
+        sToken = oMatch.group()
+        if oMatch.lastgroup == 'word' and ('e' in sToken or 'E' in sToken) and is_natural_number(sToken):
+            lReturn.extend(parse_natural_number(sToken))
+        else:
+            lReturn.append(sToken)
+
+    if "'" in sString:
+        lReturn = combine_character_literals(lReturn)
+
+    return lReturn
+
+
+def create_multi_pass(sString):
+    '''
+    This function takes a string and returns a list of tokens.
+    Each step of the tokenization is performed as a separate pass over the line.
     '''
 
     oLine = New(sString)
@@ -102,14 +139,7 @@ class New():
         combine_quote_pairs(lQuotePairs, self)
 
     def combine_character_literals(self):
-        lQuotes = find_indexes_of_token_with_value("'", self.lChars)
-        lLiterals = find_character_literal_candidates(lQuotes, self.lChars)
-        if len(lLiterals) == 0:
-            return None
-        lQuotePairs = filter_character_literal_candidates(lLiterals)
-        lQuotePairs.reverse()
-
-        combine_quote_pairs(lQuotePairs, self)
+        self.lChars = combine_character_literals(self.lChars)
 
     def combine_comments(self):
         if has_trailing_whitespace(self.lChars):
@@ -153,6 +183,22 @@ def parse_natural_number(sString):
     return lReturn
 
 
+def combine_character_literals(lTokens):
+    lQuotes = find_indexes_of_token_with_value("'", lTokens)
+    lLiterals = find_character_literal_candidates(lQuotes, lTokens)
+    if len(lLiterals) == 0:
+        return lTokens
+    lQuotePairs = filter_character_literal_candidates(lLiterals)
+    lReturn = []
+    iStart = 0
+    for iLeft, iRight in lQuotePairs:
+        lReturn.extend(lTokens[iStart:iLeft])
+        lReturn.append(''.join(lTokens[iLeft:iRight + 1]))
+        iStart = iRight + 1
+    lReturn.extend(lTokens[iStart:])
+    return lReturn
+
+
 def combine_quote_pairs(lQuotePairs, self):
     for lPair in lQuotePairs:
         iLeft = lPair[0]
@@ -1,17 +1,50 @@
 
 from vsg.vhdlFile import utils
 
-from vsg.vhdlFile.classify import design_unit
+from vsg.vhdlFile.classify import architecture_body
+from vsg.vhdlFile.classify import configuration_declaration
+from vsg.vhdlFile.classify import context_clause
+from vsg.vhdlFile.classify import context_declaration
+from vsg.vhdlFile.classify import entity_declaration
+from vsg.vhdlFile.classify import package_body
+from vsg.vhdlFile.classify import package_declaration
+from vsg.vhdlFile.classify import package_instantiation_declaration
+
+# Every design_unit starts with one of these keywords.  The detectors for each
+# keyword are listed in the order design_unit would have tried them.
+dDetectors = {}
+dDetectors['library'] = (context_clause,)
+dDetectors['use'] = (context_clause,)
+dDetectors['context'] = (context_clause, context_declaration)
+dDetectors['entity'] = (entity_declaration,)
+dDetectors['configuration'] = (configuration_declaration,)
+dDetectors['package'] = (package_declaration, package_instantiation_declaration, package_body)
+dDetectors['architecture'] = (architecture_body,)
 
 
 def tokenize(lObjects):
     '''
     design_file ::=
         design_unit { design_unit }
+
+    Instead of probing every design_unit detector at each unclassified token,
+    the leading keyword of the token selects the detectors to try.
     '''
-    iReturn = 0
-    for iCurrent in range(0, len(lObjects)):
-        iTemp = iCurrent
-        if iTemp >= iReturn:
-            if utils.is_item(lObjects, iTemp):
-                iReturn = design_unit.detect(iTemp, lObjects)
+    utils.enable_value_cache(lObjects)
+    try:
+        iReturn = 0
+        for iCurrent in range(0, len(lObjects)):
+            if iCurrent < iReturn:
+                continue
+            if not utils.is_item(lObjects, iCurrent):
+                continue
+            for detector in get_detectors(utils.get_lower_value(lObjects, iCurrent)):
+                iReturn = detector.detect(iCurrent, lObjects)
+                if iReturn != iCurrent:
+                    break
+    finally:
+        utils.disable_value_cache()
+
+
+def get_detectors(sValue):
+    return dDetectors.get(sValue, ())
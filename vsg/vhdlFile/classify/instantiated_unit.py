@@ -55,9 +55,9 @@ def classify_entity_name(iToken, lObjects):
     sTokenValue = lObjects[iCurrent].get_value()
     if '.' in sTokenValue:
         lTokenValue = sTokenValue.split('.')
-        lObjects[iCurrent] = token.library_name(lTokenValue[0])
-        lObjects.insert(iCurrent + 1, token.dot('.'))
-        lObjects.insert(iCurrent + 2, token.entity_name(lTokenValue[1]))
+        utils.replace_object(lObjects, iCurrent, token.library_name(lTokenValue[0]))
+        utils.insert_object(lObjects, iCurrent + 1, token.dot('.'))
+        utils.insert_object(lObjects, iCurrent + 2, token.entity_name(lTokenValue[1]))
         iCurrent = iCurrent + 2
     else:
         iCurrent = utils.assign_next_token(token.entity_name, iCurrent, lObjects)
@@ -14,7 +14,7 @@ def detect(iToken, lObjects):
     '''
 
     if utils.is_next_token_one_of(['when', 'if', 'elsif', 'else'], iToken, lObjects):
-        return False
+        return iToken
     if utils.find_in_range('<=', iToken, ';', lObjects):
         if utils.find_in_range('force', iToken, ';', lObjects):
             return classify(iToken, lObjects)
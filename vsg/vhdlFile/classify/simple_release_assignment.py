@@ -12,6 +12,8 @@ def detect(iToken, lObjects):
         target <= release [ force_mode ] ;
     '''
 
+    if utils.is_next_token_one_of(['when', 'if', 'elsif', 'else'], iToken, lObjects):
+        return iToken
     if utils.find_in_range('release', iToken, ';', lObjects):
         return classify(iToken, lObjects)
     return iToken
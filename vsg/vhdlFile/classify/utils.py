@@ -6,7 +6,7 @@ def classify_selected_name(iToken, lObjects, token):
     iTokenIndex = utils.find_next_token(iToken, lObjects)
     lTokens = lObjects[iTokenIndex].get_value().split('.')
     if lObjects[iTokenIndex + 1].get_value().startswith('"'):
-        lTokens[-1] = lObjects.pop(iTokenIndex + 1).get_value()
+        lTokens[-1] = utils.pop_object(lObjects, iTokenIndex + 1).get_value()
     lNewTokens = build_selected_name_token_list(lTokens, token)
     replace_item_in_list_with_a_list_at_index(lObjects, lNewTokens, iTokenIndex)
     iNewIndex = iToken + len(lNewTokens)
@@ -59,10 +59,10 @@ def classify_context_reference_selected_name_elements(iThisToken, lNewTokens, lT
 
 
 def replace_item_in_list_with_a_list_at_index(lFirstList, lSecondList, iIndex):
-    lFirstList.pop(iIndex)
+    utils.pop_object(lFirstList, iIndex)
     lSecondList.reverse()
     for oToken in lSecondList:
-        lFirstList.insert(iIndex, oToken)
+        utils.insert_object(lFirstList, iIndex, oToken)
 
 
 def is_use_clause_selected_name(token):
@@ -2,32 +2,49 @@
 from vsg import parser
 
 
+dInternedTags = {parser.no_code_tags: parser.no_code_tags}
+
+
 class New():
 
     def __init__(self):
         self.code_tags = []
         self.next_line_code_tags = []
         self.bIgnoreNextCarriageReturn = False
+        self.tags = parser.no_code_tags
 
     def clear(self):
         self.code_tags.clear()
         self.next_line_code_tags.clear()
+        self.tags = None
 
     def clear_next_line_code_tags(self):
-        self.next_line_code_tags.clear()
+        if len(self.next_line_code_tags) > 0:
+            self.next_line_code_tags.clear()
+            self.tags = None
 
     def remove(self, sCodeTag):
         self.code_tags.remove(sCodeTag)
+        self.tags = None
 
     def add(self, sCodeTag):
         if sCodeTag not in self.code_tags:
             self.code_tags.append(sCodeTag)
+            self.tags = None
+
+    def add_next_line(self, sCodeTag):
+        if sCodeTag not in self.next_line_code_tags:
+            self.next_line_code_tags.append(sCodeTag)
+            self.tags = None
 
     def get_tags(self):
-        lReturn = []
-        lReturn.extend(self.code_tags)
-        lReturn.extend(self.next_line_code_tags)
-        return lReturn
+        '''
+        Returns the active code tags as an interned frozenset.
+        Tokens in the same code tag region share the same object.
+        '''
+        if self.tags is None:
+            self.tags = intern_tags(self.code_tags + self.next_line_code_tags)
+        return self.tags
 
     def update(self, oToken):
 
@@ -35,7 +52,7 @@ class New():
             if self.bIgnoreNextCarriageReturn:
                 self.bIgnoreNextCarriageReturn = False
             else:
-                self.next_line_code_tags.clear()
+                self.clear_next_line_code_tags()
             return None
 
         if on_code_tag_detected(oToken):
@@ -109,8 +126,12 @@ def add_next_line_code_tags(self, oToken):
     sValue = remove_code_tag_comment(oToken)
     lValues = sValue.split()
     for sCodeTag in lValues[2:]:
-       if sCodeTag not in self.next_line_code_tags:
-           self.next_line_code_tags.append(sCodeTag)
+       self.add_next_line(sCodeTag)
+
+
+def intern_tags(lTags):
+    fTags = frozenset(lTags)
+    return dInternedTags.setdefault(fTags, fTags)
 
 
 def bare_code_tag(lValues):
@@ -64,6 +64,18 @@ class New():
     def get_meta_data(self, sKey):
         return self.dMetaData[sKey]
 
+    def copy(self):
+        '''
+        Returns a copy with its own token list and meta data.
+        The token objects themselves are shared.
+        '''
+        oReturn = New.__new__(New)
+        oReturn.__dict__.update(self.__dict__)
+        if self.lTokens is not None:
+            oReturn.lTokens = self.lTokens.copy()
+        oReturn.dMetaData = self.dMetaData.copy()
+        return oReturn
+
 
 def calculate_end_index(iStartIndex, lTokens):
     try:
@@ -0,0 +1,232 @@
+
+import hashlib
+import importlib
+import marshal
+import os
+import sys
+import tempfile
+
+from vsg import parser
+from vsg import token
+from vsg import version
+
+from vsg.vhdlFile import code_tags
+
+# Increment when the layout written by encode changes
+iFormat = 1
+
+# Attributes set by parser.item.__init__ and their values after it runs
+lBaseAttributes = ['indent', 'hierarchy', 'context', 'code_tags']
+tBaseDefaults = (None, None, (), parser.no_code_tags)
+
+dClasses = {}
+dAttributeNames = {}
+sTokenModules = None
+
+
+def get_key(lFileContent):
+    '''
+    Returns the key used to store the token stream of a file.
+    The token stream only depends on the content of the file, the version of vsg and the version of python.
+    '''
+    oHash = hashlib.sha256()
+    oHash.update(version.sVersion.encode('utf-8'))
+    oHash.update(str(iFormat).encode('utf-8'))
+    oHash.update(str(sys.version_info[0:2]).encode('utf-8'))
+    for sLine in lFileContent:
+        bLine = sLine.encode('utf-8', 'surrogatepass')
+        oHash.update(str(len(bLine)).encode('utf-8') + b':' + bLine)
+    return oHash.hexdigest()
+
+
+def get_slots(cls):
+    lReturn = []
+    for oClass in cls.__mro__:
+        for sSlot in oClass.__dict__.get('__slots__', ()):
+            if sSlot not in lReturn:
+                lReturn.append(sSlot)
+    return lReturn
+
+
+def encode(lObjects):
+    '''
+    Converts a list of tokens into a compact binary form.
+    Each token is stored as an index into a table of token classes and its value.
+    Attributes which differ from the values set by parser.item.__init__ are stored separately.
+    The filename attribute is only stored as a flag, so the stream does not depend on the name of the file.
+
+    Returns: (bytes) or None if a token can not be encoded
+    '''
+    dClassIds = {}
+    lClasses = []
+    lClassIds = []
+    lValues = []
+    dAttributes = {}
+    dSlots = {}
+    for iIndex, oObject in enumerate(lObjects):
+        cls = type(oObject)
+        try:
+            iClassId = dClassIds[cls]
+        except KeyError:
+            iClassId = len(lClasses)
+            dClassIds[cls] = iClassId
+            lClasses.append((cls.__module__, cls.__qualname__))
+            dSlots[cls] = [sSlot for sSlot in get_slots(cls) if sSlot not in lBaseAttributes and sSlot not in ('value', 'filename')]
+        lClassIds.append(iClassId)
+        try:
+            lValues.append(oObject.value)
+            tBase = (oObject.indent, oObject.hierarchy, oObject.context, oObject.code_tags)
+        except AttributeError:
+            return None
+        dObject = {}
+        if tBase != tBaseDefaults:
+            for sAttribute, value, default in zip(lBaseAttributes, tBase, tBaseDefaults):
+                if value != default:
+                    dObject[sAttribute] = value
+        for sSlot in dSlots[cls]:
+            try:
+                dObject[sSlot] = getattr(oObject, sSlot)
+            except AttributeError:
+                pass
+        if oObject.filename is not None:
+            dObject['filename'] = True
+        if dObject:
+            dAttributes[iIndex] = dObject
+    try:
+        return marshal.dumps((iFormat, lClasses, lClassIds, lValues, dAttributes))
+    except ValueError:
+        return None
+
+
+def decode(bData, sFilename=None):
+    '''
+    Rebuilds the list of tokens written by encode.
+    Tokens which carried a filename are given sFilename.
+    Code tags are interned, so tokens with the same tags share one set as they do after parsing.
+
+    Returns: (list of tokens) or None if the data can not be decoded
+    '''
+    try:
+        iDataFormat, lClasses, lClassIds, lValues, dAttributes = marshal.loads(bData)
+    except (EOFError, ValueError, TypeError):
+        return None
+    if iDataFormat != iFormat:
+        return None
+    try:
+        lClassTable = [get_class(sModule, sName) for sModule, sName in lClasses]
+    except (ImportError, TypeError, ValueError):
+        return None
+    if None in lClassTable or len(lClassIds) != len(lValues):
+        return None
+
+    try:
+        return build_tokens(lClassTable, lClassIds, lValues, dAttributes, sFilename)
+    except (IndexError, KeyError, AttributeError, TypeError, ValueError):
+        return None
+
+
+def build_tokens(lClassTable, lClassIds, lValues, dAttributes, sFilename):
+    fInit = parser.item.__init__
+    lReturn = []
+    for iClassId, sValue in zip(lClassIds, lValues):
+        cls = lClassTable[iClassId]
+        oObject = cls.__new__(cls)
+        fInit(oObject, sValue)
+        lReturn.append(oObject)
+    for iIndex, dObject in dAttributes.items():
+        oObject = lReturn[iIndex]
+        sAttributeNames = get_attribute_names(type(oObject))
+        for sAttribute, value in dObject.items():
+            if sAttribute not in sAttributeNames:
+                return None
+            if sAttribute == 'filename':
+                value = sFilename
+            elif sAttribute == 'code_tags':
+                value = code_tags.intern_tags(value)
+            setattr(oObject, sAttribute, value)
+    return lReturn
+
+
+def get_token_modules():
+    '''
+    Returns the names of the modules token classes can be loaded from.
+    '''
+    global sTokenModules
+    if sTokenModules is None:
+        lModules = ['vsg.parser']
+        sTokenDirectory = os.path.dirname(token.__file__)
+        for sDirectory, lDirectories, lFileNames in os.walk(sTokenDirectory):
+            lPackage = ['vsg', 'token']
+            sRelativeDirectory = os.path.relpath(sDirectory, sTokenDirectory)
+            if sRelativeDirectory != os.curdir:
+                lPackage.extend(sRelativeDirectory.split(os.sep))
+            sPackage = '.'.join(lPackage)
+            for sFileName in lFileNames:
+                if sFileName.endswith('.py') and not sFileName.startswith('__'):
+                    lModules.append(sPackage + '.' + sFileName[:-3])
+        sTokenModules = frozenset(lModules)
+    return sTokenModules
+
+
+def get_class(sModule, sName):
+    '''
+    Returns the token class stored by encode.
+    Only subclasses of parser.item in vsg.parser and the vsg.token modules are returned,
+    so a cache entry can not import other modules or create other objects.
+
+    Returns: (token class) or None if the name is not a token class
+    '''
+    try:
+        return dClasses[(sModule, sName)]
+    except KeyError:
+        if sModule not in get_token_modules():
+            return None
+        oReturn = importlib.import_module(sModule).__dict__.get(sName)
+        if not isinstance(oReturn, type) or not issubclass(oReturn, parser.item):
+            return None
+        dClasses[(sModule, sName)] = oReturn
+        return oReturn
+
+
+def get_attribute_names(cls):
+    '''
+    Returns the attributes decode may set on a token of the class.
+    '''
+    try:
+        return dAttributeNames[cls]
+    except KeyError:
+        dAttributeNames[cls] = frozenset(get_slots(cls))
+        return dAttributeNames[cls]
+
+
+def get_path(sDirectory, sKey):
+    return os.path.join(sDirectory, 'parse', sKey[0:2], sKey + '.tokens')
+
+
+def read(sDirectory, sKey, sFilename=None):
+    '''
+    Returns the token stream stored under the key or None if there is none.
+    '''
+    try:
+        with open(get_path(sDirectory, sKey), 'rb') as oFile:
+            return decode(oFile.read(), sFilename)
+    except OSError:
+        return None
+
+
+def write(sDirectory, sKey, lObjects):
+    '''
+    Stores the token stream under the key.
+    '''
+    bData = encode(lObjects)
+    if bData is None:
+        return
+    sPath = get_path(sDirectory, sKey)
+    try:
+        os.makedirs(os.path.dirname(sPath), exist_ok=True)
+        iHandle, sTemporaryPath = tempfile.mkstemp(dir=os.path.dirname(sPath))
+        with os.fdopen(iHandle, 'wb') as oFile:
+            oFile.write(bData)
+        os.replace(sTemporaryPath, sPath)
+    except OSError:
+        pass
@@ -0,0 +1,139 @@
+
+import contextlib
+import time
+import tracemalloc
+
+
+class parse_profile():
+    '''
+    Holds the time, number of tokens and peak memory of each stage of building a vhdlFile.
+    Memory is measured with tracemalloc, which slows some stages down far more than others.
+    Times are therefore only representative when memory is not measured.
+
+    Parameters:
+
+      sFilename : (string) (optional)
+
+      bMemory : (boolean) (optional)
+    '''
+    def __init__(self, sFilename=None, bMemory=False):
+        self.sFilename = sFilename
+        self.bMemory = bMemory
+        self.lStages = []
+        self.iBaseline = 0
+        self.bStopTracing = False
+
+    def start(self):
+        '''
+        Starts tracing memory allocations if memory is measured and they are not already traced.
+        '''
+        if not self.bMemory:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.bStopTracing = True
+        self.iBaseline = tracemalloc.get_traced_memory()[0]
+
+    def stop(self):
+        '''
+        Stops tracing memory allocations if they were started by this profile.
+        '''
+        if self.bStopTracing:
+            tracemalloc.stop()
+            self.bStopTracing = False
+
+    def add_stage(self, sName, fTime, iTokens, iPeakMemory):
+        dStage = {}
+        dStage['stage'] = sName
+        dStage['time'] = fTime
+        dStage['tokens'] = iTokens
+        if iPeakMemory is None:
+            dStage['peak_memory'] = None
+        else:
+            dStage['peak_memory'] = max(0, iPeakMemory - self.iBaseline)
+        self.lStages.append(dStage)
+
+    def get_total_time(self):
+        return sum([dStage['time'] for dStage in self.lStages])
+
+    def get_peak_memory(self):
+        if not self.bMemory:
+            return None
+        return max([dStage['peak_memory'] for dStage in self.lStages] + [0])
+
+    def get_dictionary(self):
+        dReturn = {}
+        dReturn['filename'] = self.sFilename
+        dReturn['stages'] = self.lStages
+        dReturn['time'] = self.get_total_time()
+        dReturn['peak_memory'] = self.get_peak_memory()
+        return dReturn
+
+    def get_table(self):
+        '''
+        Returns the stages as lines of text in the order they ran.
+
+        Returns: (list of strings)
+        '''
+        fTotal = self.get_total_time()
+        lReturn = []
+        lReturn.append('=' * 80)
+        lReturn.append('Parse profile: ' + str(self.sFilename))
+        lReturn.append('=' * 80)
+        lReturn.append(format_row('Stage', 'Time (s)', '%', 'Tokens', 'Peak memory (KiB)'))
+        lReturn.append('-' * 80)
+        for dStage in self.lStages:
+            lReturn.append(format_stage(dStage['stage'], dStage['time'], fTotal, dStage['tokens'], dStage['peak_memory']))
+        lReturn.append('-' * 80)
+        if self.lStages:
+            iTokens = self.lStages[-1]['tokens']
+        else:
+            iTokens = 0
+        lReturn.append(format_stage('Total', fTotal, fTotal, iTokens, self.get_peak_memory()))
+        lReturn.append('=' * 80)
+        return lReturn
+
+
+@contextlib.contextmanager
+def stage(oProfile, sName, fTokens):
+    '''
+    Times the code in the with block as one stage of the profile.
+    Nothing is measured if oProfile is None.
+
+    Parameters:
+
+      oProfile : (parse_profile object)
+
+      sName : (string)
+
+      fTokens : (function) returns the number of tokens when the stage completes
+    '''
+    if oProfile is None:
+        yield
+        return
+    if oProfile.bMemory and hasattr(tracemalloc, 'reset_peak'):
+        tracemalloc.reset_peak()
+    fStart = time.perf_counter()
+    yield
+    fTime = time.perf_counter() - fStart
+    if oProfile.bMemory:
+        iPeakMemory = tracemalloc.get_traced_memory()[1]
+    else:
+        iPeakMemory = None
+    oProfile.add_stage(sName, fTime, fTokens(), iPeakMemory)
+
+
+def format_stage(sName, fTime, fTotal, iTokens, iPeakMemory):
+    if fTotal > 0:
+        sPercent = f'{100 * fTime / fTotal:.1f}'
+    else:
+        sPercent = '0.0'
+    if iPeakMemory is None:
+        sPeakMemory = '-'
+    else:
+        sPeakMemory = f'{iPeakMemory / 1024:.1f}'
+    return format_row(sName, f'{fTime:.4f}', sPercent, iTokens, sPeakMemory)
+
+
+def format_row(sName, sTime, sPercent, sTokens, sPeakMemory):
+    return f'{sName:<35}{sTime:>10}{sPercent:>7}{sTokens:>10}{sPeakMemory:>18}'
@@ -1,4 +1,6 @@
 
+import bisect
+
 from vsg import exceptions
 from vsg import parser
 
@@ -11,6 +13,131 @@ from vsg.token import predefined_attribute
 from vsg.token.ieee.std_logic_1164 import types
 
 
+oValueCache = None
+
+
+class value_cache():
+    '''
+    Holds the lowercase value of every object in a list, along with the
+    sorted positions of each value that has been searched for.
+
+    The classifier helpers below consult the cache when they are handed the
+    list it was built for, instead of calling get_value().lower() on the
+    same objects over and over.
+    '''
+
+    def __init__(self, lObjects):
+        self.lObjects = lObjects
+        self.build()
+
+    def build(self):
+        self.iLength = len(self.lObjects)
+        self.lValues = [oObject.get_value().lower() for oObject in self.lObjects]
+        self.dPositions = {}
+
+    def get_values(self):
+        if len(self.lObjects) != self.iLength:
+            self.build()
+        return self.lValues
+
+    def get_positions(self, sValue):
+        lValues = self.get_values()
+        try:
+            return self.dPositions[sValue]
+        except KeyError:
+            lPositions = [iIndex for iIndex, sMyValue in enumerate(lValues) if sMyValue == sValue]
+            self.dPositions[sValue] = lPositions
+            return lPositions
+
+    def find_next(self, sValue, iStart, iEnd):
+        '''
+        Returns the first index between iStart and iEnd, inclusive, with the given lowercase value or None.
+        '''
+        lPositions = self.get_positions(sValue)
+        iPosition = bisect.bisect_left(lPositions, iStart)
+        if iPosition < len(lPositions) and lPositions[iPosition] <= iEnd:
+            return lPositions[iPosition]
+        return None
+
+    def insert(self, iIndex, oObject):
+        sValue = oObject.get_value().lower()
+        self.get_values().insert(iIndex, sValue)
+        self.iLength += 1
+        for lPositions in self.dPositions.values():
+            shift_positions(lPositions, iIndex, 1)
+        if sValue in self.dPositions:
+            bisect.insort(self.dPositions[sValue], iIndex)
+
+    def replace(self, iIndex, oObject):
+        lValues = self.get_values()
+        sValue = oObject.get_value().lower()
+        sOldValue = lValues[iIndex]
+        if sValue == sOldValue:
+            return
+        lValues[iIndex] = sValue
+        if sOldValue in self.dPositions:
+            self.dPositions[sOldValue].remove(iIndex)
+        if sValue in self.dPositions:
+            bisect.insort(self.dPositions[sValue], iIndex)
+
+    def pop(self, iIndex):
+        sValue = self.get_values().pop(iIndex)
+        self.iLength -= 1
+        if sValue in self.dPositions:
+            self.dPositions[sValue].remove(iIndex)
+        for lPositions in self.dPositions.values():
+            shift_positions(lPositions, iIndex, -1)
+
+
+def shift_positions(lPositions, iIndex, iDelta):
+    iPosition = bisect.bisect_left(lPositions, iIndex)
+    lPositions[iPosition:] = [iMyPosition + iDelta for iMyPosition in lPositions[iPosition:]]
+
+
+def enable_value_cache(lObjects):
+    global oValueCache
+    oValueCache = value_cache(lObjects)
+
+
+def disable_value_cache():
+    global oValueCache
+    oValueCache = None
+
+
+def get_value_cache(lObjects):
+    if oValueCache is not None and oValueCache.lObjects is lObjects:
+        return oValueCache
+    return None
+
+
+def get_lower_value(lObjects, iIndex):
+    oCache = get_value_cache(lObjects)
+    if oCache is None:
+        return lObjects[iIndex].get_value().lower()
+    return oCache.get_values()[iIndex]
+
+
+def insert_object(lObjects, iIndex, oObject):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        oCache.insert(iIndex, oObject)
+    lObjects.insert(iIndex, oObject)
+
+
+def replace_object(lObjects, iIndex, oObject):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        oCache.replace(iIndex, oObject)
+    lObjects[iIndex] = oObject
+
+
+def pop_object(lObjects, iIndex):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        oCache.pop(iIndex)
+    return lObjects.pop(iIndex)
+
+
 def assign_tokens_until(sToken, token, iToken, lObjects):
     iCurrent = iToken
     while not is_next_token(sToken, iCurrent, lObjects):
@@ -21,9 +148,9 @@ def assign_tokens_until(sToken, token, iToken, lObjects):
 def assign_next_token(token, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
     try:
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
     except TypeError:
-        lObjects[iCurrent] = token()
+        replace_object(lObjects, iCurrent, token())
     iCurrent+= 1
     return iCurrent
 
@@ -31,16 +158,16 @@ def assign_next_token(token, iToken, lObjects):
 def assign_token(lObjects, iToken, token):
     iCurrent = find_next_token(iToken, lObjects)
     try:
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
     except TypeError:
-        lObjects[iToken] = token()
+        replace_object(lObjects, iToken, token())
     return iToken + 1
 
 
 def assign_next_token_if(sToken, token, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
     if object_value_is(lObjects, iCurrent, sToken):
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
         iCurrent += 1
         return iCurrent
     return iToken
@@ -49,7 +176,7 @@ def assign_next_token_if(sToken, token, iToken, lObjects):
 def assign_next_token_if_not(sToken, token, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
     if not object_value_is(lObjects, iCurrent, sToken):
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
         iCurrent += 1
         return iCurrent
     return iToken
@@ -57,8 +184,8 @@ def assign_next_token_if_not(sToken, token, iToken, lObjects):
 
 def assign_next_token_if_not_one_of(lTokens, token, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
-    if lObjects[iCurrent].get_value().lower() not in lTokens:
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+    if get_lower_value(lObjects, iCurrent) not in lTokens:
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
         iCurrent += 1
         return iCurrent
     return iToken
@@ -67,7 +194,7 @@ def assign_next_token_if_not_one_of(lTokens, token, iToken, lObjects):
 def assign_next_token_required(sToken, token, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
     if object_value_is(lObjects, iCurrent, sToken):
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
         return iCurrent + 1
     else:
         print_error_message(sToken, token, iCurrent, lObjects)
@@ -82,11 +209,11 @@ def assign_tokens_until_matching_closing_paren(token, iToken, lObjects):
         iCounter = update_paren_counter(iCurrent, lObjects, iCounter)
         if token_is_close_parenthesis(iCurrent, lObjects) and iCounter == 0:
             return iCurrent
-        lObjects[iCurrent] = token(lObjects[iCurrent].get_value())
+        replace_object(lObjects, iCurrent, token(lObjects[iCurrent].get_value()))
 
 
 def object_value_is(lAllObjects, iToken, sString):
-    if lAllObjects[iToken].get_value().lower() == sString.lower():
+    if get_lower_value(lAllObjects, iToken) == sString.lower():
         return True
     return False
 
@@ -98,6 +225,11 @@ def is_item(lAllObjects, iToken):
 
 
 def get_range(lObjects, iStart, sEnd):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        iEnd = oCache.find_next(sEnd, iStart, len(lObjects) - 1)
+        if iEnd is not None:
+            return iStart, iEnd
     iIndex = iStart
     while lObjects[iIndex].get_value().lower() != sEnd:
         iIndex += 1
@@ -114,13 +246,13 @@ def classify_next_token(token, iToken, lObjects):
 
 def find_in_range(sValue, iToken, sEnd, lObjects):
     iStart, iEnd = get_range(lObjects, iToken, sEnd)
-    for iIndex in range(iStart, iEnd + 1):
-        if object_value_is(lObjects, iIndex, sValue):
-            return True
-    return False
+    return find_in_index_range(sValue, iStart, iEnd, lObjects)
 
 
 def find_in_index_range(sValue, iStart, iEnd, lObjects):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        return oCache.find_next(sValue.lower(), iStart, iEnd) is not None
     for iIndex in range(iStart, iEnd + 1):
         if object_value_is(lObjects, iIndex, sValue):
             return True
@@ -207,6 +339,12 @@ def find_in_next_n_tokens(sValue, iMax, iToken, lObjects):
 
 
 def find_earliest_occurance(lEnd, iToken, lObjects):
+    oCache = get_value_cache(lObjects)
+    if oCache is not None:
+        lIndexes = [oCache.find_next(sEnd, iToken, len(lObjects) - 2) for sEnd in lEnd]
+        lIndexes = [iIndex for iIndex in lIndexes if iIndex is not None]
+        if len(lIndexes) > 0:
+            return lObjects[min(lIndexes)].get_value()
     iEarliest = 9999999999999999999999999999
     for sEnd in lEnd:
         for iIndex in range(iToken, len(lObjects) - 1):
@@ -369,7 +507,7 @@ def is_next_token(sToken, iToken, lObjects):
 
 def is_next_token_one_of(lTokens, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
-    if lObjects[iCurrent].get_value().lower() in lTokens:
+    if get_lower_value(lObjects, iCurrent) in lTokens:
         return True
     return False
 
@@ -444,7 +582,7 @@ def keyword_found(sKeyword, iToken, lObjects):
 
 def is_next_token_in_list(lUntils, iToken, lObjects):
     iCurrent = find_next_token(iToken, lObjects)
-    if lObjects[iCurrent].get_value().lower() in lUntils:
+    if get_lower_value(lObjects, iCurrent) in lUntils:
         return True
     return False
 
@@ -736,9 +874,9 @@ def is_token_at_end_of_line(iToken, lTokens):
 
 
 def find_next_token_with_value(iToken, sValue, lTokens):
-    for iIndex, oToken in enumerate(lTokens[iToken::]):
-        if oToken.get_value() == sValue:
-            return iToken + iIndex
+    for iIndex in range(iToken, len(lTokens)):
+        if lTokens[iIndex].get_value() == sValue:
+            return iIndex
     return None
 
 
@@ -838,8 +976,9 @@ def exponent_detected(lObjects, iCurrent):
 def classify_predefined_types(lObjects, iCurrent):
     if not isinstance(lObjects[iCurrent], parser.todo):
         return
-    if lObjects[iCurrent].get_value().lower() in predefined_attribute.values:
-        if lObjects[iCurrent].get_value().lower() == 'event':
-            assign_token(lObjects, iCurrent, predefined_attribute.event_keyword)
+    sValue = lObjects[iCurrent].get_value()
+    if sValue.lower() in predefined_attribute.values:
+        if sValue.lower() == 'event':
+            replace_object(lObjects, iCurrent, predefined_attribute.event_keyword(sValue))
         else:
-            assign_token(lObjects, iCurrent, predefined_attribute.keyword)
+            replace_object(lObjects, iCurrent, predefined_attribute.keyword(sValue))
@@ -1,3 +1,4 @@
+import functools
 
 from vsg import parser
 from vsg import token
@@ -22,6 +23,8 @@ from vsg.token.ieee.std_logic_1164 import types
 from vsg.token.ieee.std_logic_1164 import function
 
 from vsg.vhdlFile import extract
+from vsg.vhdlFile import parse_cache
+from vsg.vhdlFile import parse_profile
 from vsg.vhdlFile import utils
 
 from vsg.vhdlFile.classify import blank
@@ -38,6 +41,50 @@ from vsg.token_map import process_tokens
 from vsg.vhdlFile import code_tags
 
 
+def cached_extraction(fExtract):
+    '''
+    Memoizes an extraction method of vhdlFile on its name and arguments.
+    Results are kept until the file is modified and callers receive copies of the cached results.
+    '''
+    sName = fExtract.__name__
+
+    @functools.wraps(fExtract)
+    def wrapper(self, *args, **kwargs):
+        self.iExtractions += 1
+        try:
+            tKey = (sName, build_query_key(args), build_query_key(kwargs))
+            lResults = self.dQueryCache[tKey]
+        except TypeError:
+            return fExtract(self, *args, **kwargs)
+        except KeyError:
+            self.iQueryMisses += 1
+            lResults = fExtract(self, *args, **kwargs)
+            self.dQueryCache[tKey] = lResults
+            return copy_query_results(lResults)
+        self.iQueryHits += 1
+        return copy_query_results(lResults)
+
+    return wrapper
+
+
+def build_query_key(value):
+    if isinstance(value, (list, tuple)):
+        return tuple([build_query_key(item) for item in value])
+    if isinstance(value, dict):
+        return tuple([(key, build_query_key(value[key])) for key in sorted(value)])
+    return (type(value), value)
+
+
+def copy_query_results(lResults):
+    lReturn = []
+    for oResult in lResults:
+        if isinstance(oResult, extract.tokens.New):
+            lReturn.append(oResult.copy())
+        else:
+            lReturn.append(oResult)
+    return lReturn
+
+
 class vhdlFile():
     '''
     Holds contents of a VHDL file.
@@ -49,11 +96,24 @@ class vhdlFile():
 
        filecontent: (list)
 
+       sFilename: (string) (optional)
+
+       eError: (exception) (optional)
+
+       sCacheDirectory: (string) (optional)
+          Directory where classified token streams are stored and reused.
+
+       bProfile: (boolean) (optional)
+          Records the time and number of tokens of each stage in oParseProfile.
+
+       bProfileMemory: (boolean) (optional)
+          Also records the peak memory of each stage in oParseProfile.
+
     Returns:
 
        fileobject
     '''
-    def __init__(self, filecontent, sFilename=None, eError=None):
+    def __init__(self, filecontent, sFilename=None, eError=None, sCacheDirectory=None, bProfile=False, bProfileMemory=False):
         self.filecontent = filecontent
         self.hasArchitecture = False
         self.hasEntity = False
@@ -65,58 +125,117 @@ class vhdlFile():
         self.dVars = {}
         self.dVars['pragma'] = False
         self.eError = eError
-        self._processFile()
+        self.dQueryCache = {}
+        self.iQueryHits = 0
+        self.iQueryMisses = 0
+        self.iExtractions = 0
+        self.iTokenMapUpdates = 0
+        self.iFixes = 0
+        self.sCacheDirectory = sCacheDirectory
+        if bProfile or bProfileMemory:
+            self.oParseProfile = parse_profile.parse_profile(sFilename, bProfileMemory)
+            self.oParseProfile.start()
+            try:
+                self._processFile()
+            finally:
+                self.oParseProfile.stop()
+        else:
+            self.oParseProfile = None
+            self._processFile()
 
     def _processFile(self):
 
-        oOptions = options()
-        self.lAllObjects = []
-        for sLine in self.filecontent:
-            lTokens = tokens.create(sLine.rstrip('\n').rstrip('\r'))
-            lObjects = []
-            for sToken in lTokens:
-                lObjects.append(parser.item(sToken))
-
-            blank.classify(lObjects, oOptions)
-            whitespace.classify(lTokens, lObjects)
-            comment.classify(lTokens, lObjects, oOptions)
-            preprocessor.classify(lTokens, lObjects)
-            pragma.classify(lTokens, lObjects, self.lOpenPragmas, self.lClosePragmas, self.dVars)
-
-            self.lAllObjects.extend(lObjects)
-            self.lAllObjects.append(parser.carriage_return())
+        if self.sCacheDirectory:
+            lObjects = None
+            with self.profile_stage('parse_cache.read', lambda: len(lObjects or [])):
+                sKey = parse_cache.get_key(self.filecontent)
+                lObjects = parse_cache.read(self.sCacheDirectory, sKey, self.filename)
+            if lObjects is None:
+                self._classifyFile()
+                with self.profile_stage('parse_cache.write'):
+                    parse_cache.write(self.sCacheDirectory, sKey, self.lAllObjects)
+            else:
+                self.lAllObjects = lObjects
+        else:
+            self._classifyFile()
 
-        try:
-            self.lAllObjects[0].set_filename(self.filename)
-        except IndexError:
-            pass
+        with self.profile_stage('process_tokens'):
+            self.oTokenMap = process_tokens(self.lAllObjects)
 
-        design_file.tokenize(self.lAllObjects)
-        post_token_assignments(self.lAllObjects)
-        self.lAllObjects = combine_use_clause_selected_name(self.lAllObjects)
+    def _classifyFile(self):
 
-        set_token_hierarchy_value(self.lAllObjects)
-        set_aggregate_tokens(self.lAllObjects)
-        self.oTokenMap = process_tokens(self.lAllObjects)
+        oOptions = options()
+        self.lAllObjects = []
+        llTokens = []
+        with self.profile_stage('lex', lambda: sum([len(lTokens) for lTokens in llTokens])):
+            for sLine in self.filecontent:
+                llTokens.append(tokens.create(sLine.rstrip('\n').rstrip('\r')))
+
+        with self.profile_stage('classify'):
+            for lTokens in llTokens:
+                if line_requires_classification_passes(lTokens, oOptions):
+                    self.lAllObjects.extend(classify_line(lTokens, oOptions, self.lOpenPragmas, self.lClosePragmas, self.dVars))
+                else:
+                    classify_line_tokens(lTokens, self.lAllObjects, self.lOpenPragmas, self.lClosePragmas, self.dVars)
+                self.lAllObjects.append(parser.carriage_return())
+
+            try:
+                self.lAllObjects[0].set_filename(self.filename)
+            except IndexError:
+                pass
+
+        with self.profile_stage('design_file.tokenize'):
+            design_file.tokenize(self.lAllObjects)
+        with self.profile_stage('post_token_assignments'):
+            post_token_assignments(self.lAllObjects)
+        with self.profile_stage('combine_use_clause_selected_name'):
+            self.lAllObjects = combine_use_clause_selected_name(self.lAllObjects)
+
+        with self.profile_stage('set_token_hierarchy_value'):
+            set_token_hierarchy_value(self.lAllObjects)
+        with self.profile_stage('set_aggregate_tokens'):
+            set_aggregate_tokens(self.lAllObjects)
+
+    def profile_stage(self, sName, fTokens=None):
+        '''
+        Returns a context manager which records a stage in oParseProfile.
+        The number of tokens defaults to the number of objects in the file when the stage completes.
+        '''
+        if fTokens is None:
+            fTokens = self.get_object_count
+        return parse_profile.stage(self.oParseProfile, sName, fTokens)
+
+    def get_object_count(self):
+        return len(self.lAllObjects)
 
     def update(self, lUpdates):
 
         if len(lUpdates) == 0:
             return
-        bUpdateMap = True
+        self.clear_query_cache()
+        self.iTokenMapUpdates += 1
+        self.iFixes += len(lUpdates)
         for oUpdate in lUpdates[::-1]:
             iStart = oUpdate.oTokens.iStartIndex
             lTokens = oUpdate.get_tokens()
             iEnd = oUpdate.oTokens.iEndIndex
             lMyTokens = remove_beginning_of_file_tokens(lTokens)
             self.lAllObjects[iStart:iEnd] = lMyTokens
-        if bUpdateMap:
-            self.oTokenMap = process_tokens(self.lAllObjects)
+            self.oTokenMap.update(iStart, iEnd, lMyTokens)
 
     def update_token_map(self):
+        self.clear_query_cache()
+        self.iTokenMapUpdates += 1
         self.oTokenMap = process_tokens(self.lAllObjects)
 
+    def clear_query_cache(self):
+        self.dQueryCache = {}
+
+    def get_query_cache_statistics(self):
+        return {'hits': self.iQueryHits, 'misses': self.iQueryMisses, 'entries': len(self.dQueryCache)}
+
     def set_indent_map(self, dIndentMap):
+        self.clear_query_cache()
         self.dIndentMap = dIndentMap
         set_token_indent(self.dIndentMap, self.lAllObjects)
 
@@ -140,16 +259,20 @@ class vhdlFile():
     def get_line_count(self):
         return utils.count_carriage_returns(self.lAllObjects)
 
+    @cached_extraction
     def get_line_count_between_tokens(self, oStart, oEnd):
         return extract.get_line_count_between_tokens(oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
     def fix_blank_lines(self):
+        self.clear_query_cache()
         self.lAllObjects = utils.fix_blank_lines(self.lAllObjects)
 
     def fix_trailing_whitespace(self):
+        self.clear_query_cache()
         self.lAllObjects = utils.fix_trailing_whitespace(self.lAllObjects)
 
     def set_token_indent(self):
+        self.clear_query_cache()
         set_token_indent(self.dIndentMap, self.lAllObjects)
 
     def get_line_preceeding_line(self, iLine, iNumLines=1):
@@ -161,144 +284,189 @@ class vhdlFile():
     def get_all_tokens(self):
         return extract.get_all_tokens(self.lAllObjects)
 
+    @cached_extraction
     def get_sequence_of_tokens_matching(self, lTokens, bIgnoreIfLineStart=False):
         return extract.get_sequence_of_tokens_matching(lTokens, self.lAllObjects, self.oTokenMap, bIgnoreIfLineStart)
 
+    @cached_extraction
     def get_sequence_of_tokens_matching_bounded_by_tokens(self, lTokens, oStart, oEnd):
         return extract.get_sequence_of_tokens_matching_bounded_by_tokens(lTokens, oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_matching(self, lTokens):
         return extract.get_tokens_matching(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_matching_not_at_beginning_or_ending_of_line(self, lTokens):
         return extract.get_tokens_matching_not_at_beginning_or_ending_of_line(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_n_token_after_tokens(self, iToken, lTokens):
         return extract.get_n_token_after_tokens(iToken, lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_n_tokens_before_token(self, iN, lTokens):
         return extract.get_m_tokens_before_and_n_tokens_after_token(iN, 0, lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_n_tokens_after_token(self, iN, lTokens):
         return extract.get_m_tokens_before_and_n_tokens_after_token(0, iN, lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_m_tokens_before_and_n_tokens_after_token(self, iM, iN, lTokens):
         return extract.get_m_tokens_before_and_n_tokens_after_token(iM, iN, lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_n_token_after_tokens_between_tokens(self, iToken, lTokens, oStart, oEnd):
         return extract.get_n_token_after_tokens_between_tokens(iToken, lTokens, oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_matching_in_range_bounded_by_tokens(self, lTokens, oStart, oEnd):
         return extract.get_tokens_matching_in_range_bounded_by_tokens(lTokens, oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_bounded_by(self, oLeft, oRight, include_trailing_whitespace=False, bExcludeLastToken=False, bIncludeTillEndOfLine=False, bIncludeTillBeginningOfLine=False):
         return extract.get_tokens_bounded_by(oLeft, oRight, self.lAllObjects, self.oTokenMap, include_trailing_whitespace=include_trailing_whitespace, bExcludeLastToken=bExcludeLastToken, bIncludeTillEndOfLine=bIncludeTillEndOfLine, bIncludeTillBeginningOfLine=bIncludeTillBeginningOfLine)
 
+    @cached_extraction
     def get_tokens_bounded_by_token_when_between_tokens(self, oLeft, oRight, oStart, oEnd, include_trailing_whitespace=False):
         return extract.get_tokens_bounded_by_token_when_between_tokens(oLeft, oRight, oStart, oEnd, self.lAllObjects, self.oTokenMap, include_trailing_whitespace)
 
+    @cached_extraction
     def get_tokens_bounded_by_tokens_if_token_is_between_them(self, oLeft, oRight, oToken):
         return extract.get_tokens_bounded_by_tokens_if_token_is_between_them(oLeft, oRight, oToken, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_bounded_by_unless_between(self, oLeft, oRight, lUnless):
         return extract.get_tokens_bounded_by_unless_between(oLeft, oRight, lUnless, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_at_beginning_of_line_matching(self, lTokens):
         return extract.get_tokens_at_beginning_of_line_matching(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_at_beginning_of_line_matching_unless_between_tokens(self, lTokens, lUnless):
         return extract.get_tokens_at_beginning_of_line_matching_unless_between_tokens(lTokens, lUnless, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_at_beginning_of_line_matching_between_tokens(self, lTokens, oStart, oEnd, bInclusive=False):
         return extract.get_tokens_at_beginning_of_line_matching_between_tokens(lTokens, oStart, oEnd, bInclusive, self.lAllObjects, self.oTokenMap)
 
     def get_column_of_token_index(self, iToken):
         return extract.get_column_of_token_index(iToken, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_line_above_line_starting_with_token(self, lTokens, bIncludeComments):
         return extract.get_line_above_line_starting_with_token(lTokens, self.lAllObjects, self.oTokenMap, bIncludeComments)
 
+    @cached_extraction
     def get_line_above_line_starting_with_token_with_hierarchy(self, lTokens, lHierarchy, bIncludeComments):
         return extract.get_line_above_line_starting_with_token_with_hierarchy(lTokens, self.lAllObjects, lHierarchy, self.oTokenMap, bIncludeComments)
 
+    @cached_extraction
     def get_line_below_line_ending_with_token(self, lTokens):
         return extract.get_line_below_line_ending_with_token(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_line_below_line_ending_with_several_possible_tokens(self, lTokens):
         return extract.get_line_below_line_ending_with_several_possible_tokens(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_line_below_line_ending_with_token_with_hierarchy(self, lTokens, lHierarchy):
         return extract.get_line_below_line_ending_with_token_with_hierarchy(lTokens, self.lAllObjects, lHierarchy, self.oTokenMap)
 
+    @cached_extraction
     def get_line_which_includes_tokens(self, lTokens):
         return extract.get_line_which_includes_tokens(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_if_statement_conditions(self, fRemoveWhitespace=True):
         return extract.get_if_statement_conditions(self.lAllObjects, self.oTokenMap, fRemoveWhitespace)
 
+    @cached_extraction
     def get_n_tokens_before_and_after_tokens(self, iToken, lTokens):
         return extract.get_n_tokens_before_and_after_tokens(iToken, lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_n_tokens_before_and_after_tokens_bounded_by_tokens(self, iToken, lTokens, lBetween):
         return extract.get_n_tokens_before_and_after_tokens_bounded_by_tokens(iToken, lTokens, lBetween, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_sequence_of_tokens_not_matching(self, lTokens):
         return extract.get_sequence_of_tokens_not_matching(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_between_tokens_inclusive_while_storing_value_from_token(self, left_token, right_token, value_token):
         return extract.get_tokens_between_tokens_inclusive_while_storing_value_from_token(left_token, right_token, value_token, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_between_non_whitespace_token_and_token(self, right_token):
         return extract.get_tokens_between_non_whitespace_token_and_token(right_token, self.lAllObjects, self.oTokenMap)
 
     def get_tokens_from_line(self, iLineNumber):
         return extract.get_tokens_from_line(iLineNumber, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_consecutive_lines_starting_with_token(self, search_token, min_num_lines=2):
         return extract.get_consecutive_lines_starting_with_token(search_token, min_num_lines, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_consecutive_lines_starting_with_token_and_stopping_when_token_starting_line_is_found(self, search_token, stop_token):
         return extract.get_consecutive_lines_starting_with_token_and_stopping_when_token_starting_line_is_found(search_token, stop_token, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_where_line_starts_with_token_until_ending_token_is_found(self, start_token, stop_token):
         return extract.get_tokens_where_line_starts_with_token_until_ending_token_is_found(start_token, stop_token, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_token_and_n_tokens_before_it(self, oToken, iTokens):
         return extract.get_token_and_n_tokens_before_it(oToken, iTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_token_and_n_tokens_before_it_in_between_tokens(self, lTokens, iTokens, oStart, oEnd):
         return extract.get_token_and_n_tokens_before_it_in_between_tokens(lTokens, iTokens, oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_token_and_n_tokens_before_it_in_between_tokens_unless_token_is_found(self, lTokens, iTokens, oStart, oEnd, oStop):
         return extract.get_token_and_n_tokens_before_it_in_between_tokens_unless_token_is_found(lTokens, iTokens, oStart, oEnd, oStop, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_token_and_n_tokens_after_it(self, lTokens, iTokens):
         return extract.get_token_and_n_tokens_after_it(lTokens, iTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_token_and_n_tokens_after_it_when_between_tokens(self, lTokens, iTokens, oStart, oEnd):
         return extract.get_token_and_n_tokens_after_it_when_between_tokens(lTokens, iTokens, oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_blank_lines_below_line_ending_with_token(self, lTokens, lHierarhcy=None):
         return extract.get_blank_lines_below_line_ending_with_token(lTokens, lHierarhcy, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_blank_lines_below_line_ending_with_several_possible_tokens(self, lTokens):
         return extract.get_blank_lines_below_line_ending_with_several_possible_tokens(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_blank_lines_above_line_starting_with_token(self, lTokens):
         return extract.get_blank_lines_above_line_starting_with_token(lTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_blank_lines_above_line_starting_with_token_when_between_tokens(self, lTokens, lBetweenTokens):
         return extract.get_blank_lines_above_line_starting_with_token_when_between_tokens(lTokens, lBetweenTokens, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_association_elements_between_tokens(self, oStart, oEnd):
         return extract.get_association_elements_between_tokens(oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_interface_elements_between_tokens(self, oStart, oEnd, include_end_of_line_comments=False):
         return extract.get_interface_elements_between_tokens(oStart, oEnd, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_lines_with_length_that_exceed_column(self, iColumn):
         return extract.get_lines_with_length_that_exceed_column(iColumn, self.lAllObjects, self.oTokenMap)
 
+    @cached_extraction
     def get_tokens_starting_with_token_and_ending_with_one_of_possible_tokens(self, lStartTokens, lEndTokens, bIncludeStartToken=False, bIncludeEndToken=True, bEarliestDetect=False):
         return extract.get_tokens_starting_with_token_and_ending_with_one_of_possible_tokens(lStartTokens, lEndTokens, self.lAllObjects, self.oTokenMap, bIncludeStartToken, bIncludeEndToken, bEarliestDetect)
 
@@ -312,10 +480,80 @@ class vhdlFile():
                 return oToken.get_indent()
         return 0
 
+    @cached_extraction
     def get_tokens_in_declarative_parts(self):
         return extract.get_tokens_in_declarative_parts(self.lAllObjects, self.oTokenMap)
 
 
+def classify_line(lTokens, oOptions, lOpenPragmas, lClosePragmas, dVars):
+    '''
+    Classifies the tokens of a single line by running the blank, whitespace, comment, preprocessor and pragma classifiers in turn.
+    '''
+    lObjects = []
+    for sToken in lTokens:
+        lObjects.append(parser.item(sToken))
+
+    blank.classify(lObjects, oOptions)
+    whitespace.classify(lTokens, lObjects)
+    comment.classify(lTokens, lObjects, oOptions)
+    preprocessor.classify(lTokens, lObjects)
+    pragma.classify(lTokens, lObjects, lOpenPragmas, lClosePragmas, dVars)
+    return lObjects
+
+
+def line_requires_classification_passes(lTokens, oOptions):
+    '''
+    Returns True if the line starts inside, or opens, a delimited comment or is a preprocessor command.
+    These lines are classified with classify_line, all others with classify_line_tokens.
+    '''
+    if oOptions.inside_delimited_comment():
+        return True
+    if '/*' in lTokens:
+        return True
+    if len(lTokens) > 0 and lTokens[0].startswith('#'):
+        return True
+    if len(lTokens) > 1 and lTokens[0].startswith(' ') and lTokens[1].startswith('#'):
+        return True
+    return False
+
+
+def classify_line_tokens(lTokens, lObjects, lOpenPragmas, lClosePragmas, dVars):
+    '''
+    Classifies blank lines, whitespace, comments and pragmas in a single pass over the tokens of a line.
+    The classified tokens are appended to lObjects.
+    '''
+    if len(lTokens) == 0:
+        lObjects.append(parser.blank_line())
+        return
+
+    for sToken in lTokens:
+        if sToken.startswith('--'):
+            oToken = parser.comment(sToken)
+            if '\t' in sToken:
+                oToken.has_tab = True
+        elif whitespace.string_contains_space(sToken):
+            if whitespace.is_string_literal(sToken) or whitespace.is_character_literal(sToken):
+                oToken = parser.item(sToken)
+            else:
+                oToken = parser.whitespace(sToken)
+                if '\t' in sToken:
+                    oToken.has_tab = True
+        elif '\t' in sToken:
+            oToken = parser.whitespace(sToken)
+            oToken.has_tab = True
+        else:
+            oToken = parser.item(sToken)
+
+        if sToken in lOpenPragmas:
+            dVars['pragma'] = True
+        if dVars['pragma'] and not isinstance(oToken, parser.whitespace):
+            oToken = token.pragma.ignore(sToken)
+        if sToken in lClosePragmas:
+            dVars['pragma'] = False
+
+        lObjects.append(oToken)
+
+
 def split_on_carriage_return(lObjects):
     lReturn = []
     lMyObjects = []